@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark suite and optionally compare it with a baseline.
+Run with: python -m benchmarks --output results.json --baseline baseline.json
+
+Exits with status 1 when a case fails, when a case of the baseline is
+missing from the run, or when a case is slower than its baseline by more
+than --tolerance, so the suite can gate a CI job. Cases skipped for lack
+of a database do not fail the run.
+"""
+
+import argparse
+import sys
+
+# Importing the modules registers their cases
+import benchmarks.bench_candidate_hydration  # noqa: F401
+import benchmarks.bench_json_utils  # noqa: F401
+import benchmarks.bench_matching  # noqa: F401
+import benchmarks.bench_order_picker  # noqa: F401
+import benchmarks.bench_repository  # noqa: F401
+import benchmarks.bench_similarity  # noqa: F401
+import benchmarks.bench_statements  # noqa: F401
+from benchmarks.suite import (
+    CASES, DEFAULT_DB_SIZES, SuiteOptions, compare, load_results, missing, regressions,
+    results_document, run_cases, write_results,
+)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--cases", default=",".join(CASES),
+                        help=f"comma-separated cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--rows", type=int, default=SuiteOptions.rows,
+                        help="rows for the in-memory cases")
+    parser.add_argument("--repeat", type=int, default=SuiteOptions.repeat)
+    parser.add_argument("--db-sizes", default=",".join(str(size) for size in DEFAULT_DB_SIZES),
+                        help="comma-separated dataset sizes for the database cases")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown against the baseline (0.2 = 20%%)")
+    return parser.parse_args()
+
+def main() -> int:
+    args = parse_args()
+    names = [name for name in args.cases.split(",") if name]
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        print(f"Unknown cases: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    options = SuiteOptions(rows=args.rows, repeat=args.repeat,
+                           db_sizes=[int(size) for size in args.db_sizes.split(",") if size])
+    results = run_cases(names, options, log=lambda line: print(line, file=sys.stderr))
+
+    for result in results:
+        if result.failed:
+            print(f"{result.name:55} FAILED: {result.failed}")
+        elif result.skipped:
+            print(f"{result.name:55} skipped: {result.skipped}")
+        else:
+            print(f"{result.name:55} {result.seconds:9.4f}s  {result.per_second:14,.0f} ops/s")
+
+    if args.output:
+        write_results(args.output, results_document(results, options))
+
+    status = 0
+    failures = [result for result in results if result.failed]
+    if failures:
+        print(f"\n{len(failures)} case(s) failed", file=sys.stderr)
+        status = 1
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        comparisons = compare(results, baseline)
+        print()
+        for comparison in comparisons:
+            print(f"{comparison.name:55} {comparison.ratio:6.2f}x baseline")
+        absent = missing(results, baseline, names)
+        if absent:
+            print(f"\n{len(absent)} baseline case(s) missing from this run: {', '.join(absent)}",
+                  file=sys.stderr)
+            status = 1
+        slower = regressions(comparisons, args.tolerance)
+        if slower:
+            print(f"\n{len(slower)} case(s) regressed by more than {args.tolerance:.0%}", file=sys.stderr)
+            status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
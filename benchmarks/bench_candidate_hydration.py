@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark comparing validated and trusted candidate hydration.
+Run with: python -m benchmarks.bench_candidate_hydration --rows 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.suite import case, from_timings
+from src.database.seed_candidates import generate_random_candidates
+from src.resume.models import Candidate
+from src.resume.repository.candidate_queries import construct_candidate, hydrate_candidates
+from src.resume.utils.json_utils import model_to_dict
+
+PROJECTED_FIELDS = ("id", "full_name", "email")
+
+def best_of(repeat, func):
+    """Return the fastest of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def run(rows: int, repeat: int) -> dict:
+    # The same shape the repository reads back from the JSONB column
+    payloads = [model_to_dict(candidate) for candidate in generate_random_candidates(rows)]
+    projections = [{field: payload[field] for field in PROJECTED_FIELDS} for payload in payloads]
+
+    return {
+        "model_validate per row": best_of(repeat, lambda: [Candidate.model_validate(p) for p in payloads]),
+        "TypeAdapter list validation": best_of(repeat, lambda: hydrate_candidates(payloads)),
+        "trusted model_construct": best_of(repeat, lambda: hydrate_candidates(payloads, trusted=True)),
+        "trusted projection (3 fields)": best_of(repeat, lambda: [construct_candidate(p) for p in projections]),
+    }
+
+@case("hydration")
+def suite_case(options):
+    return from_timings("hydration", run(options.rows, options.repeat), options.rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare validated and trusted candidate hydration.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat)
+    baseline = results["model_validate per row"]
+    for name, seconds in results.items():
+        print(f"{name:32} {seconds:8.3f}s  {args.rows / seconds:12,.0f} rows/s  {baseline / seconds:6.1f}x")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the json_utils serialization paths.
+Run with: python -m benchmarks.bench_json_utils --rows 100000
+"""
+
+import argparse
+import json
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.suite import case, from_timings
+from src.database.seed_candidates import generate_random_candidates
+from src.resume.models import Candidate
+from src.resume.utils.json_utils import (
+    JsonEncoder, dict_to_model, dicts_to_models, dumps, loads, model_to_dict, models_to_dicts
+)
+
+def run(rows: int, repeat: int) -> dict:
+    candidates = list(generate_random_candidates(rows))
+    payloads = models_to_dicts(candidates)
+
+    # The fast paths must not change what gets stored
+    assert payloads == [model_to_dict(candidate) for candidate in candidates]
+    assert dumps(candidates) == json.dumps(candidates, cls=JsonEncoder)
+
+    return {
+        "model_to_dict per model": best_of(repeat, lambda: [model_to_dict(c) for c in candidates]),
+        "models_to_dicts": best_of(repeat, lambda: models_to_dicts(candidates)),
+        "dict_to_model per dict": best_of(repeat, lambda: [dict_to_model(p, Candidate) for p in payloads]),
+        "dicts_to_models": best_of(repeat, lambda: dicts_to_models(payloads, Candidate)),
+        "json.dumps(cls=JsonEncoder)": best_of(repeat, lambda: json.dumps(candidates, cls=JsonEncoder)),
+        "dumps": best_of(repeat, lambda: dumps(candidates)),
+        "dumps + loads round trip": best_of(repeat, lambda: dicts_to_models(loads(dumps(candidates)), Candidate)),
+    }
+
+@case("json_utils")
+def suite_case(options):
+    return from_timings("json_utils", run(options.rows, options.repeat), options.rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-object and bulk JSON serialization.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, seconds in run(args.rows, args.repeat).items():
+        print(f"{name:30} {seconds:8.3f}s  {args.rows / seconds:12,.0f} rows/s")
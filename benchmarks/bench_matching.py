@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+MatchingService index build and job ranking.
+Run with: python -m benchmarks.bench_matching --rows 100000 --jobs 100
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.suite import CaseResult, case
+from src.database.seed_candidates import JOB_TYPES, SKILLS_POOL, generate_random_candidates
+from src.resume.models import Job
+from src.resume.services.batch_matching import BatchMatcher
+from src.resume.services.matching_service import CandidateSkillIndex
+
+def generate_jobs(count: int, seed: int = 42) -> List[Job]:
+    rng = random.Random(seed)
+    return [
+        Job(title="Engineer", company="Acme", location="Remote",
+            required_skills=rng.sample(SKILLS_POOL, rng.randint(2, 5)),
+            min_experience=rng.randint(0, 8), job_type=rng.choice(JOB_TYPES))
+        for _ in range(count)
+    ]
+
+def run(rows: int, jobs: int, repeat: int) -> List[CaseResult]:
+    candidates = list(generate_random_candidates(rows))
+    job_list = generate_jobs(jobs)
+
+    def build():
+        index = CandidateSkillIndex()
+        index.add_many(candidates)
+        return index
+
+    build_seconds = best_of(repeat, build)
+    index = build()
+
+    def rank_all():
+        for job in job_list:
+            index.top_k(job, 10)
+
+    started = time.perf_counter()
+    list(BatchMatcher(index).match(job_list, k=10))
+    batch_seconds = time.perf_counter() - started
+
+    return [
+        CaseResult("matching.index add_many", build_seconds, rows),
+        CaseResult(f"matching.top_k over {rows}", best_of(repeat, rank_all), jobs),
+        CaseResult(f"matching.BatchMatcher over {rows}", batch_seconds, jobs),
+    ]
+
+@case("matching")
+def suite_case(options):
+    return run(options.rows, 100, options.repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time candidate matching.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run(args.rows, args.jobs, args.repeat):
+        print(f"{result.name:40} {result.seconds:8.4f}s  {result.per_second:12,.0f} ops/s")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+OrderPicker and BoxCatalog at scale.
+Run with: python -m benchmarks.bench_order_picker --rows 1000000
+"""
+
+import argparse
+import random
+from typing import List
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.suite import CaseResult, case
+from src.exercises.box import Box
+from src.exercises.box_catalog import BoxCatalog
+from src.exercises.order_picker import OrderPicker
+
+MATERIALS = ["Cardboard", "cardboard", "Plastic", "Wood", "Metal"]
+
+CATALOG_QUERIES = 1000
+CATALOG_UPDATES = 100
+
+def generate_boxes(count: int, seed: int = 42) -> List[Box]:
+    rng = random.Random(seed)
+    return [
+        Box(length=rng.uniform(5, 50), width=rng.uniform(5, 50), height=rng.uniform(5, 50),
+            weight=rng.uniform(0.1, 30), material=rng.choice(MATERIALS),
+            name=f"Box {number}", number=number)
+        for number in range(count)
+    ]
+
+def run(rows: int, repeat: int) -> List[CaseResult]:
+    boxes = generate_boxes(rows)
+    catalog = BoxCatalog(boxes)
+    catalog.lightest("cardboard", 1)  # builds the cardboard index
+
+    def insert_and_remove():
+        for box in boxes[:CATALOG_UPDATES]:
+            catalog.remove(catalog.add(box))
+
+    def lightest():
+        for _ in range(CATALOG_QUERIES):
+            catalog.lightest("cardboard", 10)
+
+    def ranges():
+        for _ in range(CATALOG_QUERIES):
+            catalog.find("cardboard", min_weight=10, max_weight=12, max_volume=20000)
+
+    # Whole-list results count boxes, catalog queries and updates count calls
+    return [
+        CaseResult("order_picker.filter_and_sort_boxes",
+                   best_of(repeat, lambda: OrderPicker.filter_and_sort_boxes(boxes)), rows),
+        CaseResult("order_picker.filter_and_sort_boxes_pythonic",
+                   best_of(repeat, lambda: OrderPicker.filter_and_sort_boxes_pythonic(boxes)), rows),
+        CaseResult("order_picker.catalog build", best_of(repeat, lambda: BoxCatalog(boxes)), rows),
+        CaseResult("order_picker.filter_and_sort_boxes(catalog)",
+                   best_of(repeat, lambda: OrderPicker.filter_and_sort_boxes(catalog)), rows),
+        CaseResult("order_picker.catalog lightest 10", best_of(repeat, lightest), CATALOG_QUERIES),
+        CaseResult("order_picker.catalog weight+volume range", best_of(repeat, ranges), CATALOG_QUERIES),
+        CaseResult("order_picker.catalog add+remove", best_of(repeat, insert_and_remove), CATALOG_UPDATES),
+    ]
+
+@case("order_picker")
+def suite_case(options):
+    return run(options.rows, options.repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time OrderPicker on many boxes.")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run(args.rows, args.repeat):
+        print(f"{result.name:50} {result.seconds:8.4f}s  {result.per_second:14,.0f} ops/s")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+CandidateRepository benchmarks against a local PostgreSQL.
+Run with: python -m benchmarks.bench_repository --sizes 10000,100000
+
+Every dataset is loaded into a TEMP table called `candidates`, created LIKE
+the real table (same generated columns and indexes). pg_temp comes first
+in the search_path, so the repository transparently uses it for this
+connection only and the real data is never read or modified.
+"""
+
+import argparse
+import io
+import random
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.bench_statements import rebuilt_find_by_id
+from benchmarks.suite import CaseResult, DEFAULT_DB_SIZES, case, skipped
+from src.database.candidate_loader import format_copy_rows
+from src.database.database import get_engine
+from src.database.seed_candidates import generate_random_candidates
+from src.resume.repository.candidate_queries import hydrate_rows
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.utils.batching import chunked
+
+LOAD_BATCH_SIZE = 10000
+
+# Single-row saves are slow, so fewer of them are timed
+SAVE_ROWS = 500
+SAVE_MANY_ROWS = 10000
+
+LOOKUPS = 200
+BATCH_LOOKUP_SIZE = 1000
+PAGE_SIZE = 50
+
+SAMPLE_IDS_SQL = text("SELECT id FROM candidates ORDER BY random() LIMIT :n")
+
+@contextmanager
+def scratch_candidates(rows: int) -> Iterator[Session]:
+    """A session whose `candidates` table is a private, freshly loaded copy."""
+    connection = get_engine().connect()
+    try:
+        connection.exec_driver_sql(
+            "CREATE TEMP TABLE candidates (LIKE public.candidates INCLUDING ALL)")
+        cursor = connection.connection.cursor()
+        try:
+            for batch in chunked(generate_random_candidates(rows), LOAD_BATCH_SIZE):
+                cursor.copy_expert("COPY candidates (id, data, embedding) FROM STDIN",
+                                   io.StringIO(format_copy_rows(batch)))
+        finally:
+            cursor.close()
+        connection.exec_driver_sql("ANALYZE candidates")
+        # Commit so the repositories' own commits are real ones
+        connection.commit()
+        with Session(bind=connection) as session:
+            yield session
+    finally:
+        connection.rollback()
+        connection.exec_driver_sql("DROP TABLE IF EXISTS pg_temp.candidates")
+        connection.commit()
+        connection.close()
+
+def database_available() -> bool:
+    try:
+        with get_engine().connect():
+            return True
+    except OperationalError:
+        return False
+
+def finder_results(rows: int, repeat: int) -> List[CaseResult]:
+    prefix = f"repository.{rows}"
+    with scratch_candidates(rows) as session:
+        repository = CandidateRepository(session)
+        trusted = CandidateRepository(session, trusted_reads=True)
+        prepared = CandidateRepository(session, trusted_reads=True, prepared=True)
+        ids = [row[0] for row in session.execute(SAMPLE_IDS_SQL, {"n": max(LOOKUPS, BATCH_LOOKUP_SIZE)})]
+        lookup_ids = random.sample(ids, min(LOOKUPS, len(ids)))
+
+        def lookups(repository=repository):
+            for id in lookup_ids:
+                repository.find_by_id(id)
+
+        def rebuilt_lookups():
+            # What find_by_id executed before its statement was cached
+            for id in lookup_ids:
+                hydrate_rows([session.execute(rebuilt_find_by_id(id)).first()], None, trusted=True)
+
+        def follow_pages(pages: int) -> int:
+            after = None
+            for followed in range(1, pages + 1):
+                page = repository.find_by_skills(["Python"], limit=PAGE_SIZE, after=after)
+                if not page.has_more:
+                    break
+                after = page.next_cursor
+            return followed
+
+        streamed = sum(1 for _ in trusted.iter_by_skills(["Python"]))
+        pages = follow_pages(20)
+        results = [
+            CaseResult(f"{prefix}.find_by_id", best_of(repeat, lookups), len(lookup_ids)),
+            CaseResult(f"{prefix}.find_by_id trusted", best_of(repeat, lambda: lookups(trusted)),
+                       len(lookup_ids)),
+            CaseResult(f"{prefix}.find_by_id trusted rebuilt", best_of(repeat, rebuilt_lookups),
+                       len(lookup_ids)),
+            CaseResult(f"{prefix}.find_by_id trusted prepared", best_of(repeat, lambda: lookups(prepared)),
+                       len(lookup_ids)),
+            CaseResult(f"{prefix}.find_by_ids({BATCH_LOOKUP_SIZE})",
+                       best_of(repeat, lambda: repository.find_by_ids(ids[:BATCH_LOOKUP_SIZE])),
+                       BATCH_LOOKUP_SIZE),
+            CaseResult(f"{prefix}.find_by_ids({BATCH_LOOKUP_SIZE}) trusted",
+                       best_of(repeat, lambda: trusted.find_by_ids(ids[:BATCH_LOOKUP_SIZE])),
+                       BATCH_LOOKUP_SIZE),
+            CaseResult(f"{prefix}.find_by_ids({BATCH_LOOKUP_SIZE}) trusted prepared",
+                       best_of(repeat, lambda: prepared.find_by_ids(ids[:BATCH_LOOKUP_SIZE])),
+                       BATCH_LOOKUP_SIZE),
+            CaseResult(f"{prefix}.find_by_name_or_email page",
+                       best_of(repeat, lambda: repository.find_by_name_or_email("smith", limit=PAGE_SIZE)),
+                       1),
+            CaseResult(f"{prefix}.find_by_skills page",
+                       best_of(repeat, lambda: repository.find_by_skills(["Python", "SQL"], limit=PAGE_SIZE)),
+                       1),
+            CaseResult(f"{prefix}.find_by_skills {pages} pages", best_of(repeat, lambda: follow_pages(pages)),
+                       pages),
+            CaseResult(f"{prefix}.iter_by_skills trusted",
+                       best_of(repeat, lambda: sum(1 for _ in trusted.iter_by_skills(["Python"]))),
+                       streamed),
+            CaseResult(f"{prefix}.iter_all projection",
+                       best_of(repeat, lambda: sum(1 for _ in repository.iter_all(fields=["skills"]))),
+                       rows),
+        ]
+        session.rollback()
+        return results
+
+def write_results(repeat: int) -> List[CaseResult]:
+    """Single-row save versus batched save_many on an empty table."""
+    with scratch_candidates(0) as session:
+        repository = CandidateRepository(session)
+        singles = list(generate_random_candidates(SAVE_ROWS))
+        bulk = list(generate_random_candidates(SAVE_MANY_ROWS))
+
+        def save_each():
+            for candidate in singles:
+                repository.save(candidate)
+
+        # Upserts hit existing rows after the first run; that is the update path
+        return [
+            CaseResult("repository.save", best_of(repeat, save_each), SAVE_ROWS),
+            CaseResult("repository.save_many", best_of(repeat, lambda: repository.save_many(bulk)),
+                       SAVE_MANY_ROWS),
+        ]
+
+def run(sizes: Sequence[int], repeat: int) -> List[CaseResult]:
+    if not database_available():
+        return [skipped("repository", "database not reachable")]
+    results = write_results(repeat)
+    for rows in sizes:
+        results.extend(finder_results(rows, repeat))
+    return results
+
+@case("repository")
+def suite_case(options):
+    return run(options.db_sizes, options.repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time repository finders and writes on PostgreSQL.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_DB_SIZES),
+                        help="comma-separated dataset sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run([int(size) for size in args.sizes.split(",")], args.repeat):
+        if result.skipped:
+            print(f"{result.name:50} skipped: {result.skipped}")
+        else:
+            print(f"{result.name:50} {result.seconds:8.4f}s  {result.per_second:12,.0f} ops/s")
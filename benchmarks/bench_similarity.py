@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Candidate embeddings and IVF similarity search.
+Run with: python -m benchmarks.bench_similarity --rows 100000 --queries 200
+"""
+
+import argparse
+import random
+from typing import List
+
+import numpy as np
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.suite import CaseResult, case
+from src.database.seed_candidates import generate_random_candidates
+from src.resume.services.similarity_index import IVFIndex
+from src.resume.utils.embedding import embed_candidates
+
+def run(rows: int, queries: int, repeat: int) -> List[CaseResult]:
+    candidates = list(generate_random_candidates(rows))
+    ids = [candidate.id for candidate in candidates]
+    vectors = embed_candidates(candidates)
+    index = IVFIndex()
+    index.add_many(ids, vectors)
+
+    sample = random.Random(42).sample(range(rows), min(queries, rows))
+
+    def search_all():
+        for row in sample:
+            index.search(vectors[row], 10, exclude={ids[row]})
+
+    def scan_all():
+        for row in sample:
+            np.argpartition(-(vectors @ vectors[row]), 10)[:11]
+
+    results = [
+        CaseResult("similarity.embed_candidates", best_of(repeat, lambda: embed_candidates(candidates)), rows),
+        CaseResult(f"similarity.brute force over {rows}", best_of(repeat, scan_all), len(sample)),
+        CaseResult("similarity.IVF train", best_of(1, index.train), rows),
+    ]
+    results.append(CaseResult(f"similarity.IVF search over {rows}", best_of(repeat, search_all), len(sample)))
+    return results
+
+@case("similarity")
+def suite_case(options):
+    return run(options.rows, 200, options.repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time candidate similarity search.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run(args.rows, args.queries, args.repeat):
+        print(f"{result.name:40} {result.seconds:8.4f}s  {result.per_second:12,.0f} ops/s")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Per-call Python cost of preparing the candidate finder statements.
+Run with: python -m benchmarks.bench_statements --calls 20000
+
+`rebuilt` constructs each statement on every call with its values inline,
+as the finders did before their statements were cached; `cached` is what
+they do now. Both include the SQLAlchemy cache key, which is generated on
+every execution and memoized on a reused statement object. No database is
+needed; bench_repository times the same finders end to end on PostgreSQL.
+"""
+
+import argparse
+from uuid import uuid4
+from sqlalchemy import literal_column, or_, select
+
+from benchmarks.bench_candidate_hydration import best_of
+from benchmarks.suite import case, from_timings
+from src.resume.repository.candidate_queries import (
+    CandidateOrder, find_by_id_statement, name_or_email_filter, page_query, skills_filter,
+)
+from src.resume.repository.db_models import CandidateRecord
+
+PAGE_SIZE = 50
+
+def rebuilt_find_by_id(id):
+    return select(CandidateRecord.data).where(CandidateRecord.id == id)
+
+def _rebuilt_page(condition, limit: int):
+    sort = (CandidateRecord.created_at, CandidateRecord.id)
+    return select(CandidateRecord.data, *sort).where(condition).order_by(
+        *(column.asc() for column in sort)).limit(limit + 1)
+
+def rebuilt_name_or_email_page(search_term: str, limit: int):
+    pattern = f"%{search_term.lower()}%"
+    return _rebuilt_page(or_(CandidateRecord.full_name_lower.like(pattern),
+                             CandidateRecord.email_lower.like(pattern)), limit)
+
+def rebuilt_skills_page(skills, limit: int):
+    return _rebuilt_page(CandidateRecord.data[literal_column("'skills'")].contains(skills), limit)
+
+def statement_pairs():
+    """(rebuilt, cached) statement factories per finder; each takes a call number."""
+    ids = [uuid4() for _ in range(100)]
+    terms = [f"smith{i}" for i in range(100)]
+    return {
+        "find_by_id": (
+            lambda i: rebuilt_find_by_id(ids[i % 100]),
+            lambda i: find_by_id_statement(ids[i % 100], None).statement,
+        ),
+        "find_by_name_or_email page": (
+            lambda i: rebuilt_name_or_email_page(terms[i % 100], PAGE_SIZE),
+            lambda i: page_query(name_or_email_filter(terms[i % 100]), PAGE_SIZE, None,
+                                 CandidateOrder.CREATED, None).statement,
+        ),
+        "find_by_skills page": (
+            lambda i: rebuilt_skills_page(["Python", terms[i % 100]], PAGE_SIZE),
+            lambda i: page_query(skills_filter(["Python", terms[i % 100]]), PAGE_SIZE, None,
+                                 CandidateOrder.CREATED, None).statement,
+        ),
+    }
+
+def run(calls: int, repeat: int) -> dict:
+    def prepare_all(make):
+        for i in range(calls):
+            make(i)._generate_cache_key()
+
+    timings = {}
+    for name, (rebuilt, cached) in statement_pairs().items():
+        timings[f"{name} rebuilt"] = best_of(repeat, lambda: prepare_all(rebuilt))
+        timings[f"{name} cached"] = best_of(repeat, lambda: prepare_all(cached))
+    return timings
+
+@case("statements")
+def suite_case(options):
+    calls = min(options.rows, 20_000)
+    return from_timings("statements", run(calls, options.repeat), calls)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time building finder statements per call.")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, seconds in run(args.calls, args.repeat).items():
+        print(f"{name:35} {seconds / args.calls * 1e6:8.1f} us/call")
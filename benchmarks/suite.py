@@ -0,0 +1,144 @@
+"""
+Benchmark registry, results and baseline comparison.
+
+Each bench_* module registers its cases with @case; `python -m benchmarks`
+runs them and writes the results as JSON so a run can be compared with a
+stored baseline.
+"""
+
+import json
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Row counts of the database datasets
+DEFAULT_DB_SIZES = (10_000, 100_000, 1_000_000)
+
+@dataclass
+class SuiteOptions:
+    rows: int = 100_000                  # rows for the in-memory cases
+    repeat: int = 3                      # runs per measurement, the fastest one counts
+    db_sizes: Sequence[int] = DEFAULT_DB_SIZES
+
+@dataclass
+class CaseResult:
+    """One measurement: `operations` units of work done in `seconds`."""
+    name: str
+    seconds: Optional[float]
+    operations: int
+    skipped: Optional[str] = None        # reason, when the case could not run (no database)
+    failed: Optional[str] = None         # error, when the case raised
+
+    @property
+    def per_second(self) -> Optional[float]:
+        if not self.seconds:
+            return None
+        return self.operations / self.seconds
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["per_second"] = self.per_second
+        return data
+
+@dataclass
+class Case:
+    name: str
+    func: Callable[[SuiteOptions], List[CaseResult]]
+
+CASES: Dict[str, Case] = {}
+
+def case(name: str):
+    """Register a function returning the CaseResults of one benchmark group."""
+    def register(func):
+        CASES[name] = Case(name, func)
+        return func
+    return register
+
+def skipped(name: str, reason: str) -> CaseResult:
+    return CaseResult(name=name, seconds=None, operations=0, skipped=reason)
+
+def failed(name: str, error: Exception) -> CaseResult:
+    return CaseResult(name=name, seconds=None, operations=0, failed=repr(error))
+
+def from_timings(prefix: str, timings: Dict[str, float], operations: int) -> List[CaseResult]:
+    """Wrap the {label: seconds} dicts returned by the standalone benchmarks."""
+    return [CaseResult(f"{prefix}.{label}", seconds, operations) for label, seconds in timings.items()]
+
+def run_cases(names: Sequence[str], options: SuiteOptions,
+              log: Callable[[str], None] = print) -> List[CaseResult]:
+    results = []
+    for name in names:
+        log(f"running {name}...")
+        started = time.perf_counter()
+        try:
+            results.extend(CASES[name].func(options))
+        except Exception as e:
+            results.append(failed(name, e))
+        log(f"  {name} done in {time.perf_counter() - started:.1f}s")
+    return results
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def results_document(results: List[CaseResult], options: SuiteOptions) -> dict:
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "options": asdict(options),
+        "results": [result.to_dict() for result in results],
+    }
+
+def write_results(path: str, document: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+def load_results(path: str) -> Dict[str, dict]:
+    """Results of a stored run, keyed by case name."""
+    with open(path, "r", encoding="utf-8") as f:
+        return {result["name"]: result for result in json.load(f)["results"]}
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_seconds: float
+    seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """Above 1.0 means slower than the baseline."""
+        return self.seconds / self.baseline_seconds
+
+def compare(results: List[CaseResult], baseline: Dict[str, dict]) -> List[Comparison]:
+    """Pair every measured result with its baseline, skipping either side's gaps."""
+    comparisons = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if result.seconds and previous and previous.get("seconds"):
+            comparisons.append(Comparison(result.name, previous["seconds"], result.seconds))
+    return comparisons
+
+def missing(results: List[CaseResult], baseline: Dict[str, dict], groups: Sequence[str]) -> List[str]:
+    """Measured baseline cases of the groups that ran which this run did not produce.
+
+    A group that was skipped or failed as a whole is reported as such, not
+    case by case.
+    """
+    produced = {result.name for result in results}
+    not_run = {result.name for result in results if result.skipped or result.failed}
+    return [
+        name for name, previous in baseline.items()
+        if previous.get("seconds") and name not in produced
+        and name.split(".", 1)[0] in groups and name.split(".", 1)[0] not in not_run
+    ]
+
+def regressions(comparisons: List[Comparison], tolerance: float) -> List[Comparison]:
+    return [c for c in comparisons if c.ratio > 1 + tolerance]
@@ -62,8 +62,9 @@ FROM candidates
 WHERE data->'skills' @> '["Python", "AWS"]';
 
 -- Count of candidates by job type preference
-SELECT data->>'preferred_job_types' AS job_type, COUNT(*) 
-FROM candidates, jsonb_array_elements(data->'preferred_job_types') AS job_type
+-- (precomputed in the candidate_job_type_counts view, see the analytics views below)
+SELECT job_type, COUNT(*)
+FROM candidates, jsonb_array_elements_text(data->'preferred_job_types') AS job_type
 GROUP BY job_type
 ORDER BY COUNT(*) DESC;
 
@@ -98,13 +99,28 @@ FROM candidates
 ORDER BY data->>'full_name'
 LIMIT 10 OFFSET 10;
 
--- Count of candidates by education level
+-- Keyset pagination (10 candidates per page)
+-- OFFSET scans and discards every skipped row, so deep pages get slower.
+-- Seeking past the sort key of the previous page's last row costs the same on every page.
+SELECT id, data, created_at
+FROM candidates
+ORDER BY created_at, id
+LIMIT 10;
+
+-- Next page: pass created_at and id of the last row of the previous page
+SELECT id, data, created_at
+FROM candidates
+WHERE (created_at, id) > ('2025-03-01 23:06:04.562441', '00000000-0000-0000-0000-000000000001')
+ORDER BY created_at, id
+LIMIT 10;
+
+-- Count of candidates by education level (precomputed in candidate_education_counts)
 SELECT data->>'education' AS education, COUNT(*) AS count
 FROM candidates
 GROUP BY data->>'education'
 ORDER BY count DESC;
 
--- Skill distribution analysis
+-- Skill distribution analysis (precomputed in candidate_skill_counts)
 SELECT skill, COUNT(*) AS count
 FROM candidates, jsonb_array_elements_text(data->'skills') AS skill
 GROUP BY skill
@@ -135,6 +151,7 @@ WHERE
     data->>'location' ILIKE '%search_term%';
 
 -- Advanced: Find candidates with skills similar to a given candidate
+-- Compares the skills of every pair of candidates: O(n^2), see the embedding query below
 WITH candidate_skills AS (
     SELECT data->'skills' AS skills
     FROM candidates
@@ -155,20 +172,105 @@ WHERE c.id != '00000000-0000-0000-0000-000000000001'  -- exclude the reference c
 ORDER BY matching_skills DESC
 LIMIT 10;
 
--- Recommendations for creating indexes:
+-- Similar candidates by profile embedding (migration e4b9d2a71c58_add_candidate_embedding).
+-- embedding is a pgvector vector(128) of hashed skill/education/location/experience
+-- features (src/resume/utils/embedding.py); <=> is the cosine distance.
+-- Without an ANN index this is one sequential scan; the application answers the same
+-- question from an in-process index (CandidateService.find_similar)
+SELECT c.id, c.data->>'full_name' AS full_name, 1 - (c.embedding <=> target.embedding) AS similarity
+FROM candidates c,
+     (SELECT embedding FROM candidates WHERE id = '00000000-0000-0000-0000-000000000001') AS target
+WHERE c.id != '00000000-0000-0000-0000-000000000001'
+ORDER BY c.embedding <=> target.embedding
+LIMIT 10;
+
+-- Typed generated columns (migration 8b4e1f6d2a90_add_candidate_generated_columns).
+-- PostgreSQL keeps them in sync with data, so filters and sorts avoid re-parsing JSONB:
+--   experience_years  = (data->>'experience_years')::int
+--   location          = data->>'location'
+--   email_lower       = lower(data->>'email')
+--   full_name_lower   = lower(data->>'full_name')
+SELECT id, data->>'full_name' AS full_name, experience_years
+FROM candidates
+WHERE experience_years >= 5 AND location = 'San Francisco, CA'
+ORDER BY experience_years DESC, id DESC
+LIMIT 10;
+
+-- Indexes (created by migrations 5f2a9d41c7e3 and 8b4e1f6d2a90):
 /*
--- Index for text search on full_name
-CREATE INDEX idx_candidate_full_name ON candidates USING gin ((data->>'full_name') gin_trgm_ops);
+-- Trigram indexes need the pg_trgm extension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Case-insensitive substring search on full_name and email: full_name_lower LIKE '%john%'
+CREATE INDEX ix_candidates_full_name_lower_trgm ON candidates USING gin (full_name_lower gin_trgm_ops);
+CREATE INDEX ix_candidates_email_lower_trgm ON candidates USING gin (email_lower gin_trgm_ops);
+
+-- Exact lookups on the lower-cased name and email
+CREATE INDEX ix_candidates_full_name_lower ON candidates (full_name_lower);
+CREATE INDEX ix_candidates_email_lower ON candidates (email_lower);
+
+-- Skill containment: data->'skills' @> '["Python", "AWS"]'
+CREATE INDEX ix_candidates_skills ON candidates USING gin ((data->'skills') jsonb_path_ops);
+
+-- Filtering by location
+CREATE INDEX ix_candidates_location ON candidates (location);
+
+-- Filtering and sorting by experience, and (experience_years, id) keyset pagination
+CREATE INDEX ix_candidates_experience_years_id ON candidates (experience_years, id);
+
+-- (created_at, id) keyset pagination
+CREATE INDEX ix_candidates_created_at_id ON candidates (created_at, id);
+*/
+
+-- Resume full-text search (migration a6c31f8d5b27_create_resumes_table).
+-- Calling to_tsvector() in the WHERE clause parses every document on every query.
+-- resumes.search_vector is a stored generated tsvector (extracted_skills weighted A,
+-- raw_text weighted B) with a GIN index, so the match is an index lookup:
+--   CREATE INDEX ix_resumes_search_vector ON resumes USING gin (search_vector);
+-- websearch_to_tsquery accepts search-box syntax: "quoted phrases", or, -excluded
+SELECT id, ts_rank(search_vector, query) AS rank
+FROM resumes, websearch_to_tsquery('english', '"machine learning" python -java') AS query
+WHERE search_vector @@ query
+ORDER BY rank DESC, id DESC
+LIMIT 20;
+
+-- Highlighted snippets: ts_headline re-parses the raw text, so run it on the page only
+SELECT page.id, page.rank,
+       ts_headline('english', page.data->>'raw_text', query, 'MaxFragments=2, MaxWords=25, MinWords=10') AS snippet
+FROM (
+    SELECT id, data, ts_rank(search_vector, query) AS rank
+    FROM resumes, websearch_to_tsquery('english', 'python') AS query
+    WHERE search_vector @@ query
+    ORDER BY rank DESC, id DESC
+    LIMIT 20
+) AS page, websearch_to_tsquery('english', 'python') AS query
+ORDER BY page.rank DESC, page.id DESC;
 
--- Index for text search on email
-CREATE INDEX idx_candidate_email ON candidates USING gin ((data->>'email') gin_trgm_ops);
+-- Next page: pass rank and id of the last row of the previous page
+SELECT id, ts_rank(search_vector, query) AS rank
+FROM resumes, websearch_to_tsquery('english', 'python') AS query
+WHERE search_vector @@ query
+  AND (ts_rank(search_vector, query), id) < (0.0607927::real, '00000000-0000-0000-0000-000000000001')
+ORDER BY rank DESC, id DESC
+LIMIT 20;
 
--- Index for searching skills
-CREATE INDEX idx_candidate_skills ON candidates USING gin ((data->'skills'));
+-- Analytics views (migration 7c2e5a9f3b61_add_candidate_analytics_views).
+-- The aggregates above scan and unnest every candidate on each call. The materialized
+-- views store their results, so a dashboard read costs the rows it returns:
+--   candidate_skill_counts (skill, candidates)
+--   candidate_job_type_counts (job_type, candidates)
+--   candidate_education_counts (education, candidates)
+--   candidate_experience_counts (experience_years, candidates)
+-- They only change when refreshed (python -m src.database.refresh_analytics);
+-- analytics_refreshes records when each view was last rebuilt.
+SELECT skill, candidates
+FROM candidate_skill_counts
+ORDER BY candidates DESC, skill
+LIMIT 20;
 
--- Index for filtering by location
-CREATE INDEX idx_candidate_location ON candidates USING gin ((data->>'location') gin_trgm_ops);
+-- How old each view is
+SELECT view_name, refreshed_at, localtimestamp - refreshed_at AS age
+FROM analytics_refreshes;
 
--- Index for sorting by experience
-CREATE INDEX idx_candidate_experience ON candidates ((data->>'experience_years')::int);
-*/ 
\ No newline at end of file
+-- Rebuild without blocking readers (needs the unique index on the view's key)
+REFRESH MATERIALIZED VIEW CONCURRENTLY candidate_skill_counts;
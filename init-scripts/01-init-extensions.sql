@@ -3,13 +3,13 @@
 
 -- Basic PostgreSQL extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";     -- For UUID generation
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";       -- For trigram indexes on LIKE/ILIKE searches
 
 -- Set timezone to UTC
 ALTER DATABASE resumedb SET timezone TO 'UTC';
 
--- Placeholder for pgvector extension
--- Uncomment this line when you're ready to use pgvector
--- CREATE EXTENSION IF NOT EXISTS "vector";
+-- pgvector, for candidate profile embeddings (installed by the Dockerfile)
+CREATE EXTENSION IF NOT EXISTS "vector";
 
 -- Comment explaining what this database is for
 COMMENT ON DATABASE resumedb IS 'Database for storing and managing resume data';
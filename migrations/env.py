@@ -6,11 +6,7 @@ from sqlalchemy import pool
 from alembic import context
 
 from src.resume.repository.db_models import Base  # Import your declarative base
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from src.database.settings import get_settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -33,13 +29,8 @@ target_metadata = Base.metadata
 # ... etc.
 
 def get_url():
-    DB_HOST = os.getenv("DB_HOST", "localhost")
-    DB_PORT = os.getenv("DB_PORT", "5432")
-    DB_NAME = os.getenv("DB_NAME", "resumedb")
-    DB_USER = os.getenv("DB_USER", "postgres")
-    DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
-    
-    return f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # Same settings (and .env handling) as the application engines
+    return get_settings().url
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -0,0 +1,58 @@
+"""create jobs table
+
+Revision ID: 3d7a2c5e9f14
+Revises: 8b4e1f6d2a90
+Create Date: 2026-10-18 14:21:06.318904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7a2c5e9f14'
+down_revision: Union[str, None] = '8b4e1f6d2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Default jsonb_ops (not jsonb_path_ops): reverse search needs the
+    # key-exists operator ?| ("requires any of these skills"), which
+    # jsonb_path_ops does not support
+    op.create_index(
+        'ix_jobs_required_skills', 'jobs',
+        [sa.text("(data -> 'required_skills')")],
+        postgresql_using='gin',
+    )
+    # Jobs without required skills never match ?|, they are found through this one
+    op.create_index(
+        'ix_jobs_required_skill_count', 'jobs',
+        [sa.text("jsonb_array_length(data -> 'required_skills')")],
+    )
+    op.create_index(
+        'ix_jobs_min_experience', 'jobs',
+        [sa.text("((data ->> 'min_experience')::int)")],
+    )
+    op.create_index(
+        'ix_jobs_job_type', 'jobs',
+        [sa.text("(data ->> 'job_type')")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_job_type', table_name='jobs')
+    op.drop_index('ix_jobs_min_experience', table_name='jobs')
+    op.drop_index('ix_jobs_required_skill_count', table_name='jobs')
+    op.drop_index('ix_jobs_required_skills', table_name='jobs')
+    op.drop_table('jobs')
@@ -0,0 +1,65 @@
+"""add candidate search indexes
+
+Revision ID: 5f2a9d41c7e3
+Revises: c138c13909fc
+Create Date: 2026-10-18 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2a9d41c7e3'
+down_revision: Union[str, None] = 'c138c13909fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm is also enabled by init-scripts, but those only run when the
+    # container volume is first created
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Skill containment (data -> 'skills' @> '["Python"]')
+    op.create_index(
+        'ix_candidates_skills', 'candidates',
+        [sa.text("(data -> 'skills') jsonb_path_ops")],
+        postgresql_using='gin',
+    )
+    # Case-insensitive substring search on name and email
+    op.create_index(
+        'ix_candidates_full_name_trgm', 'candidates',
+        [sa.text("lower(data ->> 'full_name') gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_candidates_email_trgm', 'candidates',
+        [sa.text("lower(data ->> 'email') gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_candidates_location', 'candidates',
+        [sa.text("(data ->> 'location')")],
+    )
+    # Experience filters and the (experience_years DESC, id DESC) keyset order
+    op.create_index(
+        'ix_candidates_experience_years_id', 'candidates',
+        [sa.text("((data ->> 'experience_years')::int)"), 'id'],
+    )
+    # Default (created_at, id) keyset order
+    op.create_index(
+        'ix_candidates_created_at_id', 'candidates',
+        ['created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_created_at_id', table_name='candidates')
+    op.drop_index('ix_candidates_experience_years_id', table_name='candidates')
+    op.drop_index('ix_candidates_location', table_name='candidates')
+    op.drop_index('ix_candidates_email_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_full_name_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_skills', table_name='candidates')
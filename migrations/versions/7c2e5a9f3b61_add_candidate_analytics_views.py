@@ -0,0 +1,74 @@
+"""add candidate analytics views
+
+Revision ID: 7c2e5a9f3b61
+Revises: b5f0e3c8d716
+Create Date: 2026-10-18 20:41:07.218355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5a9f3b61'
+down_revision: Union[str, None] = 'b5f0e3c8d716'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dashboard aggregates, precomputed. Each view needs a unique index without
+# a WHERE clause so it can be refreshed CONCURRENTLY (readers are not
+# blocked while it is rebuilt). A candidate listing a term twice is counted
+# once, hence the DISTINCT per candidate.
+VIEWS = {
+    'candidate_skill_counts': ("""
+        SELECT skill, count(*) AS candidates
+        FROM candidates,
+             LATERAL (SELECT DISTINCT jsonb_array_elements_text(data -> 'skills')) AS skills (skill)
+        GROUP BY skill
+    """, 'skill'),
+    'candidate_job_type_counts': ("""
+        SELECT job_type, count(*) AS candidates
+        FROM candidates,
+             LATERAL (SELECT DISTINCT jsonb_array_elements_text(data -> 'preferred_job_types')) AS job_types (job_type)
+        GROUP BY job_type
+    """, 'job_type'),
+    'candidate_education_counts': ("""
+        SELECT data ->> 'education' AS education, count(*) AS candidates
+        FROM candidates
+        WHERE data ->> 'education' IS NOT NULL
+        GROUP BY data ->> 'education'
+    """, 'education'),
+    'candidate_experience_counts': ("""
+        SELECT experience_years, count(*) AS candidates
+        FROM candidates
+        WHERE experience_years IS NOT NULL
+        GROUP BY experience_years
+    """, 'experience_years'),
+}
+
+
+def upgrade() -> None:
+    # When each view was last refreshed; PostgreSQL does not record it
+    op.create_table('analytics_refreshes',
+    sa.Column('view_name', sa.Text(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.Column('duration_seconds', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('view_name')
+    )
+    for name, (query, key) in VIEWS.items():
+        op.execute(f'CREATE MATERIALIZED VIEW {name} AS {query}')
+        op.execute(f'CREATE UNIQUE INDEX ix_{name}_{key} ON {name} ({key})')
+        op.execute(sa.text(
+            "INSERT INTO analytics_refreshes (view_name, refreshed_at, duration_seconds) "
+            "VALUES (:name, now(), 0)"
+        ).bindparams(name=name))
+    # Top-N skills without sorting the whole vocabulary
+    op.execute('CREATE INDEX ix_candidate_skill_counts_candidates_skill '
+               'ON candidate_skill_counts (candidates DESC, skill)')
+
+
+def downgrade() -> None:
+    for name in reversed(list(VIEWS)):
+        op.execute(f'DROP MATERIALIZED VIEW {name}')
+    op.drop_table('analytics_refreshes')
@@ -0,0 +1,95 @@
+"""add candidate generated columns
+
+Revision ID: 8b4e1f6d2a90
+Revises: 5f2a9d41c7e3
+Create Date: 2026-10-18 10:03:17.845210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4e1f6d2a90'
+down_revision: Union[str, None] = '5f2a9d41c7e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The JSONB document stays the source of truth; PostgreSQL keeps these
+    # typed copies in sync on every write. Adding STORED columns rewrites
+    # the table, so run this in a maintenance window on large databases.
+    op.add_column('candidates', sa.Column(
+        'experience_years', sa.Integer(),
+        sa.Computed("(data ->> 'experience_years')::int", persisted=True),
+    ))
+    op.add_column('candidates', sa.Column(
+        'location', sa.Text(),
+        sa.Computed("data ->> 'location'", persisted=True),
+    ))
+    op.add_column('candidates', sa.Column(
+        'email_lower', sa.Text(),
+        sa.Computed("lower(data ->> 'email')", persisted=True),
+    ))
+    op.add_column('candidates', sa.Column(
+        'full_name_lower', sa.Text(),
+        sa.Computed("lower(data ->> 'full_name')", persisted=True),
+    ))
+
+    # Replace the JSONB expression indexes with indexes on the columns
+    op.drop_index('ix_candidates_experience_years_id', table_name='candidates')
+    op.drop_index('ix_candidates_location', table_name='candidates')
+    op.drop_index('ix_candidates_email_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_full_name_trgm', table_name='candidates')
+
+    op.create_index('ix_candidates_experience_years_id', 'candidates', ['experience_years', 'id'])
+    op.create_index('ix_candidates_location', 'candidates', ['location'])
+    op.create_index('ix_candidates_email_lower', 'candidates', ['email_lower'])
+    op.create_index('ix_candidates_full_name_lower', 'candidates', ['full_name_lower'])
+    # B-tree indexes cannot serve LIKE '%term%', so substring search keeps trigram indexes
+    op.create_index(
+        'ix_candidates_email_lower_trgm', 'candidates',
+        [sa.text("email_lower gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_candidates_full_name_lower_trgm', 'candidates',
+        [sa.text("full_name_lower gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_full_name_lower_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_email_lower_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_full_name_lower', table_name='candidates')
+    op.drop_index('ix_candidates_email_lower', table_name='candidates')
+    op.drop_index('ix_candidates_location', table_name='candidates')
+    op.drop_index('ix_candidates_experience_years_id', table_name='candidates')
+
+    op.drop_column('candidates', 'full_name_lower')
+    op.drop_column('candidates', 'email_lower')
+    op.drop_column('candidates', 'location')
+    op.drop_column('candidates', 'experience_years')
+
+    op.create_index(
+        'ix_candidates_full_name_trgm', 'candidates',
+        [sa.text("lower(data ->> 'full_name') gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_candidates_email_trgm', 'candidates',
+        [sa.text("lower(data ->> 'email') gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_candidates_location', 'candidates',
+        [sa.text("(data ->> 'location')")],
+    )
+    op.create_index(
+        'ix_candidates_experience_years_id', 'candidates',
+        [sa.text("((data ->> 'experience_years')::int)"), 'id'],
+    )
@@ -0,0 +1,51 @@
+"""create resumes table
+
+Revision ID: a6c31f8d5b27
+Revises: 3d7a2c5e9f14
+Create Date: 2026-10-18 15:02:44.190733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c31f8d5b27'
+down_revision: Union[str, None] = '3d7a2c5e9f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The text search configuration is spelled out: to_tsvector(text) with
+    # the session default is not immutable and cannot be a generated column.
+    # resume_queries.TEXT_SEARCH_CONFIG must stay the same for the queries
+    # to match the stored lexemes
+    op.create_table('resumes',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('candidate_id', sa.UUID(), sa.Computed("(data ->> 'candidate_id')::uuid", persisted=True)),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+        "setweight(jsonb_to_tsvector('english', coalesce(data -> 'extracted_skills', '[]'), '[\"string\"]'), 'A')"
+        " || setweight(to_tsvector('english', coalesce(data ->> 'raw_text', '')), 'B')",
+        persisted=True,
+    )),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Serves search_vector @@ query; ranking and highlighting read the rows it finds
+    op.create_index(
+        'ix_resumes_search_vector', 'resumes', ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index('ix_resumes_candidate_id', 'resumes', ['candidate_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_candidate_id', table_name='resumes')
+    op.drop_index('ix_resumes_search_vector', table_name='resumes')
+    op.drop_table('resumes')
@@ -0,0 +1,85 @@
+"""add candidate change feed
+
+Revision ID: b5f0e3c8d716
+Revises: e4b9d2a71c58
+Create Date: 2026-10-18 18:12:39.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5f0e3c8d716'
+down_revision: Union[str, None] = 'e4b9d2a71c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# One notification per statement and chunk of ids rather than per row, so a
+# 1000-row upsert batch or a COPY merge sends a handful of notifications.
+# NOTIFY payloads are limited to 8000 bytes; 100 ids stay well below that.
+# Notifications are only delivered when (and if) the transaction commits.
+NOTIFY_FUNCTION = """
+CREATE FUNCTION notify_candidate_changes() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    operation text := CASE TG_OP WHEN 'DELETE' THEN 'delete' ELSE 'upsert' END;
+    ids text[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Deletions leave no row behind to catch up from, so keep a tombstone
+        INSERT INTO candidate_deletions (id, deleted_at)
+        SELECT id, now() FROM changed
+        ON CONFLICT (id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+    END IF;
+    FOR ids IN
+        SELECT array_agg(id::text)
+        FROM (SELECT id, (row_number() OVER () - 1) / 100 AS chunk FROM changed) numbered
+        GROUP BY chunk
+    LOOP
+        PERFORM pg_notify('candidate_changes', json_build_object('op', operation, 'ids', ids)::text);
+    END LOOP;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    op.create_table('candidate_deletions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Watermark catch-up: (updated_at, id) > (:changed_at, :id) ORDER BY updated_at, id
+    op.create_index('ix_candidates_updated_at_id', 'candidates', ['updated_at', 'id'])
+    op.create_index('ix_candidate_deletions_deleted_at_id', 'candidate_deletions', ['deleted_at', 'id'])
+
+    op.execute(NOTIFY_FUNCTION)
+    # Transition tables allow one event per trigger, hence three triggers
+    op.execute("""
+        CREATE TRIGGER candidates_notify_insert AFTER INSERT ON candidates
+        REFERENCING NEW TABLE AS changed
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_candidate_changes()
+    """)
+    op.execute("""
+        CREATE TRIGGER candidates_notify_update AFTER UPDATE ON candidates
+        REFERENCING NEW TABLE AS changed
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_candidate_changes()
+    """)
+    op.execute("""
+        CREATE TRIGGER candidates_notify_delete AFTER DELETE ON candidates
+        REFERENCING OLD TABLE AS changed
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_candidate_changes()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER candidates_notify_delete ON candidates')
+    op.execute('DROP TRIGGER candidates_notify_update ON candidates')
+    op.execute('DROP TRIGGER candidates_notify_insert ON candidates')
+    op.execute('DROP FUNCTION notify_candidate_changes()')
+    op.drop_index('ix_candidate_deletions_deleted_at_id', table_name='candidate_deletions')
+    op.drop_index('ix_candidates_updated_at_id', table_name='candidates')
+    op.drop_table('candidate_deletions')
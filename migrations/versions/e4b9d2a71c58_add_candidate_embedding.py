@@ -0,0 +1,32 @@
+"""add candidate embedding
+
+Revision ID: e4b9d2a71c58
+Revises: a6c31f8d5b27
+Create Date: 2026-10-18 16:40:12.552871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from src.resume.repository.db_models import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9d2a71c58'
+down_revision: Union[str, None] = 'a6c31f8d5b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    # Nullable: existing rows get their vectors from
+    # `python -m src.database.backfill_embeddings` (or their next save).
+    # No HNSW/IVFFlat index on purpose: nearest-neighbour queries are
+    # answered in-process (services.similarity_index), and an ANN index
+    # would slow down every INSERT and bulk COPY
+    op.add_column('candidates', sa.Column('embedding', Vector(128), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('candidates', 'embedding')
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Fill in the `embedding` column of candidates saved before it existed.
+Run with: python -m src.database.backfill_embeddings --batch-size 5000
+
+Only rows whose embedding is NULL are touched, so the script can be stopped
+and re-run at any time. Saves and COPY loads write embeddings themselves.
+"""
+
+import argparse
+import sys
+import time
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import Text, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from src.resume.repository.candidate_queries import hydrate_rows, payload_columns
+from src.resume.repository.db_models import CandidateRecord
+from src.resume.utils.embedding import EMBEDDING_FIELDS, embed_candidates, format_vector
+from src.database.database import get_sessionmaker
+from src.database.readiness import wait_until_ready
+
+DEFAULT_BACKFILL_BATCH_SIZE = 5000
+
+# One statement per batch: the ids and vectors travel as two arrays
+UPDATE_SQL = text("""
+UPDATE candidates SET embedding = batch.embedding::vector
+FROM unnest(:ids, :embeddings) AS batch (id, embedding)
+WHERE candidates.id = batch.id
+""").bindparams(
+    bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+    bindparam("embeddings", type_=ARRAY(Text)),
+)
+
+def missing_statement(after: Optional[UUID], batch_size: int):
+    # Keyset over the primary key; filled rows drop out of the filter
+    stmt = select(*payload_columns(EMBEDDING_FIELDS)).where(CandidateRecord.embedding.is_(None))
+    if after is not None:
+        stmt = stmt.where(CandidateRecord.id > after)
+    return stmt.order_by(CandidateRecord.id).limit(batch_size)
+
+def backfill_embeddings(session: Session, batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE) -> int:
+    """Embed and store every candidate without an embedding, one commit per batch."""
+    filled = 0
+    after = None
+    while True:
+        rows = session.execute(missing_statement(after, batch_size)).all()
+        if not rows:
+            return filled
+        candidates = hydrate_rows(rows, EMBEDDING_FIELDS, trusted=True)
+        session.execute(UPDATE_SQL, {
+            "ids": [candidate.id for candidate in candidates],
+            "embeddings": [format_vector(vector) for vector in embed_candidates(candidates)],
+        })
+        session.commit()
+        filled += len(candidates)
+        after = candidates[-1].id
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute missing candidate embeddings.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BACKFILL_BATCH_SIZE,
+                        help="candidates embedded and updated per transaction")
+    args = parser.parse_args()
+
+    readiness = wait_until_ready()
+    if not readiness:
+        print(f"Database not ready: {readiness.error}. Aborting backfill.", file=sys.stderr)
+        exit(1)
+
+    started = time.perf_counter()
+    session = get_sessionmaker()()
+    try:
+        filled = backfill_embeddings(session, args.batch_size)
+    finally:
+        session.close()
+    print(f"Embedded {filled} candidates in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,113 @@
+"""
+High-volume candidate loader built on PostgreSQL COPY.
+
+Candidates are streamed batch by batch into a temporary staging table with
+COPY ... FROM STDIN and then merged into `candidates` with a single
+INSERT ... SELECT ... ON CONFLICT per batch. Only one batch is buffered in
+memory at a time, so the loader can ingest arbitrarily large sources.
+"""
+
+import io
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from src.resume.models import Candidate
+from src.resume.utils.batching import chunked
+from src.resume.utils.embedding import EMBEDDING_DIMENSIONS, embed_candidates, format_vector
+
+DEFAULT_LOAD_BATCH_SIZE = 10000
+
+STAGING_TABLE = "candidates_staging"
+
+# `ordinal` numbers the rows in COPY order (COPY leaves it to the identity)
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    ordinal BIGINT GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL,
+    data JSONB NOT NULL,
+    embedding VECTOR({EMBEDDING_DIMENSIONS})
+) ON COMMIT DELETE ROWS
+"""
+
+COPY_SQL = f"COPY {STAGING_TABLE} (id, data, embedding) FROM STDIN"
+
+# DISTINCT ON keeps a single row per id so ON CONFLICT never has to
+# update the same target row twice within one statement. It keeps the last
+# copy of a repeated id, like save_many does
+MERGE_SQL = f"""
+INSERT INTO candidates (id, data, embedding)
+SELECT DISTINCT ON (id) id, data, embedding FROM {STAGING_TABLE}
+ORDER BY id, ordinal DESC
+ON CONFLICT (id) DO UPDATE SET data = EXCLUDED.data, embedding = EXCLUDED.embedding, updated_at = now()
+"""
+
+@dataclass
+class LoadSummary:
+    """Totals reported after a load completes."""
+    rows: int
+    batches: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (f"Loaded {self.rows} candidates in {self.batches} batches "
+                f"in {self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/s)")
+
+def _copy_escape(value: str) -> str:
+    """Escape a value for the COPY text format."""
+    return (value.replace("\\", "\\\\")
+                 .replace("\t", "\\t")
+                 .replace("\n", "\\n")
+                 .replace("\r", "\\r"))
+
+def format_copy_rows(candidates: Iterable[Candidate]) -> str:
+    """Render candidates as tab-separated (id, data, embedding) COPY text rows."""
+    candidates = list(candidates)
+    return "".join(
+        f"{candidate.id}\t{_copy_escape(candidate.model_dump_json())}\t{format_vector(embedding)}\n"
+        for candidate, embedding in zip(candidates, embed_candidates(candidates))
+    )
+
+def iter_candidates_from_file(path: Union[str, Path]) -> Iterator[Candidate]:
+    """Read candidates from a JSON Lines file, one profile per line."""
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield Candidate.model_validate_json(line)
+
+class CandidateCopyLoader:
+    """Loads candidates through a raw psycopg2 connection using COPY."""
+
+    def __init__(self, engine, batch_size: int = DEFAULT_LOAD_BATCH_SIZE):
+        self.engine = engine
+        self.batch_size = batch_size
+
+    def load(self, candidates: Iterable[Candidate]) -> LoadSummary:
+        started = time.perf_counter()
+        rows = 0
+        batches = 0
+
+        # COPY is a psycopg2 feature, so bypass the ORM session here
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(CREATE_STAGING_SQL)
+                for batch in chunked(candidates, self.batch_size):
+                    cursor.copy_expert(COPY_SQL, io.StringIO(format_copy_rows(batch)))
+                    cursor.execute(MERGE_SQL)
+                    # ON COMMIT DELETE ROWS empties the staging table for the next batch
+                    connection.commit()
+                    rows += len(batch)
+                    batches += 1
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        return LoadSummary(rows=rows, batches=batches, seconds=time.perf_counter() - started)
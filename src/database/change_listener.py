@@ -0,0 +1,220 @@
+"""
+LISTEN/NOTIFY consumer for the candidate change feed.
+
+Run with: python -m src.database.change_listener   (prints every batch)
+
+The candidates triggers NOTIFY once per committed statement (see
+repository.candidate_changes). CandidateChangeListener LISTENs on its own
+psycopg2 connection, gathers notifications for `batch_window` seconds,
+loads the current rows of the notified ids in one query and hands the
+batch to every subscriber. In-memory structures (matching index,
+similarity index, cache) subscribe with their apply_changes method and
+update in O(changes) instead of being rebuilt from the whole table.
+
+Delivery is at least once: after a dropped connection the listener
+reconnects and replays everything after its watermark, overlapping a
+little (see DEFAULT_CATCH_UP_OVERLAP). Applying a batch is idempotent,
+so the replayed changes are harmless.
+"""
+
+import logging
+import select
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+import psycopg2
+from sqlalchemy import exc
+
+from src.database.database import get_sessionmaker
+from src.database.settings import get_settings
+from src.resume.repository.candidate_changes import (
+    CHANGE_CHANNEL, DEFAULT_CATCH_UP_OVERLAP, CandidateChangeBatch, ChangeOp, ChangeWatermark,
+    parse_notification,
+)
+from src.resume.repository.candidate_repository import CandidateRepository
+
+logger = logging.getLogger(__name__)
+
+# Notifications gathered into one batch, in seconds and distinct ids
+DEFAULT_BATCH_WINDOW = 0.05
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+DEFAULT_RETRY_DELAY = 1.0
+
+Subscriber = Callable[[CandidateChangeBatch], None]
+
+def connect_listener():
+    """Dedicated autocommit connection: LISTEN must not sit in a pool, and
+    notifications are only read outside a transaction."""
+    settings = get_settings()
+    args = settings.pool.psycopg2_connect_args()
+    args["application_name"] = f"{args['application_name']}-listener"
+    connection = psycopg2.connect(settings.url, **args)
+    connection.autocommit = True
+    return connection
+
+class CandidateChangeListener:
+    """Delivers batched candidate changes to subscribers.
+
+    Without a `watermark` the listener starts at the newest change, so
+    start it before loading whatever its subscribers keep in memory: a
+    change made during the load is then delivered (again) afterwards.
+    With a watermark it first replays everything after it.
+
+    poll() does one round on the calling thread; start() runs poll() in a
+    background thread, so subscribers are then called on that thread.
+    """
+
+    def __init__(self, session_factory=None, connect: Callable[[], object] = connect_listener,
+                 watermark: Optional[ChangeWatermark] = None,
+                 batch_window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 catch_up_overlap: timedelta = DEFAULT_CATCH_UP_OVERLAP,
+                 retry_delay: float = DEFAULT_RETRY_DELAY):
+        self.session_factory = session_factory or get_sessionmaker()
+        self._connect = connect
+        self.watermark = watermark
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.catch_up_overlap = catch_up_overlap
+        self.retry_delay = retry_delay
+        self.subscribers: List[Subscriber] = []
+        self.connection = None
+        self._connected_before = False
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.append(subscriber)
+
+    def connect(self) -> None:
+        """LISTEN first, then catch up, so no change falls in between."""
+        self.close()
+        self.connection = self._connect()
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANGE_CHANNEL}")
+        if self.watermark is None and not self._connected_before:
+            with self._repository() as repository:
+                self.watermark = repository.latest_watermark()
+        else:
+            self.catch_up()
+        self._connected_before = True
+
+    def catch_up(self) -> int:
+        """Deliver every change after the watermark (minus the overlap)."""
+        after = self.watermark
+        if after is not None:
+            after = ChangeWatermark(after.changed_at - self.catch_up_overlap, after.id)
+        delivered = 0
+        with self._repository() as repository:
+            while True:
+                batch = repository.changes_since(after, self.max_batch_size)
+                if batch.watermark is None:
+                    return delivered
+                self._publish(batch)
+                delivered += len(batch)
+                after = batch.watermark
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """Wait up to `timeout` seconds for changes and deliver one batch.
+
+        Returns the number of changed candidates delivered.
+        """
+        if self.connection is None:
+            self.connect()
+        if not self._wait(timeout):
+            return 0
+        pending: Dict[UUID, ChangeOp] = {}
+        deadline = time.monotonic() + self.batch_window
+        while True:
+            self._drain(pending)
+            remaining = deadline - time.monotonic()
+            if len(pending) >= self.max_batch_size or remaining <= 0 or not self._wait(remaining):
+                break
+        with self._repository() as repository:
+            batch = repository.load_changes(pending)
+        self._publish(batch)
+        return len(batch)
+
+    def run(self, poll_timeout: float = 1.0) -> None:
+        """Poll until stop(), reconnecting (and catching up) after connection errors."""
+        while not self._stopping.is_set():
+            try:
+                self.poll(poll_timeout)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError,
+                    exc.OperationalError, exc.InterfaceError):
+                logger.warning("Change listener lost its connection, reconnecting", exc_info=True)
+                self.close()
+                self._stopping.wait(self.retry_delay)
+
+    def start(self) -> None:
+        self.connect()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.run, name="candidate-change-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.close()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            finally:
+                self.connection = None
+
+    def _wait(self, timeout: float) -> bool:
+        """True once a notification is waiting, False after `timeout` seconds."""
+        if self.connection.notifies:
+            return True
+        readable, _, _ = select.select([self.connection], [], [], max(timeout, 0.0))
+        if readable:
+            self.connection.poll()
+        return bool(self.connection.notifies)
+
+    def _drain(self, pending: Dict[UUID, ChangeOp]) -> None:
+        notifies = self.connection.notifies
+        while notifies:
+            op, ids = parse_notification(notifies.pop(0).payload)
+            for id in ids:
+                pending[id] = op
+
+    def _publish(self, batch: CandidateChangeBatch) -> None:
+        if batch.watermark is not None and (self.watermark is None or batch.watermark > self.watermark):
+            self.watermark = batch.watermark
+        for subscriber in self.subscribers:
+            try:
+                subscriber(batch)
+            except Exception:
+                # One failing subscriber must not starve the others
+                logger.exception("Candidate change subscriber %r failed", subscriber)
+
+    @contextmanager
+    def _repository(self):
+        session = self.session_factory()
+        try:
+            yield CandidateRepository(session, trusted_reads=True)
+        finally:
+            session.close()
+
+if __name__ == "__main__":
+    def show(batch: CandidateChangeBatch) -> None:
+        print(f"{len(batch.upserted)} upserted, {len(batch.deleted)} deleted, "
+              f"watermark {batch.watermark}", flush=True)
+
+    listener = CandidateChangeListener()
+    listener.subscribe(show)
+    listener.connect()
+    print(f"Listening on {CHANGE_CHANNEL}, press Ctrl+C to stop", file=sys.stderr)
+    try:
+        listener.run()
+    except KeyboardInterrupt:
+        listener.close()
@@ -1,30 +1,148 @@
+"""
+Engine and session factories.
+
+Nothing is created at import time: the engines and session factories are
+built on first use from get_settings(), so importing this module is cheap
+and does not load any database driver, asyncio support or the .env file.
+`engine`, `SessionLocal`, `async_engine`, `AsyncSessionLocal`,
+`DATABASE_URL` and `ASYNC_DATABASE_URL` remain importable as module
+attributes and are resolved lazily.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
-import os
-from dotenv import load_dotenv
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from src.database.settings import PoolSettings, get_settings
+
+class _TimedPoolMixin:
+    """Records how long callers wait to check a connection out of the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_lock:
+                self.acquisitions += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """Point-in-time view of a connection pool."""
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    acquisitions: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.acquisitions if self.acquisitions else 0.0
 
-# Load environment variables from .env file
-load_dotenv()
+def pool_metrics(pool) -> PoolMetrics:
+    """Snapshot the metrics of a pool created by get_engine/get_async_engine."""
+    return PoolMetrics(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        # overflow() starts at -pool_size and counts up as connections open
+        overflow=max(pool.overflow(), 0),
+        acquisitions=getattr(pool, "acquisitions", 0),
+        total_wait_seconds=getattr(pool, "total_wait", 0.0),
+        max_wait_seconds=getattr(pool, "max_wait", 0.0),
+    )
 
-# Get database connection parameters from environment variables
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = os.getenv("DB_PORT", "5432")
-DB_NAME = os.getenv("DB_NAME", "resumedb")
-DB_USER = os.getenv("DB_USER", "postgres")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
+def get_pool_settings() -> PoolSettings:
+    return get_settings().pool
 
-# Construct the database URL
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+@lru_cache(maxsize=None)
+def get_engine():
+    """The process-wide synchronous engine, created on first use."""
+    settings = get_settings()
+    return create_engine(
+        settings.url,
+        poolclass=TimedQueuePool,
+        connect_args=settings.pool.psycopg2_connect_args(),
+        **settings.pool.engine_kwargs(),
+    )
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+@lru_cache(maxsize=None)
+def get_async_engine():
+    """The process-wide asyncio engine, created on first use."""
+    # Imported here: asyncio support costs as much to import as the rest of
+    # this module, and most entry points never use it
+    from sqlalchemy.ext.asyncio import create_async_engine
+    settings = get_settings()
+    return create_async_engine(
+        settings.async_url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        connect_args=settings.pool.asyncpg_connect_args(),
+        **settings.pool.engine_kwargs(),
+    )
+
+@lru_cache(maxsize=None)
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker():
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    # expire_on_commit=False: attributes cannot be lazily reloaded after commit
+    # without an await, so keep loaded state usable
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+def get_pool_metrics() -> PoolMetrics:
+    return pool_metrics(get_engine().pool)
+
+def get_async_pool_metrics() -> PoolMetrics:
+    return pool_metrics(get_async_engine().sync_engine.pool)
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "SessionLocal": get_sessionmaker,
+    "async_engine": get_async_engine,
+    "AsyncSessionLocal": get_async_sessionmaker,
+    "DATABASE_URL": lambda: get_settings().url,
+    "ASYNC_DATABASE_URL": lambda: get_settings().async_url,
+}
+
+def __getattr__(name):
+    # PEP 562: keeps `from src.database.database import engine` working
+    # without building the engine when the module is imported
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_session():
     """Dependency to get DB session"""
-    session = SessionLocal()
+    session = get_sessionmaker()()
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+async def get_async_session():
+    """Dependency to get an async DB session"""
+    async with get_async_sessionmaker()() as session:
+        yield session
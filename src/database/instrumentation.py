@@ -0,0 +1,423 @@
+"""
+Query timing and metrics for the repository layer.
+
+Three things are measured once an Instrumentation is installed:
+- every SQL statement, through the engine's before/after_cursor_execute events
+- every repository method decorated with @instrumented (latency and rows)
+- the time spent turning rows into Pydantic models (see timed_hydration)
+
+Statements are attributed to the repository method that issued them through
+a context variable, so the numbers can be broken down per method. Events go
+to pluggable sinks: InMemorySink for tests and ad-hoc inspection,
+LoggingSink, and PrometheusSink for a /metrics endpoint.
+
+Nothing is recorded until install() is called, and the decorators cost a
+single global lookup per call until then.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus style
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Statements issued outside any @instrumented method
+UNSCOPED = "unscoped"
+
+current_operation: ContextVar[str] = ContextVar("current_operation", default=UNSCOPED)
+
+@dataclass(frozen=True)
+class QueryEvent:
+    operation: str
+    statement: str
+    seconds: float
+    rowcount: int              # as reported by the driver, -1 when unknown
+
+@dataclass(frozen=True)
+class OperationEvent:
+    operation: str
+    seconds: float
+    rows: int
+
+@dataclass(frozen=True)
+class HydrationEvent:
+    operation: str
+    seconds: float
+    rows: int
+
+@dataclass(frozen=True)
+class SlowQuery:
+    operation: str
+    statement: str
+    parameters: Any
+    seconds: float
+    plan: Optional[str] = None  # EXPLAIN (ANALYZE, BUFFERS) output, when captured
+
+class MetricsSink:
+    """Receives instrumentation events; override the ones you need."""
+
+    def record_query(self, event: QueryEvent) -> None:
+        pass
+
+    def record_operation(self, event: OperationEvent) -> None:
+        pass
+
+    def record_hydration(self, event: HydrationEvent) -> None:
+        pass
+
+    def record_slow_query(self, slow: SlowQuery) -> None:
+        pass
+
+class Histogram:
+    """Cumulative-bucket latency histogram."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, count) pairs including +Inf, as Prometheus expects."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), running))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (an estimate)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+class InMemorySink(MetricsSink):
+    """Aggregates events into per-operation histograms and counters."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, slow_query_log_size: int = 100):
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        self.operation_seconds: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.query_seconds: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.hydration_seconds: Dict[str, Histogram] = defaultdict(self._histogram)
+        self.rows: Dict[str, int] = defaultdict(int)
+        self.hydrated_rows: Dict[str, int] = defaultdict(int)
+        self.slow_queries: deque = deque(maxlen=slow_query_log_size)
+
+    def _histogram(self) -> Histogram:
+        return Histogram(self._buckets)
+
+    def record_query(self, event: QueryEvent) -> None:
+        with self._lock:
+            self.query_seconds[event.operation].observe(event.seconds)
+
+    def record_operation(self, event: OperationEvent) -> None:
+        with self._lock:
+            self.operation_seconds[event.operation].observe(event.seconds)
+            self.rows[event.operation] += event.rows
+
+    def record_hydration(self, event: HydrationEvent) -> None:
+        with self._lock:
+            self.hydration_seconds[event.operation].observe(event.seconds)
+            self.hydrated_rows[event.operation] += event.rows
+
+    def record_slow_query(self, slow: SlowQuery) -> None:
+        with self._lock:
+            self.slow_queries.append(slow)
+
+class LoggingSink(MetricsSink):
+    """Logs every event at DEBUG and slow queries at WARNING."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("src.database.instrumentation")
+
+    def record_query(self, event: QueryEvent) -> None:
+        self.logger.debug("sql %s %.3fms rows=%d: %s", event.operation, event.seconds * 1000,
+                          event.rowcount, event.statement)
+
+    def record_operation(self, event: OperationEvent) -> None:
+        self.logger.debug("call %s %.3fms rows=%d", event.operation, event.seconds * 1000, event.rows)
+
+    def record_hydration(self, event: HydrationEvent) -> None:
+        self.logger.debug("hydrate %s %.3fms rows=%d", event.operation, event.seconds * 1000, event.rows)
+
+    def record_slow_query(self, slow: SlowQuery) -> None:
+        message = "slow query in %s took %.3fms: %s"
+        args = [slow.operation, slow.seconds * 1000, slow.statement]
+        if slow.plan:
+            message += "\n%s"
+            args.append(slow.plan)
+        self.logger.warning(message, *args)
+
+class PrometheusSink(InMemorySink):
+    """InMemorySink that renders its metrics in the Prometheus text format."""
+
+    def __init__(self, namespace: str = "resumedb", **kwargs):
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.slow_query_count: Dict[str, int] = defaultdict(int)
+
+    def record_slow_query(self, slow: SlowQuery) -> None:
+        super().record_slow_query(slow)
+        with self._lock:
+            self.slow_query_count[slow.operation] += 1
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            self._render_histograms(lines, "repository_operation_seconds",
+                                    "Latency of repository methods.", self.operation_seconds)
+            self._render_histograms(lines, "sql_query_seconds",
+                                    "Latency of SQL statements by calling repository method.",
+                                    self.query_seconds)
+            self._render_histograms(lines, "hydration_seconds",
+                                    "Time spent turning rows into models.", self.hydration_seconds)
+            self._render_counter(lines, "repository_rows_total",
+                                 "Rows returned or written by repository methods.", self.rows)
+            self._render_counter(lines, "hydrated_rows_total",
+                                 "Rows turned into models.", self.hydrated_rows)
+            self._render_counter(lines, "slow_queries_total",
+                                 "Statements slower than the slow query threshold.",
+                                 self.slow_query_count)
+        return "\n".join(lines) + "\n"
+
+    def _render_histograms(self, lines: List[str], name: str, help_text: str,
+                           histograms: Dict[str, Histogram]) -> None:
+        metric = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} histogram")
+        for operation, histogram in sorted(histograms.items()):
+            label = _label(operation)
+            for le, count in histogram.cumulative():
+                lines.append(f'{metric}_bucket{{operation="{label}",le="{le}"}} {count}')
+            lines.append(f'{metric}_sum{{operation="{label}"}} {histogram.sum!r}')
+            lines.append(f'{metric}_count{{operation="{label}"}} {histogram.count}')
+
+    def _render_counter(self, lines: List[str], name: str, help_text: str,
+                        counters: Dict[str, int]) -> None:
+        metric = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for operation, value in sorted(counters.items()):
+            lines.append(f'{metric}{{operation="{_label(operation)}"}} {value}')
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class Instrumentation:
+    """Connects engine events and the decorators below to a set of sinks.
+
+    Statements slower than `slow_query_seconds` go to the slow query log.
+    With `explain_slow_queries=True` a slow SELECT is run again under
+    EXPLAIN (ANALYZE, BUFFERS) to capture its plan. That doubles the cost of
+    slow reads, so enable it while investigating rather than permanently.
+    """
+
+    def __init__(self, sinks: Sequence[MetricsSink], slow_query_seconds: float = 0.5,
+                 explain_slow_queries: bool = False):
+        self.sinks = list(sinks)
+        self.slow_query_seconds = slow_query_seconds
+        self.explain_slow_queries = explain_slow_queries
+        self._engines: List[Any] = []
+
+    def install(self, *engines) -> "Instrumentation":
+        """Start listening to `engines` (sync or async) and make this the active instance."""
+        global _active
+        for engine in engines:
+            engine = getattr(engine, "sync_engine", engine)
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+            self._engines.append(engine)
+        _active = self
+        return self
+
+    def uninstall(self) -> None:
+        global _active
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines = []
+        if _active is self:
+            _active = None
+
+    def emit(self, method: str, payload) -> None:
+        for sink in self.sinks:
+            getattr(sink, method)(payload)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._instrumentation_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_instrumentation_started", None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        operation = current_operation.get()
+        self.emit("record_query", QueryEvent(operation, statement, seconds, cursor.rowcount))
+
+        if seconds >= self.slow_query_seconds:
+            plan = None
+            if self.explain_slow_queries and not executemany and _is_select(statement):
+                plan = _explain(conn, statement, parameters)
+            self.emit("record_slow_query", SlowQuery(operation, statement, parameters, seconds, plan))
+
+def _is_select(statement: str) -> bool:
+    # ANALYZE executes the statement, so never explain writes
+    return statement.lstrip().upper().startswith(("SELECT", "WITH"))
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    """Run EXPLAIN (ANALYZE, BUFFERS) on a fresh DBAPI cursor of the same connection.
+
+    A savepoint keeps a failing EXPLAIN from aborting the caller's
+    transaction. Returns None when the plan could not be captured.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT instrumentation_explain")
+        try:
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT instrumentation_explain")
+            return None
+        finally:
+            cursor.execute("RELEASE SAVEPOINT instrumentation_explain")
+        return plan
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+
+_active: Optional[Instrumentation] = None
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    return _active
+
+def _count_rows(result) -> int:
+    """Rows in a repository result: a model, a list or Page of them, batch
+    results, or a sized result such as a CandidateChangeBatch."""
+    if result is None:
+        return 0
+    if hasattr(result, "__iter__") and hasattr(result, "__len__"):
+        # save_many returns UpsertBatchResults, count the rows they wrote
+        return sum(getattr(item, "total", 1) for item in result if item is not None)
+    if hasattr(result, "__len__"):
+        return len(result)
+    return 1
+
+def instrumented(func: Callable) -> Callable:
+    """Time a repository method and attribute the SQL it runs to it.
+
+    Works for plain and async methods, and for methods that return a
+    (sync or async) generator: then the timing covers the whole iteration
+    and the row count is the number of items yielded.
+    """
+    operation = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _active is None:
+                return await func(*args, **kwargs)
+            token = current_operation.set(operation)
+            started = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                current_operation.reset(token)
+            _active.emit("record_operation", OperationEvent(
+                operation, time.perf_counter() - started, _count_rows(result)))
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _active is None:
+            return func(*args, **kwargs)
+        token = current_operation.set(operation)
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+        if inspect.isgenerator(result):
+            return _timed_generator(operation, result, started)
+        if inspect.isasyncgen(result):
+            return _timed_async_generator(operation, result, started)
+        _active.emit("record_operation", OperationEvent(
+            operation, time.perf_counter() - started, _count_rows(result)))
+        return result
+    return wrapper
+
+def _timed_generator(operation: str, generator, started: float) -> Iterator:
+    rows = 0
+    try:
+        while True:
+            # The generator body runs during next(), so scope each step
+            token = current_operation.set(operation)
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                current_operation.reset(token)
+            rows += 1
+            yield item
+    finally:
+        generator.close()
+        if _active is not None:
+            _active.emit("record_operation", OperationEvent(
+                operation, time.perf_counter() - started, rows))
+
+async def _timed_async_generator(operation: str, generator, started: float):
+    rows = 0
+    try:
+        while True:
+            token = current_operation.set(operation)
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                current_operation.reset(token)
+            rows += 1
+            yield item
+    finally:
+        await generator.aclose()
+        if _active is not None:
+            _active.emit("record_operation", OperationEvent(
+                operation, time.perf_counter() - started, rows))
+
+@contextmanager
+def timed_hydration(rows: int):
+    """Time the block as model hydration of `rows` rows for the current operation."""
+    if _active is None:
+        yield
+        return
+    started = time.perf_counter()
+    yield
+    _active.emit("record_hydration", HydrationEvent(
+        current_operation.get(), time.perf_counter() - started, rows))
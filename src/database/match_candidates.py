@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Batch job matching: rank every candidate in the database against a list of jobs.
+Run with: python -m src.database.match_candidates --jobs jobs.json --top-k 20 --output matches.jsonl
+
+The jobs file is a JSON array of Job objects. Each output line is one job:
+{"job_id": ..., "matches": [{"candidate_id": ..., "score": ..., "matched_skills": ...}]}
+"""
+
+import argparse
+import json
+import sys
+from typing import IO, List
+
+from src.resume.models import Job
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.repository.candidate_snapshot import CandidateSnapshot
+from src.resume.services.batch_matching import BatchMatcher, JobMatches, DEFAULT_JOB_BATCH_SIZE
+from src.resume.services.matching_service import MatchingService
+from src.resume.utils.json_utils import dicts_to_models, dumps
+from src.database.database import get_sessionmaker
+from src.database.readiness import probe_in_background
+
+def load_jobs(path: str) -> List[Job]:
+    with open(path, "r", encoding="utf-8") as f:
+        return dicts_to_models(json.load(f), Job)
+
+def write_matches(results, out: IO[str]) -> int:
+    """Write one JSON line per JobMatches; returns the number of jobs written."""
+    written = 0
+    for result in results:
+        out.write(dumps(job_matches_to_dict(result)) + "\n")
+        written += 1
+    return written
+
+def job_matches_to_dict(result: JobMatches) -> dict:
+    return {
+        "job_id": result.job.id,
+        "matches": [
+            {"candidate_id": m.candidate_id, "score": m.score, "matched_skills": m.matched_skills}
+            for m in result.matches
+        ],
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rank candidates for a batch of jobs.")
+    parser.add_argument("--jobs", required=True, help="JSON file with an array of jobs")
+    parser.add_argument("--output", help="JSON Lines output file (default: stdout)")
+    parser.add_argument("--top-k", type=int, default=10, help="candidates kept per job")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--job-batch-size", type=int, default=DEFAULT_JOB_BATCH_SIZE,
+                        help="jobs scored per round of worker tasks")
+    parser.add_argument("--fetch-size", type=int, default=10000,
+                        help="candidates fetched per round trip while building the index")
+    parser.add_argument("--snapshot", default=None,
+                        help="build the index from this candidate snapshot instead of the database "
+                             "(see src.database.snapshot_candidates)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    # Parse the jobs while the database comes up
+    readiness = None if args.snapshot else probe_in_background()
+    jobs = load_jobs(args.jobs)
+
+    if readiness is not None and not readiness.result():
+        print(f"Database not ready: {readiness.result().error}. Aborting matching.", file=sys.stderr)
+        exit(1)
+
+    if args.snapshot:
+        service = MatchingService()
+        count = service.load_snapshot(CandidateSnapshot.open(args.snapshot))
+    else:
+        session = get_sessionmaker()()
+        try:
+            service = MatchingService(CandidateRepository(session, trusted_reads=True))
+            count = service.rebuild(fetch_size=args.fetch_size)
+        finally:
+            session.close()
+    print(f"Indexed {count} candidates, matching {len(jobs)} jobs...", file=sys.stderr)
+
+    matcher = BatchMatcher(service.index, workers=args.workers, job_batch_size=args.job_batch_size)
+    results = matcher.match(jobs, k=args.top_k)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            written = write_matches(results, out)
+    else:
+        written = write_matches(results, sys.stdout)
+    print(f"Wrote matches for {written} jobs", file=sys.stderr)
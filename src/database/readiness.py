@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Readiness probe: wait until PostgreSQL answers queries.
+Run with: python -m src.database.readiness [--deadline 30] [--async]
+
+Exit status: 0 ready, 1 not ready before the deadline, 2 invalid settings.
+
+The probe checks a connection out of the application's pooled engine, so
+the connection it opens stays in the pool for the first real query instead
+of being thrown away. Failed attempts are retried with exponential backoff
+and jitter (starting at 50ms, so a database that comes up a moment later is
+noticed a moment later) until an overall deadline. Scripts that have work
+to do before touching the database can run the probe in the background
+(probe_in_background) and only wait for it when they need a connection.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+from sqlalchemy import exc, text
+
+from src.database.database import get_async_engine, get_engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINE = 30.0
+
+PROBE_SQL = text("SELECT version()")
+
+# Errors of a database that is not up yet: refused or timed-out connections,
+# "the database system is starting up". Anything else is a bug or a
+# misconfiguration and fails the probe immediately
+RETRYABLE_ERRORS = (exc.OperationalError, exc.InterfaceError, OSError)
+
+@dataclass(frozen=True)
+class Backoff:
+    """Exponential backoff with jitter.
+
+    The n-th retry waits initial * multiplier**n seconds, capped at
+    max_delay, scaled down by a random factor of up to `jitter` so that
+    containers started together do not retry in lockstep.
+    """
+    initial: float = 0.05
+    multiplier: float = 2.0
+    max_delay: float = 2.0
+    jitter: float = 0.5
+
+    def delays(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        rng = rng or random.Random()
+        delay = self.initial
+        while True:
+            yield delay * (1 - self.jitter * rng.random())
+            delay = min(delay * self.multiplier, self.max_delay)
+
+@dataclass(frozen=True)
+class ReadinessResult:
+    """Outcome of a probe; true when the database is ready."""
+    ready: bool
+    attempts: int
+    elapsed_seconds: float
+    server_version: Optional[str] = None
+    error: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.ready
+
+class _Retries:
+    """Attempt counting and retry delays under an overall deadline."""
+
+    def __init__(self, deadline: float, backoff: Backoff, clock: Callable[[], float]):
+        self.deadline = deadline
+        self.clock = clock
+        self.started = clock()
+        self.delays = backoff.delays()
+        self.attempts = 0
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def next_delay(self, error: Exception) -> Optional[float]:
+        """Seconds to wait before the next attempt; None once out of time."""
+        remaining = self.deadline - self.elapsed()
+        if remaining <= 0:
+            return None
+        delay = min(next(self.delays), remaining)
+        logger.info("Database not ready (attempt %d): %s; retrying in %.2fs",
+                    self.attempts, _describe(error), delay)
+        return delay
+
+    def ready(self, version: str) -> ReadinessResult:
+        logger.info("Database ready after %d attempt(s), %.2fs: %s", self.attempts, self.elapsed(), version)
+        return ReadinessResult(True, self.attempts, self.elapsed(), server_version=version)
+
+    def failed(self, error: Exception) -> ReadinessResult:
+        logger.warning("Database not ready after %d attempt(s), %.2fs: %s",
+                       self.attempts, self.elapsed(), _describe(error))
+        return ReadinessResult(False, self.attempts, self.elapsed(), error=_describe(error))
+
+def _describe(error: Exception) -> str:
+    # The driver's message, without SQLAlchemy's statement and background link
+    error = getattr(error, "orig", None) or error
+    return str(error).strip().splitlines()[0] if str(error).strip() else type(error).__name__
+
+def wait_until_ready(engine=None, deadline: float = DEFAULT_DEADLINE, backoff: Backoff = Backoff(),
+                     sleep: Callable[[float], None] = time.sleep,
+                     clock: Callable[[], float] = time.monotonic) -> ReadinessResult:
+    """Retry a trivial query on the pooled engine until it succeeds or
+    `deadline` seconds have passed.
+
+    An attempt that is already connecting when the deadline passes is not
+    interrupted; the connect_timeout setting bounds it.
+    """
+    engine = engine if engine is not None else get_engine()
+    retries = _Retries(deadline, backoff, clock)
+    while True:
+        retries.attempts += 1
+        try:
+            with engine.connect() as connection:
+                return retries.ready(connection.execute(PROBE_SQL).scalar())
+        except RETRYABLE_ERRORS as error:
+            delay = retries.next_delay(error)
+            if delay is None:
+                return retries.failed(error)
+        sleep(delay)
+
+async def wait_until_ready_async(engine=None, deadline: float = DEFAULT_DEADLINE,
+                                 backoff: Backoff = Backoff(), sleep=asyncio.sleep,
+                                 clock: Callable[[], float] = time.monotonic) -> ReadinessResult:
+    """wait_until_ready for the asyncio engine; waiting does not block the event loop."""
+    engine = engine if engine is not None else get_async_engine()
+    retries = _Retries(deadline, backoff, clock)
+    while True:
+        retries.attempts += 1
+        try:
+            async with engine.connect() as connection:
+                return retries.ready((await connection.execute(PROBE_SQL)).scalar())
+        except RETRYABLE_ERRORS as error:
+            delay = retries.next_delay(error)
+            if delay is None:
+                return retries.failed(error)
+        await sleep(delay)
+
+def probe_in_background(engine=None, deadline: float = DEFAULT_DEADLINE,
+                        backoff: Backoff = Backoff()) -> "Future[ReadinessResult]":
+    """Start wait_until_ready on a daemon thread and return its future, so
+    start-up work can overlap with waiting for the database."""
+    engine = engine if engine is not None else get_engine()
+    future: Future = Future()
+
+    def run():
+        try:
+            future.set_result(wait_until_ready(engine, deadline, backoff))
+        except BaseException as error:
+            future.set_exception(error)
+
+    threading.Thread(target=run, name="db-readiness", daemon=True).start()
+    return future
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Wait until the database accepts queries.")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE,
+                        help="seconds to keep retrying before giving up")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="probe through the asyncpg engine instead of psycopg2")
+    parser.add_argument("--quiet", action="store_true", help="only report the outcome")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+
+    try:
+        if args.use_async:
+            result = asyncio.run(wait_until_ready_async(deadline=args.deadline))
+        else:
+            result = wait_until_ready(deadline=args.deadline)
+    except (ValueError, exc.ArgumentError) as error:
+        # Invalid DB_* settings; retrying will not help
+        print(f"Invalid database settings: {error}", file=sys.stderr)
+        return 2
+    return 0 if result else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Refresh the candidate analytics materialized views.
+Run with: python -m src.database.refresh_analytics [--view candidate_skill_counts] [--interval 300]
+
+Without --interval every selected view is refreshed once. With it the
+script keeps running and every interval refreshes the views that are older
+than --max-age, which makes it the scheduler for dashboard freshness.
+"""
+
+import argparse
+import sys
+import time
+from datetime import timedelta
+
+from src.resume.repository.analytics_queries import AnalyticsView
+from src.resume.repository.analytics_repository import AnalyticsRepository
+from src.resume.services.analytics_service import DEFAULT_MAX_AGE, AnalyticsService
+from src.database.database import get_sessionmaker
+from src.database.readiness import wait_until_ready
+
+def report(refreshes) -> None:
+    for refresh in refreshes:
+        if refresh.skipped:
+            print(f"{refresh.view.value}: already being refreshed, skipped")
+        else:
+            print(f"{refresh.view.value}: refreshed in {refresh.duration_seconds:.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the candidate analytics views.")
+    parser.add_argument("--view", action="append", choices=[view.value for view in AnalyticsView],
+                        help="view to refresh (repeatable); all views by default")
+    parser.add_argument("--interval", type=float,
+                        help="keep running, checking for stale views every this many seconds")
+    parser.add_argument("--max-age", type=float, default=DEFAULT_MAX_AGE.total_seconds(),
+                        help="with --interval, seconds after which a view is stale")
+    args = parser.parse_args()
+
+    readiness = wait_until_ready()
+    if not readiness:
+        print(f"Database not ready: {readiness.error}. Aborting refresh.", file=sys.stderr)
+        exit(1)
+
+    views = [AnalyticsView(view) for view in args.view] if args.view else None
+    session = get_sessionmaker()()
+    try:
+        service = AnalyticsService(AnalyticsRepository(session), timedelta(seconds=args.max_age))
+        if args.interval is None:
+            report(service.refresh(views))
+        else:
+            while True:
+                due = [view for view in service.stale_views() if views is None or view in views]
+                report(service.refresh(due))
+                session.close()    # don't hold a connection while sleeping
+                time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        session.close()
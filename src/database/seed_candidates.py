@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 """
 Database seeding script for candidate data.
-Run with: python -m scripts.seed_candidates
+Run with: python -m src.database.seed_candidates --count 1000000 --batch-size 10000
+Load a JSON Lines export instead: python -m src.database.seed_candidates --file candidates.jsonl
 """
 
+import argparse
 import uuid
 import random
+import sys
 from datetime import datetime, timedelta
-from typing import List
-import os
-from dotenv import load_dotenv
+from typing import Iterator, List
 
 # Import your models and database setup
 from src.resume.models import Candidate
 from src.resume.repository.candidate_repository import CandidateRepository
-from src.database.database import engine, SessionLocal
-from src.database.db_connection_checker import check_db_connection
-
-# Load environment variables
-load_dotenv()
+from src.database.database import get_engine, get_sessionmaker
+from src.database.readiness import wait_until_ready
+from src.database.candidate_loader import (
+    CandidateCopyLoader, DEFAULT_LOAD_BATCH_SIZE, iter_candidates_from_file
+)
 
 # Sample data for generating realistic candidates
 FIRST_NAMES = ["John", "Jane", "Michael", "Emily", "David", "Sarah", "Robert", "Lisa", "William", "Maria"]
@@ -60,32 +61,49 @@ def generate_random_candidate() -> Candidate:
         preferred_job_types=preferred_job_types
     )
 
+def generate_random_candidates(count: int) -> Iterator[Candidate]:
+    """Lazily generate `count` random candidates."""
+    for _ in range(count):
+        yield generate_random_candidate()
+
 def seed_candidates(count: int = 10) -> List[Candidate]:
     """Generate and save random candidates to the database."""
     candidates = [generate_random_candidate() for _ in range(count)]
     
     # Create a database session
-    session = SessionLocal()
+    session = get_sessionmaker()()
     try:
-        # Use the repository to save candidates
+        # Use the repository to upsert all candidates in batches
         repository = CandidateRepository(session)
-        
-        saved_candidates = []
-        for candidate in candidates:
-            saved = repository.save(candidate)
-            saved_candidates.append(saved)
-            print(f"Added candidate: {saved.full_name} ({saved.email})")
-        
-        return saved_candidates
+        repository.save_many(candidates)
+        return candidates
     finally:
         session.close()
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load candidates into the database using COPY.")
+    parser.add_argument("--count", type=int, default=10,
+                        help="number of random candidates to generate (ignored with --file)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_LOAD_BATCH_SIZE,
+                        help="rows per COPY batch and transaction")
+    parser.add_argument("--file", help="JSON Lines file with one candidate per line")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+
     # Check database connection first
-    if not check_db_connection():
-        print("Database connection failed. Aborting seed operation.")
+    readiness = wait_until_ready()
+    if not readiness:
+        print(f"Database not ready: {readiness.error}. Aborting seed operation.", file=sys.stderr)
         exit(1)
     
-    print("Seeding database with test candidates...")
-    candidates = seed_candidates(10)
-    print(f"Added {len(candidates)} candidates to the database.")
\ No newline at end of file
+    if args.file:
+        print(f"Loading candidates from {args.file}...")
+        source = iter_candidates_from_file(args.file)
+    else:
+        print(f"Seeding database with {args.count} test candidates...")
+        source = generate_random_candidates(args.count)
+
+    summary = CandidateCopyLoader(get_engine(), batch_size=args.batch_size).load(source)
+    print(summary)
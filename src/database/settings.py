@@ -0,0 +1,120 @@
+"""
+Database settings, read from the environment once per process.
+
+Engines, the readiness probe, the change listener and Alembic all take
+their DSN from get_settings(). The .env file is loaded on the first call
+rather than at import time, and this module imports nothing but the
+standard library, so importing it (or anything that imports it) stays cheap.
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool and session settings, one instance per process."""
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30           # seconds to wait for a free connection
+    pool_recycle: int = 1800         # seconds before a connection is replaced
+    pool_pre_ping: bool = True       # test connections on checkout (survives failovers)
+    statement_timeout_ms: int = 0    # server-side statement_timeout, 0 disables it
+    connect_timeout: int = 10        # seconds to establish a connection, 0 waits indefinitely
+    application_name: str = "resumedb"
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        return cls(
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms),
+            connect_timeout=_env_int("DB_CONNECT_TIMEOUT", cls.connect_timeout),
+            application_name=os.getenv("DB_APPLICATION_NAME") or cls.application_name,
+        )
+
+    def engine_kwargs(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+    def psycopg2_connect_args(self) -> dict:
+        args = {"application_name": self.application_name}
+        if self.connect_timeout:
+            args["connect_timeout"] = self.connect_timeout
+        if self.statement_timeout_ms:
+            args["options"] = f"-c statement_timeout={self.statement_timeout_ms}"
+        return args
+
+    def asyncpg_connect_args(self) -> dict:
+        server_settings = {"application_name": self.application_name}
+        if self.statement_timeout_ms:
+            server_settings["statement_timeout"] = str(self.statement_timeout_ms)
+        args = {"server_settings": server_settings}
+        if self.connect_timeout:
+            args["timeout"] = self.connect_timeout
+        return args
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    host: str = "localhost"
+    port: str = "5432"
+    name: str = "resumedb"
+    user: str = "postgres"
+    password: str = field(default="postgres", repr=False)
+    pool: PoolSettings = field(default_factory=PoolSettings)
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        return cls(
+            host=os.getenv("DB_HOST", cls.host),
+            port=os.getenv("DB_PORT", cls.port),
+            name=os.getenv("DB_NAME", cls.name),
+            user=os.getenv("DB_USER", cls.user),
+            password=os.getenv("DB_PASSWORD", "postgres"),
+            pool=PoolSettings.from_env(),
+        )
+
+    def _url(self, driver: str) -> str:
+        return f"{driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
+    @property
+    def url(self) -> str:
+        """psycopg2 DSN, also accepted by psycopg2.connect()."""
+        return self._url("postgresql")
+
+    @property
+    def async_url(self) -> str:
+        return self._url("postgresql+asyncpg")
+
+@lru_cache(maxsize=None)
+def get_settings() -> DatabaseSettings:
+    """The process-wide settings, read on first use.
+
+    Variables already set in the environment win over the .env file.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    return DatabaseSettings.from_env()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Export candidates into a columnar, memory-mapped snapshot (see
+repository.candidate_snapshot), or bring an existing snapshot up to date.
+Run with: python -m src.database.snapshot_candidates --output snapshots/candidates
+     or:  python -m src.database.snapshot_candidates --output snapshots/candidates --refresh
+
+--refresh only reads the rows changed or deleted since the snapshot was
+taken; without an existing snapshot it falls back to a full export.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from src.resume.repository.candidate_queries import DEFAULT_FETCH_SIZE
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.repository.candidate_snapshot import CURRENT_FILE, build_snapshot, refresh_snapshot
+from src.database.database import get_sessionmaker
+from src.database.readiness import wait_until_ready
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a columnar candidate snapshot.")
+    parser.add_argument("--output", required=True, help="snapshot directory")
+    parser.add_argument("--refresh", action="store_true",
+                        help="apply changes since the current snapshot instead of exporting everything")
+    parser.add_argument("--fetch-size", type=int, default=DEFAULT_FETCH_SIZE,
+                        help="rows fetched per round trip during a full export")
+    args = parser.parse_args()
+
+    readiness = wait_until_ready()
+    if not readiness:
+        print(f"Database not ready: {readiness.error}. Aborting snapshot.", file=sys.stderr)
+        exit(1)
+
+    started = time.perf_counter()
+    session = get_sessionmaker()()
+    try:
+        if args.refresh and (Path(args.output) / CURRENT_FILE).exists():
+            snapshot = refresh_snapshot(args.output, CandidateRepository(session, trusted_reads=True))
+        else:
+            snapshot = build_snapshot(session, args.output, fetch_size=args.fetch_size)
+    finally:
+        session.close()
+    print(f"Snapshot {snapshot.path} holds {len(snapshot)} candidates "
+          f"({time.perf_counter() - started:.1f}s)")
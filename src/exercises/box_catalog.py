@@ -0,0 +1,212 @@
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from .box import Box
+
+class _WeightIndex:
+    """Rows of one material, kept sorted by (weight, row).
+
+    Inserting merges into the sorted arrays (np.insert at searchsorted
+    positions), so the index never has to be sorted again, like a TreeMap
+    in Java rather than a List sorted on every read.
+    """
+
+    def __init__(self):
+        self.weights = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return self.rows.size
+
+    def insert(self, weights: np.ndarray, rows: np.ndarray) -> None:
+        # Stable sort, then side="right": equal weights stay in insertion
+        # order, exactly like sorted() on the original list
+        order = np.argsort(weights, kind="stable")
+        weights, rows = weights[order], rows[order]
+        if self.rows.size == 0:
+            self.weights, self.rows = weights, rows
+            return
+        positions = np.searchsorted(self.weights, weights, side="right")
+        self.weights = np.insert(self.weights, positions, weights)
+        self.rows = np.insert(self.rows, positions, rows)
+
+    def remove(self, weight: float, row: int) -> None:
+        low, high = self.bounds(weight, weight)
+        position = low + int(np.flatnonzero(self.rows[low:high] == row)[0])
+        self.weights = np.delete(self.weights, position)
+        self.rows = np.delete(self.rows, position)
+
+    def bounds(self, min_weight: Optional[float], max_weight: Optional[float]):
+        """Positions [low, high) of the rows with min_weight <= weight <= max_weight."""
+        low = 0 if min_weight is None else int(np.searchsorted(self.weights, min_weight, side="left"))
+        high = self.rows.size if max_weight is None else int(np.searchsorted(self.weights, max_weight, side="right"))
+        return low, max(low, high)
+
+class BoxCatalog:
+    """Boxes in columnar NumPy arrays, indexed by material and weight.
+
+    Materials are matched case-insensitively and interned as integer codes.
+    Every material gets its own weight-sorted index (plus one over all
+    boxes) the first time it is queried; from then on add/remove keep it
+    sorted. "Cardboard boxes by weight", the k lightest and weight ranges
+    are slices of an already sorted array, and volume bounds are a
+    vectorized filter over such a slice. Results are always lightest
+    first, ties in the order the boxes were added. Weights are held as
+    float64 (Box.weight is a float), so integer weights beyond 2**53 may
+    compare differently than in sorted().
+
+    add/add_many return a handle per box that remove() takes.
+    """
+
+    def __init__(self, boxes: Iterable[Box] = (), capacity: int = 1024):
+        self.boxes: List[Optional[Box]] = []
+        self.weights = np.zeros(capacity, dtype=np.float64)
+        self.volumes = np.zeros(capacity, dtype=np.float64)
+        self.materials = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.material_codes: Dict[str, int] = {}
+        # Built on first use, so indexing a list for one query only sorts
+        # the material asked for
+        self._by_material: List[Optional[_WeightIndex]] = []
+        self._all: Optional[_WeightIndex] = None
+        self._count = 0
+        # Lower-casing is done once per distinct spelling, not once per box
+        self._spellings: Dict[str, int] = {}
+        self.add_many(boxes)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, box: Box) -> int:
+        return int(self.add_many([box])[0])
+
+    def add_many(self, boxes: Iterable[Box]) -> np.ndarray:
+        """Add boxes and return their handles."""
+        boxes = list(boxes)
+        start = len(self.boxes)
+        rows = np.arange(start, start + len(boxes), dtype=np.intp)
+        if not boxes:
+            return rows
+        self._reserve(start + len(boxes))
+        self.boxes.extend(boxes)
+
+        def column(name: str) -> np.ndarray:
+            # map/attrgetter pull the attribute in C, no Python loop per box
+            return np.fromiter(map(attrgetter(name), boxes), dtype=np.float64, count=len(boxes))
+
+        weights = column("weight")
+        spellings = list(map(attrgetter("material"), boxes))
+        for spelling in set(spellings):
+            self._code(spelling)
+        codes = np.fromiter(map(self._spellings.__getitem__, spellings), dtype=np.int32, count=len(boxes))
+        self.weights[rows] = weights
+        self.volumes[rows] = column("length") * column("width") * column("height")
+        self.materials[rows] = codes
+        self.active[rows] = True
+
+        self._count += len(boxes)
+
+        if self._all is not None:
+            self._all.insert(weights, rows)
+        for code in np.unique(codes).tolist():
+            if self._by_material[code] is not None:
+                selected = codes == code
+                self._by_material[code].insert(weights[selected], rows[selected])
+        return rows
+
+    def remove(self, handle: int) -> bool:
+        if not 0 <= handle < len(self.boxes) or not self.active[handle]:
+            return False
+        weight = self.weights[handle]
+        for index in (self._all, self._by_material[self.materials[handle]]):
+            if index is not None:
+                index.remove(weight, handle)
+        self.active[handle] = False
+        self.boxes[handle] = None
+        self._count -= 1
+        return True
+
+    def find(self, material: Optional[str] = None,
+             min_weight: Optional[float] = None, max_weight: Optional[float] = None,
+             min_volume: Optional[float] = None, max_volume: Optional[float] = None,
+             limit: Optional[int] = None) -> List[Box]:
+        """Boxes within every given bound (all inclusive), lightest first."""
+        rows = self.find_rows(material, min_weight, max_weight, min_volume, max_volume, limit)
+        boxes = self.boxes
+        return [boxes[row] for row in rows.tolist()]
+
+    def find_rows(self, material: Optional[str] = None,
+                  min_weight: Optional[float] = None, max_weight: Optional[float] = None,
+                  min_volume: Optional[float] = None, max_volume: Optional[float] = None,
+                  limit: Optional[int] = None) -> np.ndarray:
+        """Handles of the boxes find() returns, for callers that work on the columns."""
+        if material is None:
+            index = self._all_index()
+        else:
+            code = self.material_codes.get(material.lower())
+            if code is None:
+                return np.empty(0, dtype=np.intp)
+            index = self._material_index(code)
+
+        low, high = index.bounds(min_weight, max_weight)
+        if min_volume is None and max_volume is None:
+            stop = high if limit is None else min(high, low + limit)
+            return index.rows[low:stop]
+
+        rows = index.rows[low:high]
+        volumes = self.volumes[rows]
+        keep = np.ones(rows.size, dtype=bool)
+        if min_volume is not None:
+            keep &= volumes >= min_volume
+        if max_volume is not None:
+            keep &= volumes <= max_volume
+        return rows[keep][:limit]
+
+    def sorted_by_weight(self, material: str) -> List[Box]:
+        """All boxes of a material, lightest first."""
+        return self.find(material)
+
+    def lightest(self, material: Optional[str], k: int) -> List[Box]:
+        return self.find(material, limit=k)
+
+    def _all_index(self) -> _WeightIndex:
+        if self._all is None:
+            self._all = self._build_index(self.active[:len(self.boxes)])
+        return self._all
+
+    def _material_index(self, code: int) -> _WeightIndex:
+        if self._by_material[code] is None:
+            stored = len(self.boxes)
+            self._by_material[code] = self._build_index(
+                self.active[:stored] & (self.materials[:stored] == code))
+        return self._by_material[code]
+
+    def _build_index(self, selected: np.ndarray) -> _WeightIndex:
+        index = _WeightIndex()
+        rows = np.flatnonzero(selected)
+        index.insert(self.weights[rows], rows)
+        return index
+
+    def _code(self, material: str) -> int:
+        code = self._spellings.get(material)
+        if code is None:
+            normalized = material.lower()
+            code = self.material_codes.get(normalized)
+            if code is None:
+                code = len(self.material_codes)
+                self.material_codes[normalized] = code
+                self._by_material.append(None)
+            self._spellings[material] = code
+        return code
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self.weights.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        for name in ("weights", "volumes", "materials", "active"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:array.shape[0]] = array
+            setattr(self, name, grown)
@@ -1,11 +1,24 @@
 # Import List type hint from typing module (similar to Java's java.util.List)
-from typing import List
+from typing import List, Union
 # Import Box class from the same package (. means current package, like Java's relative import)
 from .box import Box
+from .box_catalog import BoxCatalog
 
 class OrderPicker:
+    """Cardboard boxes, lightest first.
+
+    Both methods take a plain list or a BoxCatalog. A list is filtered and
+    sorted on every call, which is the cheapest way to answer a single
+    query. Pass a catalog you keep around (and add to / remove from) to
+    answer repeated queries without sorting again.
+    """
+
     @staticmethod  # Similar to Java's static method
-    def filter_and_sort_boxes(boxes: List[Box]) -> List[Box]:
+    def filter_and_sort_boxes(boxes: Union[List[Box], BoxCatalog]) -> List[Box]:
+        # isinstance is Python's instanceof
+        if isinstance(boxes, BoxCatalog):
+            return boxes.sorted_by_weight("cardboard")
+
         # Python's filter and lambda (similar to Java's Stream filter)
         cardboard_boxes = filter(lambda box: box.material.lower() == "cardboard", boxes)
         
@@ -15,8 +28,10 @@ class OrderPicker:
 
     # Alternative more Pythonic way using list comprehension
     @staticmethod
-    def filter_and_sort_boxes_pythonic(boxes: List[Box]) -> List[Box]:
+    def filter_and_sort_boxes_pythonic(boxes: Union[List[Box], BoxCatalog]) -> List[Box]:
+        if isinstance(boxes, BoxCatalog):
+            return boxes.sorted_by_weight("cardboard")
         return sorted(
             [box for box in boxes if box.material.lower() == "cardboard"],
             key=lambda box: box.weight
-        ) 
\ No newline at end of file
+        )
@@ -0,0 +1,127 @@
+"""
+Statements and result types for AnalyticsRepository.
+
+The dashboard aggregates (skill distribution, job type preferences,
+education levels, experience) are materialized views created by the
+add_candidate_analytics_views migration, so a read returns the stored
+counts instead of unnesting the JSONB of every candidate. The views are
+as old as their last REFRESH; analytics_refreshes records when that was.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Generic, Iterator, List, Optional, TypeVar
+from sqlalchemy import BigInteger, DateTime, Integer, Text, cast, column, func, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from src.resume.repository.db_models import AnalyticsRefreshRecord
+
+T = TypeVar('T')
+
+class AnalyticsView(str, Enum):
+    SKILLS = "candidate_skill_counts"
+    JOB_TYPES = "candidate_job_type_counts"
+    EDUCATION = "candidate_education_counts"
+    EXPERIENCE = "candidate_experience_counts"
+
+# The grouping column of every view
+_KEY_COLUMNS = {
+    AnalyticsView.SKILLS: ("skill", Text),
+    AnalyticsView.JOB_TYPES: ("job_type", Text),
+    AnalyticsView.EDUCATION: ("education", Text),
+    AnalyticsView.EXPERIENCE: ("experience_years", Integer),
+}
+
+@dataclass(frozen=True)
+class TermCount:
+    """Candidates listing a skill, job type or education."""
+    value: str
+    candidates: int
+
+@dataclass(frozen=True)
+class ExperienceCount:
+    years: int
+    candidates: int
+
+@dataclass
+class AnalyticsReport(Generic[T]):
+    """Rows of one view and how old they are.
+
+    `refreshed_at` is when the refresh that produced the rows started;
+    changes committed after it are not counted yet. `age` is measured by
+    the database clock at read time. Iterates like the list of its rows.
+    """
+    view: AnalyticsView
+    rows: List[T]
+    refreshed_at: Optional[datetime]
+    age: Optional[timedelta]
+
+    def is_stale(self, max_age: timedelta) -> bool:
+        return self.age is None or self.age > max_age
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+@dataclass(frozen=True)
+class ViewRefresh:
+    """Outcome of refreshing one view. `skipped` when another session was
+    already refreshing it, in which case nothing was done here."""
+    view: AnalyticsView
+    refreshed_at: Optional[datetime]
+    duration_seconds: float
+    skipped: bool = False
+
+def view_table(view: AnalyticsView):
+    name, type_ = _KEY_COLUMNS[view]
+    return table(view.value, column(name, type_), column("candidates", BigInteger))
+
+def counts_statement(view: AnalyticsView, limit: Optional[int] = None, by_key: bool = False):
+    """Rows of a view, most common first (or in key order with `by_key`)."""
+    view_rows = view_table(view)
+    key, candidates = view_rows.c[_KEY_COLUMNS[view][0]], view_rows.c.candidates
+    order = (key,) if by_key else (candidates.desc(), key)
+    return select(key, candidates).order_by(*order).limit(limit)
+
+def refresh_info_statement(view: Optional[AnalyticsView] = None):
+    """(view_name, refreshed_at, age, duration_seconds) of one view or all of them."""
+    stmt = select(
+        AnalyticsRefreshRecord.view_name,
+        AnalyticsRefreshRecord.refreshed_at,
+        (func.localtimestamp() - AnalyticsRefreshRecord.refreshed_at).label("age"),
+        AnalyticsRefreshRecord.duration_seconds,
+    )
+    if view is not None:
+        stmt = stmt.where(AnalyticsRefreshRecord.view_name == view.value)
+    return stmt
+
+def refresh_lock_statement(view: AnalyticsView):
+    """Transaction-level advisory lock per view: concurrent refreshers of the
+    same view skip it instead of queueing up behind each other."""
+    return select(func.pg_try_advisory_xact_lock(func.hashtext(view.value)))
+
+def clock_statement():
+    # clock_timestamp, not now(): the time the refresh starts, not the transaction
+    return select(cast(func.clock_timestamp(), DateTime))
+
+def refresh_statement(view: AnalyticsView, concurrently: bool = True):
+    # CONCURRENTLY keeps the view readable while it is rebuilt, at the cost
+    # of a diff against the old contents; it needs the unique index on the key
+    return text(f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{view.value}")
+
+def record_refresh_statement(view: AnalyticsView, refreshed_at: datetime, duration_seconds: float):
+    stmt = insert(AnalyticsRefreshRecord).values(
+        view_name=view.value, refreshed_at=refreshed_at, duration_seconds=duration_seconds,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[AnalyticsRefreshRecord.view_name],
+        set_={"refreshed_at": stmt.excluded.refreshed_at, "duration_seconds": stmt.excluded.duration_seconds},
+    )
+
+def term_counts(rows) -> List[TermCount]:
+    return [TermCount(value, candidates) for value, candidates in rows]
+
+def experience_counts(rows) -> List[ExperienceCount]:
+    return [ExperienceCount(years, candidates) for years, candidates in rows]
@@ -0,0 +1,85 @@
+import time
+from typing import Callable, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from src.database.instrumentation import instrumented
+from src.resume.repository.analytics_queries import (
+    AnalyticsReport, AnalyticsView, ExperienceCount, TermCount, ViewRefresh,
+    clock_statement, counts_statement, experience_counts, record_refresh_statement,
+    refresh_info_statement, refresh_lock_statement, refresh_statement, term_counts,
+)
+
+class AnalyticsRepository:
+    """Reads and refreshes the candidate analytics materialized views.
+
+    Reads cost O(rows returned): the aggregation over the candidates table
+    happens in refresh(), which rebuilds the views from scratch. Every read
+    reports when its view was last refreshed.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @instrumented
+    def skill_counts(self, limit: Optional[int] = None) -> AnalyticsReport[TermCount]:
+        """Candidates per skill, most common first."""
+        return self._report(AnalyticsView.SKILLS, term_counts, limit)
+
+    @instrumented
+    def job_type_counts(self, limit: Optional[int] = None) -> AnalyticsReport[TermCount]:
+        """Candidates per preferred job type, most common first."""
+        return self._report(AnalyticsView.JOB_TYPES, term_counts, limit)
+
+    @instrumented
+    def education_counts(self, limit: Optional[int] = None) -> AnalyticsReport[TermCount]:
+        """Candidates per education, most common first."""
+        return self._report(AnalyticsView.EDUCATION, term_counts, limit)
+
+    @instrumented
+    def experience_counts(self) -> AnalyticsReport[ExperienceCount]:
+        """Candidates per years of experience, in order of years."""
+        return self._report(AnalyticsView.EXPERIENCE, experience_counts, None, by_key=True)
+
+    @instrumented
+    def freshness(self) -> List[AnalyticsReport]:
+        """Refresh metadata of every view, without their rows."""
+        rows = self.session.execute(refresh_info_statement()).all()
+        known = {row.view_name: row for row in rows}
+        return [
+            AnalyticsReport(view, [], known[view.value].refreshed_at, known[view.value].age)
+            if view.value in known else AnalyticsReport(view, [], None, None)
+            for view in AnalyticsView
+        ]
+
+    @instrumented
+    def refresh(self, views: Optional[Iterable[AnalyticsView]] = None,
+                concurrently: bool = True) -> List[ViewRefresh]:
+        """Rebuild views (all by default), one transaction and commit per view."""
+        results = []
+        for view in (AnalyticsView if views is None else views):
+            if not self.session.execute(refresh_lock_statement(view)).scalar():
+                self.session.rollback()
+                results.append(ViewRefresh(view, None, 0.0, skipped=True))
+                continue
+            try:
+                refreshed_at = self.session.execute(clock_statement()).scalar()
+                started = time.perf_counter()
+                self.session.execute(refresh_statement(view, concurrently))
+                duration = time.perf_counter() - started
+                self.session.execute(record_refresh_statement(view, refreshed_at, duration))
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+            results.append(ViewRefresh(view, refreshed_at, duration))
+        return results
+
+    def _report(self, view: AnalyticsView, to_rows: Callable, limit: Optional[int],
+                by_key: bool = False) -> AnalyticsReport:
+        rows = self.session.execute(counts_statement(view, limit, by_key)).all()
+        info = self.session.execute(refresh_info_statement(view)).first()
+        return AnalyticsReport(
+            view=view,
+            rows=to_rows(rows),
+            refreshed_at=info.refreshed_at if info else None,
+            age=info.age if info else None,
+        )
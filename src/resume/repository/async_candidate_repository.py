@@ -0,0 +1,121 @@
+from typing import AsyncIterator, Iterable, List, Optional, Sequence
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.instrumentation import instrumented
+from src.resume.models import Candidate
+from src.resume.repository.candidate_queries import (
+    ALL_CANDIDATES, BoundFilter, CandidateOrder, UpsertBatchResult, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE,
+    DEFAULT_LOOKUP_CHUNK_SIZE, build_page, candidates_by_id,
+    find_by_id_statement, find_by_ids_statement, hydrate_rows,
+    name_or_email_filter, page_query, skills_filter, stream_statement,
+    upsert_batch_result, upsert_batch_statement,
+)
+from src.resume.repository.pagination import Page
+from src.resume.utils.batching import chunked
+
+class AsyncCandidateRepository:
+    """asyncio counterpart of CandidateRepository.
+
+    Builds exactly the same statements (see candidate_queries) and only
+    differs in awaiting an AsyncSession. A session must not be shared by
+    concurrent tasks: give every task its own session from AsyncSessionLocal.
+    There is no `prepared` option: asyncpg already prepares every statement
+    and keeps the prepared statements per connection.
+    """
+
+    def __init__(self, session: AsyncSession, trusted_reads: bool = False):
+        self.session = session
+        self.trusted_reads = trusted_reads
+
+    @instrumented
+    async def save(self, candidate: Candidate) -> Candidate:
+        await self.session.execute(upsert_batch_statement([candidate]))
+        await self.session.commit()
+        return candidate
+
+    @instrumented
+    async def save_many(self, candidates: Iterable[Candidate],
+                        batch_size: int = DEFAULT_BATCH_SIZE) -> List[UpsertBatchResult]:
+        """Upsert candidates with one statement and one commit per batch."""
+        results = []
+        for batch_number, batch in enumerate(chunked(candidates, batch_size), start=1):
+            result = await self.session.execute(upsert_batch_statement(batch))
+            returned = result.all()
+            await self.session.commit()
+            results.append(upsert_batch_result(batch_number, returned))
+        return results
+
+    @instrumented
+    async def find_by_id(self, id: UUID, fields: Optional[Sequence[str]] = None) -> Optional[Candidate]:
+        result = await self.session.execute(*find_by_id_statement(id, fields))
+        row = result.first()
+
+        if not row:
+            return None
+
+        return hydrate_rows([row], fields, self.trusted_reads)[0]
+
+    @instrumented
+    async def find_by_ids(self, ids: Sequence[UUID], fields: Optional[Sequence[str]] = None,
+                          chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE) -> List[Optional[Candidate]]:
+        """Load many candidates with one query per chunk of ids, in input order."""
+        ids = list(ids)
+        found = {}
+        for chunk in chunked(dict.fromkeys(ids), chunk_size):
+            result = await self.session.execute(*find_by_ids_statement(chunk, fields))
+            found.update(candidates_by_id(result.all(), fields, self.trusted_reads))
+        return [found.get(id) for id in ids]
+
+    @instrumented
+    async def find_by_name_or_email(self, search_term: str, limit: Optional[int] = None,
+                                    after: Optional[str] = None,
+                                    order: CandidateOrder = CandidateOrder.CREATED,
+                                    fields: Optional[Sequence[str]] = None) -> Page[Candidate]:
+        """Search candidates by name or email using JSONB operators"""
+        return await self._find_page(name_or_email_filter(search_term), limit, after, order, fields)
+
+    @instrumented
+    async def find_by_skills(self, skills: List[str], limit: Optional[int] = None,
+                             after: Optional[str] = None,
+                             order: CandidateOrder = CandidateOrder.CREATED,
+                             fields: Optional[Sequence[str]] = None) -> Page[Candidate]:
+        """Find candidates with specific skills using JSON querying"""
+        return await self._find_page(skills_filter(skills), limit, after, order, fields)
+
+    @instrumented
+    def iter_all(self, fetch_size: int = DEFAULT_FETCH_SIZE,
+                 fields: Optional[Sequence[str]] = None) -> AsyncIterator[Candidate]:
+        """Stream every candidate without loading the table into memory"""
+        return self._stream(ALL_CANDIDATES, fetch_size, fields)
+
+    @instrumented
+    def iter_by_name_or_email(self, search_term: str,
+                              fetch_size: int = DEFAULT_FETCH_SIZE,
+                              fields: Optional[Sequence[str]] = None) -> AsyncIterator[Candidate]:
+        """Streaming variant of find_by_name_or_email"""
+        return self._stream(name_or_email_filter(search_term), fetch_size, fields)
+
+    @instrumented
+    def iter_by_skills(self, skills: List[str],
+                       fetch_size: int = DEFAULT_FETCH_SIZE,
+                       fields: Optional[Sequence[str]] = None) -> AsyncIterator[Candidate]:
+        """Streaming variant of find_by_skills"""
+        return self._stream(skills_filter(skills), fetch_size, fields)
+
+    async def _find_page(self, bound: BoundFilter, limit: Optional[int], after: Optional[str],
+                         order: CandidateOrder, fields: Optional[Sequence[str]]) -> Page[Candidate]:
+        query = page_query(bound, limit, after, order, fields)
+        result = await self.session.execute(query.statement, query.params)
+        return build_page(query, result.all(), self.trusted_reads)
+
+    async def _stream(self, bound: BoundFilter, fetch_size: int,
+                      fields: Optional[Sequence[str]]) -> AsyncIterator[Candidate]:
+        # AsyncSession.stream() keeps a server-side cursor open and fetches
+        # `fetch_size` rows per round trip
+        result = await self.session.stream(*stream_statement(bound, fields, fetch_size))
+        try:
+            async for partition in result.partitions():
+                for candidate in hydrate_rows(partition, fields, self.trusted_reads):
+                    yield candidate
+        finally:
+            await result.close()
@@ -0,0 +1,211 @@
+"""
+Read-through caching for candidate lookups by id.
+
+CacheBackend is the extension point (like a Spring CacheManager): the
+in-process LRUTTLCache is the default, and a shared cache such as Redis
+can be plugged in later by implementing the same four methods.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Generic, Hashable, Iterable, List, Optional, Sequence, TypeVar
+from uuid import UUID
+from src.resume.models import Candidate
+from src.resume.repository.candidate_changes import CandidateChangeBatch
+from src.resume.repository.candidate_queries import (
+    DEFAULT_BATCH_SIZE, DEFAULT_LOOKUP_CHUNK_SIZE, UpsertBatchResult,
+)
+from src.resume.utils.batching import chunked
+
+V = TypeVar('V')
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0     # entries dropped to stay within maxsize
+    expirations: int = 0   # entries dropped because their TTL ran out
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class CacheBackend(ABC, Generic[V]):
+    """Key-value cache used by CachedCandidateRepository."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[V]:
+        """Cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: V) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        pass
+
+class LRUTTLCache(CacheBackend[V]):
+    """Bounded, thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    `clock` is injectable so tests can move time forward without sleeping.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+class CachedCandidateRepository:
+    """Wraps a CandidateRepository with a read-through cache for find_by_id.
+
+    `save` writes to the database first and then refreshes the cached copy,
+    so a saved candidate is served from the cache on its next read, while
+    `save_many` invalidates the ids it wrote. Projected lookups
+    (`fields=...`) bypass the cache. Every other repository method is
+    delegated unchanged.
+
+    Cached candidates are shared between callers: treat them as read-only.
+    To share one cache across sessions, pass the same backend to every
+    wrapper.
+    """
+
+    def __init__(self, repository, cache: Optional[CacheBackend[Candidate]] = None):
+        self.repository = repository
+        self.cache = cache if cache is not None else LRUTTLCache()
+
+    def find_by_id(self, id: UUID, fields: Optional[Sequence[str]] = None) -> Optional[Candidate]:
+        if fields is not None:
+            return self.repository.find_by_id(id, fields=fields)
+
+        candidate = self.cache.get(id)
+        if candidate is None:
+            candidate = self.repository.find_by_id(id)
+            if candidate is not None:
+                self.cache.set(id, candidate)
+        return candidate
+
+    def find_by_ids(self, ids: Sequence[UUID], fields: Optional[Sequence[str]] = None,
+                    chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE) -> List[Optional[Candidate]]:
+        """Serve cached ids from the cache and load the rest in one batch lookup."""
+        if fields is not None:
+            return self.repository.find_by_ids(ids, fields=fields, chunk_size=chunk_size)
+
+        ids = list(ids)
+        found = {}
+        missing = []
+        for id in dict.fromkeys(ids):
+            candidate = self.cache.get(id)
+            if candidate is None:
+                missing.append(id)
+            else:
+                found[id] = candidate
+
+        if missing:
+            loaded = self.repository.find_by_ids(missing, chunk_size=chunk_size)
+            for id, candidate in zip(missing, loaded):
+                if candidate is not None:
+                    self.cache.set(id, candidate)
+                    found[id] = candidate
+        return [found.get(id) for id in ids]
+
+    def save(self, candidate: Candidate) -> Candidate:
+        try:
+            saved = self.repository.save(candidate)
+        except Exception:
+            # The stored state is unknown now, so force the next read to the database
+            self.cache.delete(candidate.id)
+            raise
+        self.cache.set(saved.id, saved)
+        return saved
+
+    def save_many(self, candidates: Iterable[Candidate],
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[UpsertBatchResult]:
+        # Bulk writes invalidate instead of refreshing, so a large load
+        # does not evict the hot entries. Each batch is saved (and committed)
+        # on its own and its ids are dropped right after, whether it
+        # committed or failed, so readers never get a stale copy of a
+        # committed row and no stale copy can be re-cached.
+        results = []
+        for batch_number, batch in enumerate(chunked(candidates, batch_size), start=1):
+            try:
+                for result in self.repository.save_many(batch, batch_size=batch_size):
+                    results.append(replace(result, batch_number=batch_number))
+            finally:
+                for candidate in batch:
+                    self.cache.delete(candidate.id)
+        return results
+
+    def apply_changes(self, batch: CandidateChangeBatch) -> None:
+        """Change feed subscriber: drop entries changed by other processes."""
+        for candidate in batch.upserted:
+            self.cache.delete(candidate.id)
+        for id in batch.deleted:
+            self.cache.delete(id)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not defined here: finders, iterators, ...
+        if name == "repository":
+            raise AttributeError(name)
+        return getattr(self.repository, name)
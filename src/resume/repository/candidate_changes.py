@@ -0,0 +1,146 @@
+"""
+Candidate change feed: notification payloads, watermark catch-up queries
+and the batches handed to subscribers.
+
+Triggers on `candidates` (see the add_candidate_change_feed migration)
+NOTIFY the CHANGE_CHANNEL channel with `{"op": "upsert"|"delete", "ids": [...]}`
+for every committed statement, and record deleted ids in
+`candidate_deletions`. A listener that was not connected catches up by
+reading everything after its watermark: the (updated_at, id) of the last
+change it applied. Like candidate_queries, nothing in here performs I/O.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import any_, bindparam, delete, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from src.resume.models import Candidate
+from src.resume.repository.candidate_queries import hydrate_rows
+from src.resume.repository.db_models import CandidateDeletionRecord, CandidateRecord
+
+CHANGE_CHANNEL = "candidate_changes"
+
+# Changes read per catch-up query
+DEFAULT_CATCH_UP_SIZE = 1000
+
+# updated_at is the writing transaction's start time, so a long transaction
+# can commit rows older than changes already seen. Catch-up re-reads this
+# far behind its watermark; replayed changes are harmless
+DEFAULT_CATCH_UP_OVERLAP = timedelta(seconds=60)
+
+class ChangeOp(str, Enum):
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+@dataclass(frozen=True, order=True)
+class ChangeWatermark:
+    """Position in the feed: changes are ordered by (changed_at, id)."""
+    changed_at: datetime
+    id: UUID
+
+@dataclass
+class CandidateChangeBatch:
+    """Net effect of a run of changes: every id appears at most once.
+
+    `upserted` holds the current version of inserted or updated candidates,
+    `deleted` the ids that no longer exist. Applying a batch twice gives
+    the same result, so subscribers may see a change more than once.
+    """
+    upserted: List[Candidate] = field(default_factory=list)
+    deleted: List[UUID] = field(default_factory=list)
+    watermark: Optional[ChangeWatermark] = None
+
+    def __len__(self) -> int:
+        return len(self.upserted) + len(self.deleted)
+
+def parse_notification(payload: str) -> Tuple[ChangeOp, List[UUID]]:
+    message = json.loads(payload)
+    return ChangeOp(message["op"]), [UUID(id) for id in message["ids"]]
+
+def _after(columns, after: Optional[ChangeWatermark]):
+    # Row-value comparison, served by the (timestamp, id) indexes
+    return tuple_(*columns) > tuple_(
+        bindparam("after_changed_at", after.changed_at),
+        bindparam("after_id", after.id, type_=PG_UUID(as_uuid=True)),
+    )
+
+def upserts_since_statement(after: Optional[ChangeWatermark], limit: int):
+    """Candidates written after the watermark, oldest change first."""
+    columns = (CandidateRecord.updated_at, CandidateRecord.id)
+    stmt = select(*columns, CandidateRecord.data)
+    if after is not None:
+        stmt = stmt.where(_after(columns, after))
+    return stmt.order_by(*columns).limit(limit)
+
+def deletions_since_statement(after: Optional[ChangeWatermark], limit: int):
+    """Tombstones written after the watermark, oldest first."""
+    columns = (CandidateDeletionRecord.deleted_at, CandidateDeletionRecord.id)
+    stmt = select(*columns)
+    if after is not None:
+        stmt = stmt.where(_after(columns, after))
+    return stmt.order_by(*columns).limit(limit)
+
+def changed_rows_statement(ids: Sequence[UUID]):
+    """Current rows of notified ids; ids without a row were deleted since."""
+    ids_param = bindparam("ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True)))
+    return select(CandidateRecord.updated_at, CandidateRecord.id, CandidateRecord.data).where(
+        CandidateRecord.id == any_(ids_param)
+    )
+
+def latest_change_statements():
+    """Newest candidate write and newest deletion, each read backwards
+    along its (timestamp, id) index."""
+    return [
+        select(changed_at, id).order_by(changed_at.desc(), id.desc()).limit(1)
+        for changed_at, id in (
+            (CandidateRecord.updated_at, CandidateRecord.id),
+            (CandidateDeletionRecord.deleted_at, CandidateDeletionRecord.id),
+        )
+    ]
+
+def prune_deletions_statement(before: datetime):
+    return delete(CandidateDeletionRecord).where(CandidateDeletionRecord.deleted_at < before)
+
+def merge_changes(upsert_rows, deletion_rows, limit: int, trusted: bool) -> CandidateChangeBatch:
+    """The first `limit` changes of both sources as one batch.
+
+    Both row lists are sorted and limited by the *_since statements, so
+    everything up to the returned watermark has been seen and the next
+    query can start after it. A later change to the same id wins.
+    """
+    events = sorted(
+        [((row[0], row[1]), ChangeOp.UPSERT, row) for row in upsert_rows]
+        + [((row[0], row[1]), ChangeOp.DELETE, row) for row in deletion_rows],
+        key=lambda event: event[0],
+    )[:limit]
+    if not events:
+        return CandidateChangeBatch()
+
+    latest: Dict[UUID, tuple] = {}
+    for event in events:
+        latest.pop(event[0][1], None)
+        latest[event[0][1]] = event
+    upserts = [row for _, op, row in latest.values() if op is ChangeOp.UPSERT]
+    return CandidateChangeBatch(
+        upserted=hydrate_rows([row[2:] for row in upserts], None, trusted),
+        deleted=[id for (_, id), op, _ in latest.values() if op is ChangeOp.DELETE],
+        watermark=ChangeWatermark(*events[-1][0]),
+    )
+
+def changed_rows_batch(pending: Dict[UUID, ChangeOp], rows, trusted: bool) -> CandidateChangeBatch:
+    """Batch for notified ids from their current rows (see changed_rows_statement).
+
+    The rows are the truth: a notified upsert whose row is gone became a
+    delete, and a notified delete whose id was inserted again an upsert.
+    """
+    found = {row[1] for row in rows}
+    watermark = max((ChangeWatermark(row[0], row[1]) for row in rows), default=None)
+    return CandidateChangeBatch(
+        upserted=hydrate_rows([row[2:] for row in rows], None, trusted),
+        deleted=[id for id in pending if id not in found],
+        watermark=watermark,
+    )
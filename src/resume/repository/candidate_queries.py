@@ -0,0 +1,395 @@
+"""
+Statement building and row hydration shared by the sync and async
+candidate repositories.
+
+Nothing in here performs I/O: each function either builds a SQLAlchemy
+statement or turns fetched rows into domain objects, so both repositories
+only differ in how they execute statements.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+from pydantic import BaseModel
+from sqlalchemy import Integer, Text, any_, bindparam, case, cast, or_, func, literal_column, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID, insert
+from src.database.instrumentation import timed_hydration
+from src.resume.models import Candidate
+from src.resume.repository.db_models import CandidateRecord
+from src.resume.repository.pagination import Page, encode_cursor, decode_cursor
+from src.resume.utils.embedding import EMBEDDING_FIELDS, embed_candidates
+from src.resume.utils.json_utils import models_to_dicts, dicts_to_models
+
+# Rows per multi-row INSERT. PostgreSQL allows at most 65535 bind
+# parameters per statement and each row uses two (id, data).
+DEFAULT_BATCH_SIZE = 1000
+
+# Rows fetched per round trip from a server-side cursor when streaming
+DEFAULT_FETCH_SIZE = 1000
+
+# Ids per `id = ANY(:ids)` lookup. The ids travel as a single array
+# parameter, so this only bounds the size of each query and its result.
+DEFAULT_LOOKUP_CHUNK_SIZE = 1000
+
+# Finder statements are built once per shape (filter, projection, order,
+# paging) and executed with the values of each call as bind parameters.
+# Building a select costs more Python time than PostgreSQL needs to answer
+# a primary key lookup, and SQLAlchemy memoizes the cache key of a statement
+# object, so reusing one skips both. They select from the Table rather than
+# the mapped class, which keeps Session.execute off the ORM compile path.
+_candidates = CandidateRecord.__table__
+
+# Distinct projections (`fields`) whose statements are kept
+STATEMENT_CACHE_SIZE = 256
+
+def _json_field(key: str):
+    """JSONB field accessor with the key rendered inline.
+
+    Expression indexes only match queries whose expression is identical, so
+    `data -> 'skills'` must not become `data -> %(param)s` when a driver
+    sends parameters separately from the statement.
+    """
+    return _candidates.c.data[literal_column(f"'{key}'")]
+
+_CONSTRUCT_DEFAULTS = [
+    (name, field.default_factory or (lambda default=field.default: default))
+    for name, field in Candidate.model_fields.items()
+    if not field.is_required()
+]
+
+def construct_candidate(payload: Dict) -> Candidate:
+    """Build a Candidate from trusted stored data without validation.
+
+    Rows were validated when they were written, so re-running EmailStr and
+    field validators on every read is wasted work. model_construct does no
+    type coercion either, so the only conversion needed is the id, which is
+    stored as a string in the JSON document.
+    """
+    values = dict(payload)
+    if isinstance(values.get('id'), str):
+        values['id'] = UUID(values['id'])
+    # Fill defaults ourselves: model_construct inspects the signature of
+    # every default_factory it calls, which dominates projected reads
+    for name, make_default in _CONSTRUCT_DEFAULTS:
+        if name not in values:
+            values[name] = make_default()
+    return Candidate.model_construct(_fields_set=set(payload), **values)
+
+def hydrate_candidates(payloads: List[Dict], trusted: bool = False) -> List[Candidate]:
+    """Turn stored candidate payloads into Candidate models."""
+    if trusted:
+        return [construct_candidate(payload) for payload in payloads]
+    # One pydantic-core call for the whole list instead of one per row
+    return dicts_to_models(payloads, Candidate)
+
+def payload_columns(fields: Optional[Sequence[str]]) -> List[Any]:
+    """Columns to select for a full document or for a projection."""
+    if fields is None:
+        return [_candidates.c.data]
+
+    unknown = set(fields) - set(Candidate.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown candidate fields: {sorted(unknown)}")
+
+    # Always include the id; take it from the typed column, not the JSON
+    return [_candidates.c.id.label('id')] + [
+        _json_field(field).label(field) for field in fields if field != 'id'
+    ]
+
+def row_payload(row, fields: Optional[Sequence[str]]) -> Dict:
+    """Extract the stored document (or projected fields) from a result row."""
+    if fields is None:
+        return row[0]
+    names = ['id'] + [field for field in fields if field != 'id']
+    return dict(zip(names, row))
+
+def hydrate_rows(rows, fields: Optional[Sequence[str]], trusted: bool) -> List[Candidate]:
+    with timed_hydration(len(rows)):
+        # A projection is not a complete candidate and cannot pass validation
+        return hydrate_candidates(
+            [row_payload(row, fields) for row in rows],
+            trusted=trusted or fields is not None,
+        )
+
+class CandidateOrder(str, Enum):
+    """Stable sort keys available for paginated finders."""
+    CREATED = "created"        # (created_at, id) ascending
+    EXPERIENCE = "experience"  # (experience_years, id) descending
+
+@dataclass(frozen=True)
+class _SortKey:
+    columns: Tuple[Any, ...]
+    parsers: Tuple[Callable[[Any], Any], ...]
+    descending: bool
+
+# The trailing id makes every key unique, so rows never repeat or go
+# missing between pages even when the leading column has ties
+_SORT_KEYS = {
+    CandidateOrder.CREATED: _SortKey(
+        columns=(_candidates.c.created_at, _candidates.c.id),
+        parsers=(datetime.fromisoformat, UUID),
+        descending=False,
+    ),
+    CandidateOrder.EXPERIENCE: _SortKey(
+        columns=(_candidates.c.experience_years, _candidates.c.id),
+        parsers=(int, UUID),
+        descending=True,
+    ),
+}
+
+@dataclass
+class UpsertBatchResult:
+    """Outcome of a single upsert batch."""
+    batch_number: int
+    inserted: int
+    updated: int
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+def build_upsert_statement(rows: List[Dict], record=CandidateRecord):
+    """Build a multi-row INSERT ... ON CONFLICT (id) DO UPDATE statement.
+
+    Each row is a dict with `id` and `data` keys, plus any other column of
+    `record` to write (candidates also carry `embedding`); `record` is any
+    table with the same (id, data, updated_at) layout. The statement
+    returns one row per document with an `inserted` flag: `xmax = 0` only
+    holds for tuples created by this statement, updated tuples carry our
+    xid in xmax.
+    """
+    stmt = insert(record).values(rows)
+    updates = {key: stmt.excluded[key] for key in rows[0] if key != "id"}
+    updates["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(
+        index_elements=[record.id],
+        set_=updates,
+    ).returning(
+        record.id,
+        literal_column("xmax = 0").label("inserted"),
+    )
+
+def upsert_batch_statement(batch: Sequence[BaseModel], record=CandidateRecord):
+    """Upsert statement for one batch of models stored as (id, data) rows."""
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+    # statement, so keep only the last version of a repeated id
+    unique = list({model.id: model for model in batch}.values())
+    rows = [
+        {"id": model.id, "data": data}
+        for model, data in zip(unique, models_to_dicts(unique))
+    ]
+    if record is CandidateRecord:
+        # Keep the stored similarity embedding in step with the document
+        for row, embedding in zip(rows, embed_candidates(unique)):
+            row["embedding"] = embedding
+    return build_upsert_statement(rows, record)
+
+def upsert_batch_result(batch_number: int, returned) -> UpsertBatchResult:
+    """Count inserted and updated rows from an upsert's RETURNING rows."""
+    inserted = sum(1 for row in returned if row.inserted)
+    return UpsertBatchResult(
+        batch_number=batch_number,
+        inserted=inserted,
+        updated=len(returned) - inserted,
+    )
+
+class CandidateFilter(str, Enum):
+    """Conditions of the search finders."""
+    NAME_OR_EMAIL = "name_or_email"
+    SKILLS = "skills"
+
+_PATTERN = bindparam("pattern", type_=Text)
+
+_FILTER_CONDITIONS = {
+    # LIKE '%term%' on the generated lower-case columns is served by
+    # their pg_trgm GIN indexes
+    CandidateFilter.NAME_OR_EMAIL: or_(
+        _candidates.c.full_name_lower.like(_PATTERN),
+        _candidates.c.email_lower.like(_PATTERN),
+    ),
+    # PostgreSQL JSONB containment operator @>, served by the
+    # jsonb_path_ops GIN index on data -> 'skills'
+    CandidateFilter.SKILLS: _json_field('skills').contains(bindparam("skills", type_=JSONB)),
+}
+
+class BoundFilter(NamedTuple):
+    """A finder condition plus the parameter values of one call; a filter
+    of None matches every candidate."""
+    filter: Optional[CandidateFilter]
+    params: Dict[str, Any]
+
+    @property
+    def condition(self):
+        """The condition with the values filled in, for one-off statements."""
+        return _FILTER_CONDITIONS[self.filter].params(self.params)
+
+ALL_CANDIDATES = BoundFilter(None, {})
+
+class BoundStatement(NamedTuple):
+    """A cached statement and its parameter values: session.execute(*bound)."""
+    statement: Any
+    params: Dict[str, Any]
+
+def name_or_email_filter(search_term: str) -> BoundFilter:
+    return BoundFilter(CandidateFilter.NAME_OR_EMAIL, {"pattern": f"%{search_term.lower()}%"})
+
+def skills_filter(skills: List[str]) -> BoundFilter:
+    return BoundFilter(CandidateFilter.SKILLS, {"skills": list(skills)})
+
+def _fields_key(fields: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    return None if fields is None else tuple(fields)
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _find_by_id_select(fields: Optional[Tuple[str, ...]]):
+    return select(*payload_columns(fields)).where(_candidates.c.id == bindparam("id"))
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _find_by_ids_select(fields: Optional[Tuple[str, ...]]):
+    ids_param = bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True)))
+    return select(_candidates.c.id, *payload_columns(fields)).where(_candidates.c.id == any_(ids_param))
+
+def find_by_id_statement(id: UUID, fields: Optional[Sequence[str]]) -> BoundStatement:
+    return BoundStatement(_find_by_id_select(_fields_key(fields)), {"id": id})
+
+def find_by_ids_statement(ids: Sequence[UUID], fields: Optional[Sequence[str]]) -> BoundStatement:
+    """One lookup for many ids: `id = ANY(:ids::UUID[])` with the ids bound as an array.
+
+    The typed id column is selected first so rows can be put back in the
+    caller's order (see candidates_by_id).
+    """
+    return BoundStatement(_find_by_ids_select(_fields_key(fields)), {"ids": list(ids)})
+
+def candidates_by_id(rows, fields: Optional[Sequence[str]], trusted: bool) -> Dict[UUID, Candidate]:
+    """Hydrate rows fetched by find_by_ids_statement, keyed by id."""
+    candidates = hydrate_rows([row[1:] for row in rows], fields, trusted)
+    return {row[0]: candidate for row, candidate in zip(rows, candidates)}
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _stream_select(filter: Optional[CandidateFilter], fields: Optional[Tuple[str, ...]], fetch_size: int):
+    stmt = select(*payload_columns(fields))
+    if filter is not None:
+        stmt = stmt.where(_FILTER_CONDITIONS[filter])
+    return stmt.execution_options(yield_per=fetch_size)
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def embeddings_statement(fetch_size: int):
+    """Id, EMBEDDING_FIELDS and the stored embedding as text (parsed in bulk
+    by parse_vectors). The fields are only sent for rows the backfill has
+    not reached, which have to be embedded; for the rest they are NULL."""
+    pending = _candidates.c.embedding.is_(None)
+    id_column, *field_columns = payload_columns(EMBEDDING_FIELDS)
+    return select(
+        id_column,
+        *(case((pending, column.element)).label(column.name) for column in field_columns),
+        cast(_candidates.c.embedding, Text),
+    ).execution_options(yield_per=fetch_size)
+
+def stream_statement(bound: BoundFilter, fields: Optional[Sequence[str]], fetch_size: int) -> BoundStatement:
+    """Select for streaming; yield_per makes the driver use a server-side cursor."""
+    return BoundStatement(_stream_select(bound.filter, _fields_key(fields), fetch_size), bound.params)
+
+@dataclass(frozen=True)
+class PageQuery:
+    """A keyset-paginated select plus what is needed to read its rows back."""
+    statement: Any
+    params: Dict[str, Any]
+    limit: Optional[int]
+    order: CandidateOrder
+    fields: Optional[Sequence[str]]
+    payload_width: int
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _page_select(filter: Optional[CandidateFilter], fields: Optional[Tuple[str, ...]],
+                 order: CandidateOrder, seek: bool, limited: bool):
+    sort_key = _SORT_KEYS[order]
+    stmt = select(*payload_columns(fields), *sort_key.columns)
+    if filter is not None:
+        stmt = stmt.where(_FILTER_CONDITIONS[filter])
+
+    if seek:
+        position = tuple_(*sort_key.columns)
+        last_seen = tuple_(*(
+            bindparam(f"after_{i}", type_=column.type) for i, column in enumerate(sort_key.columns)
+        ))
+        stmt = stmt.where(position < last_seen if sort_key.descending else position > last_seen)
+
+    stmt = stmt.order_by(*(
+        column.desc() if sort_key.descending else column.asc()
+        for column in sort_key.columns
+    ))
+
+    if limited:
+        stmt = stmt.limit(bindparam("limit", type_=Integer))
+    return stmt
+
+def page_query(bound: BoundFilter, limit: Optional[int], after: Optional[str],
+               order: CandidateOrder, fields: Optional[Sequence[str]]) -> PageQuery:
+    """Build a finder as a keyset-paginated query.
+
+    Instead of OFFSET, the next page starts strictly after the sort key of
+    the previous page's last row, so page 1000 costs the same as page 1.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    sort_key = _SORT_KEYS[order]
+    statement = _page_select(bound.filter, _fields_key(fields), order, after is not None, limit is not None)
+    params = dict(bound.params)
+
+    if after is not None:
+        last_seen = decode_cursor(after, order.value, sort_key.parsers)
+        params.update((f"after_{i}", value) for i, value in enumerate(last_seen))
+
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists
+        params["limit"] = limit + 1
+
+    return PageQuery(statement=statement, params=params, limit=limit, order=order, fields=fields,
+                     payload_width=len(statement.selected_columns) - len(sort_key.columns))
+
+def build_page(query: PageQuery, rows, trusted: bool) -> Page[Candidate]:
+    """Turn the rows fetched for a PageQuery into a Page."""
+    next_cursor = None
+    if query.limit is not None and len(rows) > query.limit:
+        rows = rows[:query.limit]
+        next_cursor = encode_cursor(query.order.value, rows[-1][query.payload_width:])
+
+    return Page(
+        items=hydrate_rows(rows, query.fields, trusted),
+        next_cursor=next_cursor,
+    )
+
+@dataclass(frozen=True)
+class PreparedLookup:
+    """A finder statement as a server-side prepared statement.
+
+    `prepare_sql` is run once per connection; afterwards `execute` runs the
+    stored plan with only the parameters sent, so PostgreSQL skips parsing
+    and planning. Prepared statements live as long as the connection, which
+    rules them out behind a transaction-pooling PgBouncer.
+    """
+    name: str
+    prepare_sql: str
+    execute: Any
+
+def prepared_lookup(name: str, statement, parameters: Sequence[Tuple[str, str]]) -> PreparedLookup:
+    """PREPARE/EXECUTE pair for a select with the given (bind name, SQL type)
+    parameters, in $1, $2... order; the SQL is the select's own."""
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    for position, (param, _) in enumerate(parameters, start=1):
+        sql = sql.replace(f"%({param})s", f"${position}")
+    types = ", ".join(type_ for _, type_ in parameters)
+    arguments = ", ".join(f"CAST(:{param} AS {type_})" for param, type_ in parameters)
+    execute = text(f"EXECUTE {name}({arguments})").bindparams(
+        *(bindparam(param, type_=compiled.binds[param].type) for param, _ in parameters)
+    ).columns(*statement.selected_columns)
+    return PreparedLookup(name, f"PREPARE {name} ({types}) AS {sql}", execute)
+
+# Whole-document lookups by primary key, the hottest statements
+FIND_BY_ID_PREPARED = prepared_lookup("candidates_find_by_id", _find_by_id_select(None), [("id", "uuid")])
+FIND_BY_IDS_PREPARED = prepared_lookup("candidates_find_by_ids", _find_by_ids_select(None), [("ids", "uuid[]")])
@@ -1,65 +1,205 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from src.database.instrumentation import instrumented
 from src.resume.models import Candidate
-from src.resume.repository.db_models import CandidateRecord
-from src.resume.utils.json_utils import model_to_dict, dict_to_model
+from src.resume.repository.candidate_changes import (
+    CandidateChangeBatch, ChangeOp, ChangeWatermark, DEFAULT_CATCH_UP_SIZE,
+    changed_rows_batch, changed_rows_statement, deletions_since_statement,
+    latest_change_statements, merge_changes, prune_deletions_statement,
+    upserts_since_statement,
+)
+from src.resume.repository.candidate_queries import (
+    ALL_CANDIDATES, FIND_BY_ID_PREPARED, FIND_BY_IDS_PREPARED, BoundFilter, BoundStatement,
+    CandidateOrder, PreparedLookup, UpsertBatchResult, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE,
+    DEFAULT_LOOKUP_CHUNK_SIZE, build_page, candidates_by_id, embeddings_statement,
+    find_by_id_statement, find_by_ids_statement, hydrate_rows,
+    name_or_email_filter, page_query, skills_filter, stream_statement,
+    upsert_batch_result, upsert_batch_statement,
+)
+from src.resume.repository.pagination import Page
+from src.resume.utils.batching import chunked
+from src.resume.utils.embedding import EMBEDDING_FIELDS, stored_embeddings
 
 class CandidateRepository:
-    def __init__(self, session: Session):
+    """Stores candidates as JSONB documents.
+
+    With `trusted_reads=True` rows are hydrated with model_construct instead
+    of being revalidated. Every finder also takes `fields` to load only part
+    of the document; projected candidates are always constructed without
+    validation, and fields that were not requested keep their defaults
+    (see `model_fields_set`).
+
+    With `prepared=True`, whole-document find_by_id and find_by_ids run as
+    server-side prepared statements, PREPAREd once per pooled connection.
+    """
+
+    def __init__(self, session: Session, trusted_reads: bool = False, prepared: bool = False):
         self.session = session
-    
+        self.trusted_reads = trusted_reads
+        self.prepared = prepared
+
+    @instrumented
     def save(self, candidate: Candidate) -> Candidate:
-        # Convert Pydantic model to dict for JSON storage with proper type handling
-        candidate_data = model_to_dict(candidate)
-        
-        # Check if record exists
-        db_record = self.session.query(CandidateRecord).filter(
-            CandidateRecord.id == candidate.id
-        ).first()
-        
-        if db_record:
-            # Update existing record
-            db_record.data = candidate_data
-        else:
-            # Create new record
-            db_record = CandidateRecord(
-                id=candidate.id,
-                data=candidate_data
-            )
-            self.session.add(db_record)
-            
+        # Single round trip: let PostgreSQL decide between INSERT and UPDATE
+        self.session.execute(upsert_batch_statement([candidate]))
         self.session.commit()
         return candidate
-    
-    def find_by_id(self, id: UUID) -> Optional[Candidate]:
-        db_record = self.session.query(CandidateRecord).filter(
-            CandidateRecord.id == id
-        ).first()
-        
-        if not db_record:
+
+    @instrumented
+    def save_many(self, candidates: Iterable[Candidate],
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[UpsertBatchResult]:
+        """Upsert candidates with one statement and one commit per batch.
+
+        Returns the inserted/updated counts of every batch in order.
+        """
+        results = []
+        for batch_number, batch in enumerate(chunked(candidates, batch_size), start=1):
+            returned = self.session.execute(upsert_batch_statement(batch)).all()
+            self.session.commit()
+            results.append(upsert_batch_result(batch_number, returned))
+        return results
+
+    @instrumented
+    def find_by_id(self, id: UUID, fields: Optional[Sequence[str]] = None) -> Optional[Candidate]:
+        row = self._execute(find_by_id_statement(id, fields),
+                            FIND_BY_ID_PREPARED if fields is None else None).first()
+
+        if not row:
             return None
-            
-        # Convert JSON data back to Pydantic model
-        return dict_to_model(db_record.data, Candidate)
-    
-    def find_by_name_or_email(self, search_term: str) -> List[Candidate]:
+
+        return hydrate_rows([row], fields, self.trusted_reads)[0]
+
+    @instrumented
+    def find_by_ids(self, ids: Sequence[UUID], fields: Optional[Sequence[str]] = None,
+                    chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE) -> List[Optional[Candidate]]:
+        """Load many candidates with one query per chunk of ids.
+
+        Results follow the order of `ids`, with None for ids that do not exist.
+        """
+        ids = list(ids)
+        found = {}
+        # dict.fromkeys drops repeated ids but keeps their first position
+        for chunk in chunked(dict.fromkeys(ids), chunk_size):
+            rows = self._execute(find_by_ids_statement(chunk, fields),
+                                 FIND_BY_IDS_PREPARED if fields is None else None).all()
+            found.update(candidates_by_id(rows, fields, self.trusted_reads))
+        return [found.get(id) for id in ids]
+
+    @instrumented
+    def find_by_name_or_email(self, search_term: str, limit: Optional[int] = None,
+                              after: Optional[str] = None,
+                              order: CandidateOrder = CandidateOrder.CREATED,
+                              fields: Optional[Sequence[str]] = None) -> Page[Candidate]:
         """Search candidates by name or email using JSONB operators"""
-        records = self.session.query(CandidateRecord).filter(
-            or_(
-                func.lower(CandidateRecord.data['full_name'].astext).like(f"%{search_term.lower()}%"),
-                func.lower(CandidateRecord.data['email'].astext).like(f"%{search_term.lower()}%")
-            )
-        ).all()
-        
-        return [Candidate.model_validate(record.data) for record in records]
-    
-    def find_by_skills(self, skills: List[str]) -> List[Candidate]:
+        return self._find_page(name_or_email_filter(search_term), limit, after, order, fields)
+
+    @instrumented
+    def find_by_skills(self, skills: List[str], limit: Optional[int] = None,
+                       after: Optional[str] = None,
+                       order: CandidateOrder = CandidateOrder.CREATED,
+                       fields: Optional[Sequence[str]] = None) -> Page[Candidate]:
         """Find candidates with specific skills using JSON querying"""
-        records = self.session.query(CandidateRecord).filter(
-            # PostgreSQL JSONB containment operator @>
-            CandidateRecord.data['skills'].contains(skills)
-        ).all()
-        
-        return [Candidate.model_validate(record.data) for record in records] 
\ No newline at end of file
+        return self._find_page(skills_filter(skills), limit, after, order, fields)
+
+    @instrumented
+    def iter_all(self, fetch_size: int = DEFAULT_FETCH_SIZE,
+                 fields: Optional[Sequence[str]] = None) -> Iterator[Candidate]:
+        """Stream every candidate without loading the table into memory"""
+        return self._stream(ALL_CANDIDATES, fetch_size, fields)
+
+    @instrumented
+    def iter_embeddings(self, fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[Tuple[List[UUID], np.ndarray]]:
+        """Stream the stored embeddings as (ids, vectors) batches of up to
+        `fetch_size` rows. Rows the backfill has not reached are embedded on
+        the fly."""
+        result = self.session.execute(embeddings_statement(fetch_size))
+        try:
+            for partition in result.partitions():
+                vectors = stored_embeddings(
+                    [row[-1] for row in partition],
+                    lambda rows: hydrate_rows([partition[row][:-1] for row in rows], EMBEDDING_FIELDS, True),
+                )
+                yield [row[0] for row in partition], vectors
+        finally:
+            result.close()
+
+    @instrumented
+    def iter_by_name_or_email(self, search_term: str,
+                              fetch_size: int = DEFAULT_FETCH_SIZE,
+                              fields: Optional[Sequence[str]] = None) -> Iterator[Candidate]:
+        """Streaming variant of find_by_name_or_email"""
+        return self._stream(name_or_email_filter(search_term), fetch_size, fields)
+
+    @instrumented
+    def iter_by_skills(self, skills: List[str],
+                       fetch_size: int = DEFAULT_FETCH_SIZE,
+                       fields: Optional[Sequence[str]] = None) -> Iterator[Candidate]:
+        """Streaming variant of find_by_skills"""
+        return self._stream(skills_filter(skills), fetch_size, fields)
+
+    @instrumented
+    def changes_since(self, after: Optional[ChangeWatermark],
+                      limit: int = DEFAULT_CATCH_UP_SIZE) -> CandidateChangeBatch:
+        """Up to `limit` upserts and deletions after a watermark, for change
+        feed catch-up. Call again with the returned watermark until the
+        batch comes back empty (watermark None)."""
+        upserts = self.session.execute(upserts_since_statement(after, limit)).all()
+        deletions = self.session.execute(deletions_since_statement(after, limit)).all()
+        return merge_changes(upserts, deletions, limit, self.trusted_reads)
+
+    @instrumented
+    def load_changes(self, pending: Dict[UUID, ChangeOp],
+                     chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE) -> CandidateChangeBatch:
+        """Turn notified ids into a batch holding their current state."""
+        rows = []
+        for chunk in chunked(pending, chunk_size):
+            rows.extend(self.session.execute(changed_rows_statement(chunk)).all())
+        return changed_rows_batch(pending, rows, self.trusted_reads)
+
+    @instrumented
+    def latest_watermark(self) -> Optional[ChangeWatermark]:
+        """Position of the newest change, where a listener without history starts."""
+        rows = [self.session.execute(stmt).first() for stmt in latest_change_statements()]
+        return max((ChangeWatermark(*row) for row in rows if row), default=None)
+
+    @instrumented
+    def prune_deletions(self, before: datetime) -> int:
+        """Drop tombstones older than `before`. Listeners whose watermark is
+        older than that can no longer catch up and must reload instead."""
+        result = self.session.execute(prune_deletions_statement(before))
+        self.session.commit()
+        return result.rowcount
+
+    def _execute(self, bound: BoundStatement, prepared: Optional[PreparedLookup]):
+        if not self.prepared or prepared is None:
+            return self.session.execute(*bound)
+        connection = self.session.connection()
+        # connection.info lives as long as the DBAPI connection, like the
+        # prepared statements themselves; a replaced connection starts empty
+        names = connection.info.setdefault("prepared_statements", set())
+        if prepared.name not in names:
+            connection.exec_driver_sql(prepared.prepare_sql)
+            names.add(prepared.name)
+        return connection.execute(prepared.execute, bound.params)
+
+    def _find_page(self, bound: BoundFilter, limit: Optional[int], after: Optional[str],
+                   order: CandidateOrder, fields: Optional[Sequence[str]]) -> Page[Candidate]:
+        query = page_query(bound, limit, after, order, fields)
+        rows = self.session.execute(query.statement, query.params).all()
+        return build_page(query, rows, self.trusted_reads)
+
+    def _stream(self, bound: BoundFilter, fetch_size: int,
+                fields: Optional[Sequence[str]]) -> Iterator[Candidate]:
+        # yield_per implies stream_results, so psycopg2 uses a named
+        # server-side cursor and only `fetch_size` rows are in memory at once.
+        # The cursor lives in the session's transaction: consume the iterator
+        # before committing the session.
+        result = self.session.execute(*stream_statement(bound, fields, fetch_size))
+        try:
+            for partition in result.partitions():
+                yield from hydrate_rows(partition, fields, self.trusted_reads)
+        finally:
+            result.close()
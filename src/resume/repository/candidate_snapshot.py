@@ -0,0 +1,392 @@
+"""
+Columnar on-disk snapshot of every candidate, for fast warm starts.
+
+A snapshot directory holds generations (gen-000001, ...) and a CURRENT
+file naming the newest one. A generation is a set of .npy files, one per
+array:
+
+    ids.npy                    (n, 16) uint8, the UUID bytes
+    experience_years.npy       int32
+    embeddings.npy             (n, EMBEDDING_DIMENSIONS) float32
+    <string field>.offsets.npy / .blob.npy [/ .valid.npy]   see utils.columnar
+    <list field>.indptr.npy / .indices.npy / .vocabulary.*  see utils.columnar
+
+plus manifest.json with the row count and the change feed watermark the
+snapshot is current up to. CandidateSnapshot.open maps every array with
+np.load(mmap_mode="r"): nothing is read until used, and processes opening
+the same generation share its pages through the OS page cache instead of
+each running SELECT * and validating a Candidate per row.
+
+refresh_snapshot brings a snapshot up to date from the change feed (rows
+written or deleted after its watermark) and writes the result as the next
+generation; readers keep the generation they opened until they reopen.
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
+import numpy as np
+from sqlalchemy import Text, cast, select
+from sqlalchemy.orm import Session
+from src.resume.models import Candidate
+from src.resume.repository.candidate_changes import (
+    DEFAULT_CATCH_UP_OVERLAP, DEFAULT_CATCH_UP_SIZE, ChangeWatermark, latest_change_statements,
+)
+from src.resume.repository.candidate_queries import (
+    DEFAULT_FETCH_SIZE, construct_candidate, payload_columns,
+)
+from src.resume.repository.db_models import CandidateRecord
+from src.resume.utils.columnar import ListColumn, StringColumn, encode_lists
+from src.resume.utils.embedding import EMBEDDING_DIMENSIONS, embed_candidates, stored_embeddings
+
+SNAPSHOT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+
+# Older generations are deleted once this many newer ones exist. Processes
+# that still map a deleted generation keep reading it (POSIX unlink semantics)
+KEEP_GENERATIONS = 2
+
+STRING_FIELDS = ("full_name", "email", "phone", "location", "education")
+LIST_FIELDS = ("skills", "preferred_job_types")
+SNAPSHOT_FIELDS = STRING_FIELDS + LIST_FIELDS + ("experience_years",)
+
+PathLike = Union[str, Path]
+
+def uuids_to_array(ids: Sequence[UUID]) -> np.ndarray:
+    raw = b"".join(id.bytes for id in ids)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(ids), 16).copy()
+
+def array_to_uuids(ids: np.ndarray) -> List[UUID]:
+    raw = ids.tobytes()
+    return [UUID(bytes=raw[start:start + 16]) for start in range(0, len(raw), 16)]
+
+@dataclass
+class SnapshotColumns:
+    """Every column of a snapshot, in memory or memory-mapped."""
+    ids: np.ndarray
+    experience_years: np.ndarray
+    embeddings: np.ndarray
+    strings: Dict[str, StringColumn]
+    lists: Dict[str, ListColumn]
+
+    def __len__(self) -> int:
+        return self.ids.shape[0]
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """File name (without .npy) -> array."""
+        arrays = {"ids": self.ids, "experience_years": self.experience_years, "embeddings": self.embeddings}
+        for columns in (self.strings, self.lists):
+            for field, column in columns.items():
+                arrays.update({f"{field}.{part}": array for part, array in column.arrays().items()})
+        return arrays
+
+class SnapshotBuilder:
+    """Accumulates rows chunk by chunk and assembles the columns once.
+
+    List fields are coded against one vocabulary per field; pass the
+    vocabularies of an existing snapshot (`codes`) to keep its codes valid.
+    """
+
+    def __init__(self, codes: Optional[Dict[str, Dict[str, int]]] = None):
+        self.codes = codes or {field: {} for field in LIST_FIELDS}
+        self._ids: List[np.ndarray] = []
+        self._experience: List[np.ndarray] = []
+        self._embeddings: List[np.ndarray] = []
+        self._strings: Dict[str, List[StringColumn]] = {field: [] for field in STRING_FIELDS}
+        self._lists: Dict[str, list] = {field: [] for field in LIST_FIELDS}
+
+    def add_rows(self, ids: Sequence[UUID], values: Dict[str, Sequence], embeddings: np.ndarray) -> None:
+        """Add rows given as one sequence of values per field (see SNAPSHOT_FIELDS)."""
+        self._ids.append(uuids_to_array(ids))
+        self._experience.append(np.asarray(values["experience_years"], dtype=np.int32))
+        self._embeddings.append(np.asarray(embeddings, dtype=np.float32))
+        for field in STRING_FIELDS:
+            self._strings[field].append(StringColumn.encode(values[field]))
+        for field in LIST_FIELDS:
+            self._lists[field].append(encode_lists(values[field], self.codes[field]))
+
+    def add_candidates(self, candidates: Sequence[Candidate]) -> None:
+        values = {field: [getattr(c, field) for c in candidates] for field in SNAPSHOT_FIELDS}
+        self.add_rows([c.id for c in candidates], values, embed_candidates(candidates))
+
+    def add_columns(self, columns: SnapshotColumns) -> None:
+        """Add already encoded rows, coded against this builder's vocabularies."""
+        self._ids.append(np.asarray(columns.ids))
+        self._experience.append(np.asarray(columns.experience_years))
+        self._embeddings.append(np.asarray(columns.embeddings))
+        for field in STRING_FIELDS:
+            self._strings[field].append(columns.strings[field])
+        for field in LIST_FIELDS:
+            self._lists[field].append((columns.lists[field].indptr, columns.lists[field].indices))
+
+    def build(self) -> SnapshotColumns:
+        return SnapshotColumns(
+            ids=np.concatenate(self._ids) if self._ids else np.zeros((0, 16), dtype=np.uint8),
+            experience_years=np.concatenate(self._experience) if self._experience else np.zeros(0, dtype=np.int32),
+            embeddings=(np.concatenate(self._embeddings) if self._embeddings
+                        else np.zeros((0, EMBEDDING_DIMENSIONS), dtype=np.float32)),
+            strings={field: StringColumn.concat(parts) for field, parts in self._strings.items()},
+            lists={field: ListColumn.concat(parts, self.codes[field]) for field, parts in self._lists.items()},
+        )
+
+class CandidateSnapshot:
+    """One generation of a snapshot, memory-mapped read-only."""
+
+    def __init__(self, path: Path, columns: SnapshotColumns, watermark: Optional[ChangeWatermark]):
+        self.path = path
+        self.columns = columns
+        self.watermark = watermark
+        self._rows: Optional[Dict[UUID, int]] = None
+
+    @classmethod
+    def open(cls, root: PathLike) -> "CandidateSnapshot":
+        root = Path(root)
+        path = root / (root / CURRENT_FILE).read_text().strip()
+        manifest = json.loads((path / MANIFEST_FILE).read_text())
+        if manifest["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {manifest['version']} in {path}")
+
+        def load(name: str) -> Optional[np.ndarray]:
+            file = path / f"{name}.npy"
+            return np.load(file, mmap_mode="r") if file.exists() else None
+
+        def strings(name: str) -> StringColumn:
+            return StringColumn(load(f"{name}.offsets"), load(f"{name}.blob"), load(f"{name}.valid"))
+
+        columns = SnapshotColumns(
+            ids=load("ids"),
+            experience_years=load("experience_years"),
+            embeddings=load("embeddings"),
+            strings={field: strings(field) for field in STRING_FIELDS},
+            lists={
+                field: ListColumn(load(f"{field}.indptr"), load(f"{field}.indices"),
+                                  strings(f"{field}.vocabulary"))
+                for field in LIST_FIELDS
+            },
+        )
+        watermark = manifest["watermark"]
+        if watermark is not None:
+            watermark = ChangeWatermark(datetime.fromisoformat(watermark["changed_at"]), UUID(watermark["id"]))
+        return cls(path, columns, watermark)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.columns.ids
+
+    @property
+    def experience_years(self) -> np.ndarray:
+        return self.columns.experience_years
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        return self.columns.embeddings
+
+    @property
+    def strings(self) -> Dict[str, StringColumn]:
+        return self.columns.strings
+
+    @property
+    def lists(self) -> Dict[str, ListColumn]:
+        return self.columns.lists
+
+    def id_list(self) -> List[UUID]:
+        return array_to_uuids(self.columns.ids)
+
+    def row_of(self, id: UUID) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {id: row for row, id in enumerate(self.id_list())}
+        return self._rows.get(id)
+
+    def rows_of(self, ids: Iterable[UUID]) -> np.ndarray:
+        """Rows holding any of the given ids, in row order, without a dict of all ids."""
+        wanted = {id.bytes for id in ids}
+        if not wanted or len(self) == 0:
+            return np.zeros(0, dtype=np.int64)
+        # First 8 bytes as an integer narrow the search; the full id confirms it
+        prefixes = np.frombuffer(b"".join(key[:8] for key in wanted), dtype=np.uint64)
+        maybe = np.flatnonzero(np.isin(self.columns.ids.view(np.uint64)[:, 0], prefixes))
+        return np.array([row for row in maybe.tolist() if self.columns.ids[row].tobytes() in wanted],
+                        dtype=np.int64)
+
+    def candidate(self, row: int) -> Candidate:
+        """The candidate at a row, built without validation (it was valid when saved)."""
+        payload = {field: self.columns.strings[field][row] for field in STRING_FIELDS}
+        payload.update({field: self.columns.lists[field][row] for field in LIST_FIELDS})
+        payload["experience_years"] = int(self.columns.experience_years[row])
+        payload["id"] = UUID(bytes=self.columns.ids[row].tobytes())
+        return construct_candidate(payload)
+
+    def candidates(self) -> Iterator[Candidate]:
+        """Every candidate, decoding each column once rather than row by row."""
+        values = {field: self.columns.strings[field].to_list() for field in STRING_FIELDS}
+        for field in LIST_FIELDS:
+            column = self.columns.lists[field]
+            terms = column.terms
+            indptr = column.indptr.tolist()
+            codes = column.indices.tolist()
+            values[field] = [[terms[code] for code in codes[start:stop]]
+                             for start, stop in zip(indptr, indptr[1:])]
+        values["experience_years"] = self.columns.experience_years.tolist()
+        ids = self.id_list()
+        for row, id in enumerate(ids):
+            payload = {field: column[row] for field, column in values.items()}
+            payload["id"] = id
+            yield construct_candidate(payload)
+
+    def take(self, rows: np.ndarray) -> SnapshotColumns:
+        """The given rows as in-memory columns (coded like this snapshot)."""
+        columns = self.columns
+        return SnapshotColumns(
+            ids=columns.ids[rows],
+            experience_years=columns.experience_years[rows],
+            embeddings=columns.embeddings[rows],
+            strings={field: column.take(rows) for field, column in columns.strings.items()},
+            lists={field: column.take(rows) for field, column in columns.lists.items()},
+        )
+
+    def vocabularies(self) -> Dict[str, Dict[str, int]]:
+        return {field: {term: code for code, term in enumerate(column.terms)}
+                for field, column in self.columns.lists.items()}
+
+def write_snapshot(root: PathLike, columns: SnapshotColumns,
+                   watermark: Optional[ChangeWatermark]) -> CandidateSnapshot:
+    """Write columns as the next generation, make it CURRENT and prune old ones."""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    generations = _generations(root)
+    name = f"gen-{(int(generations[-1].name[4:]) + 1) if generations else 1:06d}"
+
+    # Written under a temporary name and renamed, so a generation is either
+    # complete or absent, and CURRENT is swapped with an atomic os.replace
+    staging = root / f".{name}-{uuid4().hex}"
+    staging.mkdir()
+    try:
+        for file, array in columns.arrays().items():
+            np.save(staging / f"{file}.npy", np.ascontiguousarray(array))
+        (staging / MANIFEST_FILE).write_text(json.dumps({
+            "version": SNAPSHOT_VERSION,
+            "rows": len(columns),
+            "created_at": datetime.now().isoformat(),
+            "watermark": None if watermark is None else {
+                "changed_at": watermark.changed_at.isoformat(), "id": str(watermark.id),
+            },
+        }))
+        os.rename(staging, root / name)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    current = root / f".{CURRENT_FILE}-{uuid4().hex}"
+    current.write_text(name)
+    os.replace(current, root / CURRENT_FILE)
+
+    for old in _generations(root)[:-KEEP_GENERATIONS]:
+        shutil.rmtree(old, ignore_errors=True)
+    return CandidateSnapshot.open(root)
+
+def _generations(root: Path) -> List[Path]:
+    return sorted(path for path in root.glob("gen-*") if path.is_dir())
+
+def snapshot_candidates(root: PathLike, candidates: Iterable[Candidate],
+                        watermark: Optional[ChangeWatermark] = None,
+                        chunk_size: int = DEFAULT_FETCH_SIZE) -> CandidateSnapshot:
+    """Snapshot of candidates that are already in memory."""
+    builder = SnapshotBuilder()
+    chunk = []
+    for candidate in candidates:
+        chunk.append(candidate)
+        if len(chunk) == chunk_size:
+            builder.add_candidates(chunk)
+            chunk = []
+    if chunk:
+        builder.add_candidates(chunk)
+    return write_snapshot(root, builder.build(), watermark)
+
+def export_statement(fetch_size: int):
+    """Projected fields plus the stored embedding as text, parsed in bulk
+    by parse_vectors rather than row by row by the Vector type."""
+    return select(*payload_columns(SNAPSHOT_FIELDS), cast(CandidateRecord.embedding, Text)).execution_options(
+        yield_per=fetch_size)
+
+def build_snapshot(session: Session, root: PathLike,
+                   fetch_size: int = DEFAULT_FETCH_SIZE) -> CandidateSnapshot:
+    """Export every candidate from the database into a new generation.
+
+    Rows are read as projected JSON values, never as validated Candidate
+    models. The watermark is read first, in the same transaction: a change
+    committed during the export is then replayed by the next refresh,
+    which is harmless, instead of being missed.
+    """
+    latest = [session.execute(stmt).first() for stmt in latest_change_statements()]
+    watermark = max((ChangeWatermark(*row) for row in latest if row), default=None)
+
+    builder = SnapshotBuilder()
+    names = ["id"] + list(SNAPSHOT_FIELDS)
+    result = session.execute(export_statement(fetch_size))
+    try:
+        for partition in result.partitions():
+            payloads = [dict(zip(names, row[:-1])) for row in partition]
+            for payload in payloads:
+                # Same defaults as the model for keys missing from the document
+                payload["experience_years"] = payload["experience_years"] or 0
+                for field in LIST_FIELDS:
+                    payload[field] = payload[field] or []
+            embeddings = _embeddings([row[-1] for row in partition], payloads)
+            builder.add_rows([payload["id"] for payload in payloads],
+                             {field: [payload[field] for payload in payloads] for field in SNAPSHOT_FIELDS},
+                             embeddings)
+    finally:
+        result.close()
+    return write_snapshot(root, builder.build(), watermark)
+
+def _embeddings(texts: List[Optional[str]], payloads: List[Dict]) -> np.ndarray:
+    """Stored embeddings, computed here for rows the backfill has not reached."""
+    return stored_embeddings(texts, lambda rows: [construct_candidate(payloads[row]) for row in rows])
+
+def refresh_snapshot(root: PathLike, repository,
+                     overlap: timedelta = DEFAULT_CATCH_UP_OVERLAP,
+                     batch_size: int = DEFAULT_CATCH_UP_SIZE) -> CandidateSnapshot:
+    """Apply the changes after the snapshot's watermark as a new generation.
+
+    Only changed rows are read from the database (repository.changes_since,
+    by updated_at and id); unchanged rows are copied array by array from
+    the current generation. Returns the current snapshot unchanged when
+    nothing changed.
+    """
+    snapshot = CandidateSnapshot.open(root)
+    after = snapshot.watermark
+    if after is not None:
+        # updated_at is the transaction start: re-read a margin before it
+        after = ChangeWatermark(after.changed_at - overlap, after.id)
+
+    changed: Dict[UUID, Optional[Candidate]] = {}
+    watermark = snapshot.watermark
+    while True:
+        batch = repository.changes_since(after, batch_size)
+        if batch.watermark is None:
+            break
+        for candidate in batch.upserted:
+            changed[candidate.id] = candidate
+        for id in batch.deleted:
+            changed[id] = None
+        after = batch.watermark
+        watermark = batch.watermark if watermark is None else max(watermark, batch.watermark)
+    if not changed:
+        return snapshot
+
+    keep = np.ones(len(snapshot), dtype=bool)
+    keep[snapshot.rows_of(changed)] = False
+    builder = SnapshotBuilder(snapshot.vocabularies())
+    builder.add_columns(snapshot.take(np.flatnonzero(keep)))
+    upserted = [candidate for candidate in changed.values() if candidate is not None]
+    if upserted:
+        builder.add_candidates(upserted)
+    return write_snapshot(root, builder.build(), watermark)
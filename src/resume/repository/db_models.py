@@ -1,10 +1,34 @@
-from sqlalchemy import Column, String, DateTime, func
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Computed, Float, Integer, String, Text, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import UserDefinedType
+import numpy as np
 import uuid
+from src.resume.utils.embedding import EMBEDDING_DIMENSIONS, format_vector, parse_vector
 
 Base = declarative_base()
 
+class Vector(UserDefinedType):
+    """pgvector `vector(n)` column, read and written as float32 numpy arrays"""
+    cache_ok = True
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    def get_col_spec(self, **kw):
+        return f"VECTOR({self.dimensions})"
+
+    def bind_processor(self, dialect):
+        # Sent in pgvector's text form, which needs no driver-side adapter
+        def process(value):
+            return None if value is None else format_vector(np.asarray(value, dtype=np.float32))
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return None if value is None else parse_vector(value)
+        return process
+
 class CandidateRecord(Base):
     __tablename__ = "candidates"
     
@@ -12,4 +36,60 @@ class CandidateRecord(Base):
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     data = Column(JSONB, nullable=False)  # Stores the entire Candidate as JSON
-    
\ No newline at end of file
+
+    # Typed copies of hot fields, maintained by PostgreSQL from `data`.
+    # Read and filter on these; never write them (data stays the source of truth)
+    experience_years = Column(Integer, Computed("(data ->> 'experience_years')::int", persisted=True))
+    location = Column(Text, Computed("data ->> 'location'", persisted=True))
+    email_lower = Column(Text, Computed("lower(data ->> 'email')", persisted=True))
+    full_name_lower = Column(Text, Computed("lower(data ->> 'full_name')", persisted=True))
+
+    # Hashed-feature profile embedding (see utils.embedding), written with
+    # every save and COPY. Similarity queries are served in-process by
+    # services.similarity_index; the column keeps the vectors queryable in SQL
+    embedding = Column(Vector(EMBEDDING_DIMENSIONS), nullable=True)
+
+class CandidateDeletionRecord(Base):
+    """Tombstones written by the candidates delete trigger.
+
+    A deleted row leaves nothing behind for the change feed's watermark
+    query to find, so the trigger records the id and time here instead.
+    """
+    __tablename__ = "candidate_deletions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    deleted_at = Column(DateTime, nullable=False, server_default=func.now())
+    
+class JobRecord(Base):
+    __tablename__ = "jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    data = Column(JSONB, nullable=False)  # Stores the entire Job as JSON
+    # Searched through expression indexes on `data`, see job_queries
+
+class ResumeRecord(Base):
+    __tablename__ = "resumes"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    data = Column(JSONB, nullable=False)  # Stores the entire Resume as JSON
+
+    candidate_id = Column(UUID(as_uuid=True), Computed("(data ->> 'candidate_id')::uuid", persisted=True))
+    # Full-text document kept in sync by PostgreSQL, see resume_queries.
+    # Skills weigh more (A) than the body of the resume (B) when ranking
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(jsonb_to_tsvector('english', coalesce(data -> 'extracted_skills', '[]'), '[\"string\"]'), 'A')"
+        " || setweight(to_tsvector('english', coalesce(data ->> 'raw_text', '')), 'B')",
+        persisted=True,
+    ))
+
+class AnalyticsRefreshRecord(Base):
+    """When each analytics materialized view was last refreshed (see analytics_queries)."""
+    __tablename__ = "analytics_refreshes"
+
+    view_name = Column(Text, primary_key=True)
+    refreshed_at = Column(DateTime, nullable=False)
+    duration_seconds = Column(Float, nullable=False)
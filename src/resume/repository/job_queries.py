@@ -0,0 +1,114 @@
+"""
+Statement building and hydration for JobRepository.
+
+The filters below are written to be identical to the expression indexes
+created by the jobs migration; the planner only uses an expression index
+when the query repeats its expression exactly.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+from sqlalchemy import Integer, and_, cast, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import array
+from src.resume.models import Candidate, Job
+from src.resume.repository.db_models import JobRecord
+from src.resume.repository.pagination import Page, decode_cursor, encode_cursor
+from src.resume.utils.json_utils import dicts_to_models
+
+def _json_field(key: str):
+    # Key rendered inline, see candidate_queries._json_field
+    return JobRecord.data[literal_column(f"'{key}'")]
+
+# (data -> 'required_skills'), GIN jsonb_ops index ix_jobs_required_skills
+required_skills = _json_field('required_skills')
+# ((data ->> 'min_experience')::int), index ix_jobs_min_experience
+min_experience = cast(_json_field('min_experience').astext, Integer)
+# (data ->> 'job_type'), index ix_jobs_job_type
+job_type = _json_field('job_type').astext
+
+def construct_job(payload: Dict) -> Job:
+    """Build a Job from trusted stored data without validation."""
+    values = dict(payload)
+    if isinstance(values.get('id'), str):
+        values['id'] = UUID(values['id'])
+    return Job.model_construct(**values)
+
+def hydrate_jobs(payloads: List[Dict], trusted: bool = False) -> List[Job]:
+    if trusted:
+        return [construct_job(payload) for payload in payloads]
+    return dicts_to_models(payloads, Job)
+
+def required_skills_subset_filter(skills: Sequence[str]):
+    """Jobs whose required skills are all among `skills`."""
+    # GIN cannot serve <@ ("required skills are a subset of mine"), so
+    # ?| ("requires at least one of my skills") finds the rows through the
+    # index and <@ rechecks them. Jobs requiring nothing never match ?|
+    # and come from the skill count index instead.
+    no_requirements = func.jsonb_array_length(required_skills) == 0
+    skills = list(dict.fromkeys(skills))
+    if not skills:
+        return no_requirements
+    return or_(
+        and_(required_skills.has_any(array(skills)), required_skills.contained_by(skills)),
+        no_requirements,
+    )
+
+def qualifying_filter(candidate: Candidate):
+    """Jobs the candidate qualifies for, as a WHERE clause.
+
+    A job qualifies when every required skill is among the candidate's
+    skills, the candidate has at least min_experience years, and the job
+    type is one of the candidate's preferred types (any type when the
+    candidate has no preference). Skills and job types match exactly, as
+    in CandidateRepository.find_by_skills.
+    """
+    conditions = [
+        required_skills_subset_filter(candidate.skills),
+        min_experience <= candidate.experience_years,
+    ]
+    if candidate.preferred_job_types:
+        conditions.append(job_type.in_(list(candidate.preferred_job_types)))
+    return and_(*conditions)
+
+def find_by_id_statement(id: UUID):
+    return select(JobRecord.data).where(JobRecord.id == id)
+
+# Jobs are paged oldest first on (created_at, id), like CandidateOrder.CREATED;
+# the order name keeps candidate cursors from being used for jobs
+JOB_ORDER = "jobs_created"
+_SORT_COLUMNS = (JobRecord.created_at, JobRecord.id)
+_CURSOR_PARSERS = (datetime.fromisoformat, UUID)
+
+def select_jobs(condition=None, limit: Optional[int] = None, after: Optional[str] = None):
+    """Jobs matching `condition`, oldest first, as one keyset page.
+
+    The sort key is selected after the payload for job_page's cursor, and
+    one extra row is fetched to learn whether another page exists.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    stmt = select(JobRecord.data, *_SORT_COLUMNS)
+    if condition is not None:
+        stmt = stmt.where(condition)
+    if after is not None:
+        last_seen = decode_cursor(after, JOB_ORDER, _CURSOR_PARSERS)
+        stmt = stmt.where(tuple_(*_SORT_COLUMNS) > tuple(last_seen))
+    stmt = stmt.order_by(*_SORT_COLUMNS)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+def job_page(rows, limit: Optional[int], trusted: bool) -> Page[Job]:
+    """Turn the rows fetched by select_jobs into a Page."""
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(JOB_ORDER, rows[-1][1:])
+    return Page(items=hydrate_jobs([row[0] for row in rows], trusted), next_cursor=next_cursor)
+
+def stream_statement(condition, fetch_size: int):
+    stmt = select(JobRecord.data)
+    if condition is not None:
+        stmt = stmt.where(condition)
+    return stmt.execution_options(yield_per=fetch_size)
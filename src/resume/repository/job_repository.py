@@ -0,0 +1,78 @@
+from typing import Iterable, Iterator, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from src.database.instrumentation import instrumented
+from src.resume.models import Candidate, Job
+from src.resume.repository.candidate_queries import (
+    UpsertBatchResult, DEFAULT_BATCH_SIZE, DEFAULT_FETCH_SIZE,
+    upsert_batch_result, upsert_batch_statement,
+)
+from src.resume.repository.db_models import JobRecord
+from src.resume.repository.job_queries import (
+    find_by_id_statement, hydrate_jobs, job_page, qualifying_filter, select_jobs, stream_statement,
+)
+from src.resume.repository.pagination import Page
+from src.resume.utils.batching import chunked
+
+class JobRepository:
+    """Stores jobs as JSONB documents, like CandidateRepository does candidates.
+
+    Besides the usual writes and reads it answers the reverse question of
+    candidate search: which jobs does a given candidate qualify for.
+    """
+
+    def __init__(self, session: Session, trusted_reads: bool = False):
+        self.session = session
+        self.trusted_reads = trusted_reads
+
+    @instrumented
+    def save(self, job: Job) -> Job:
+        self.session.execute(upsert_batch_statement([job], JobRecord))
+        self.session.commit()
+        return job
+
+    @instrumented
+    def save_many(self, jobs: Iterable[Job],
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[UpsertBatchResult]:
+        """Upsert jobs with one statement and one commit per batch."""
+        results = []
+        for batch_number, batch in enumerate(chunked(jobs, batch_size), start=1):
+            returned = self.session.execute(upsert_batch_statement(batch, JobRecord)).all()
+            self.session.commit()
+            results.append(upsert_batch_result(batch_number, returned))
+        return results
+
+    @instrumented
+    def find_by_id(self, id: UUID) -> Optional[Job]:
+        row = self.session.execute(find_by_id_statement(id)).first()
+        if not row:
+            return None
+        return hydrate_jobs([row[0]], self.trusted_reads)[0]
+
+    @instrumented
+    def find_for_candidate(self, candidate: Candidate, limit: Optional[int] = None,
+                           after: Optional[str] = None) -> Page[Job]:
+        """Jobs the candidate qualifies for (see job_queries.qualifying_filter),
+        oldest first. Pass a page's next_cursor as `after` for the next page."""
+        rows = self.session.execute(select_jobs(qualifying_filter(candidate), limit, after)).all()
+        return job_page(rows, limit, self.trusted_reads)
+
+    @instrumented
+    def iter_all(self, fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[Job]:
+        """Stream every job without loading the table into memory"""
+        return self._stream(None, fetch_size)
+
+    @instrumented
+    def iter_for_candidate(self, candidate: Candidate,
+                           fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[Job]:
+        """Streaming variant of find_for_candidate"""
+        return self._stream(qualifying_filter(candidate), fetch_size)
+
+    def _stream(self, condition, fetch_size: int) -> Iterator[Job]:
+        # Server-side cursor, see CandidateRepository._stream
+        result = self.session.execute(stream_statement(condition, fetch_size))
+        try:
+            for partition in result.partitions():
+                yield from hydrate_jobs([row[0] for row in partition], self.trusted_reads)
+        finally:
+            result.close()
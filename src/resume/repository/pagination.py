@@ -0,0 +1,55 @@
+"""Keyset (seek) pagination primitives shared by the repositories."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, List, Optional, Sequence, TypeVar
+from src.resume.utils.json_utils import dumps
+
+T = TypeVar('T')
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor for the page after it.
+
+    `next_cursor` is None on the last page. A Page iterates and indexes like
+    the list of its items, so callers that only need the rows can ignore it.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+def encode_cursor(order: str, values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque token."""
+    payload = dumps({"o": order, "k": list(values)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, order: str, parsers: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """Decode a cursor produced by encode_cursor for the given sort order.
+
+    Raises ValueError if the cursor is malformed or was issued for a
+    different ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["k"]
+        if payload["o"] != order or len(values) != len(parsers):
+            raise ValueError(f"Cursor was not issued for order '{order}'")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (binascii.Error, json.JSONDecodeError, UnicodeDecodeError,
+            KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
@@ -0,0 +1,116 @@
+"""
+Statement building and hydration for ResumeRepository.
+
+Search runs against the generated `search_vector` column, so the GIN index
+on it finds the matching rows; only ranking and highlighting touch the
+documents themselves.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import REAL, bindparam, cast, func, literal_column, select, tuple_
+from src.database.instrumentation import timed_hydration
+from src.resume.models import Resume
+from src.resume.repository.db_models import ResumeRecord
+from src.resume.repository.pagination import decode_cursor, encode_cursor
+from src.resume.utils.json_utils import dicts_to_models
+
+# Must be the configuration the search_vector column was generated with,
+# otherwise query lexemes and stored lexemes are stemmed differently
+TEXT_SEARCH_CONFIG = 'english'
+
+# Up to two short fragments around the matches instead of the whole text
+HEADLINE_OPTIONS = "StartSel=<b>, StopSel=</b>, MaxFragments=2, MaxWords=25, MinWords=10"
+
+DEFAULT_SEARCH_LIMIT = 20
+
+_RANK_ORDER = "rank"
+
+@dataclass
+class ResumeSearchHit:
+    """A search result: the resume, its relevance and a highlighted snippet."""
+    resume: Resume
+    rank: float
+    snippet: Optional[str] = None    # None when highlighting was not requested
+
+def hydrate_resumes(payloads: List[Dict]) -> List[Resume]:
+    # Nested experience/education entries and the timestamp need parsing,
+    # so resumes are always validated (model_construct would leave dicts)
+    with timed_hydration(len(payloads)):
+        return dicts_to_models(payloads, Resume)
+
+def _config():
+    # Rendered inline as a regconfig literal so no driver has to guess the type
+    return literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+
+def text_query(search_text: str):
+    """websearch_to_tsquery: quoted phrases, `or` and `-excluded` words, never a syntax error."""
+    return func.websearch_to_tsquery(_config(), bindparam('search_text', search_text))
+
+def matches(query):
+    return ResumeRecord.search_vector.op('@@')(query)
+
+def rank(query):
+    return func.ts_rank(ResumeRecord.search_vector, query, type_=REAL)
+
+def find_by_id_statement(id: UUID):
+    return select(ResumeRecord.data).where(ResumeRecord.id == id)
+
+def find_by_candidate_statement(candidate_id: UUID):
+    return select(ResumeRecord.data).where(
+        ResumeRecord.candidate_id == candidate_id
+    ).order_by(ResumeRecord.created_at, ResumeRecord.id)
+
+@dataclass(frozen=True)
+class SearchQuery:
+    statement: object
+    limit: int
+
+def search_statement(search_text: str, limit: int, after: Optional[str],
+                     highlight: bool) -> SearchQuery:
+    """Ranked full-text search as a keyset-paginated query.
+
+    Pages are ordered by (rank, id) descending and the next page starts
+    strictly after the previous page's last (rank, id). ts_headline re-parses
+    the whole raw text, so it is computed in an outer query over the rows
+    of the page only, never for every match.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    if not search_text.strip():
+        raise ValueError("search_text must not be empty")
+
+    query = text_query(search_text)
+    relevance = rank(query)
+    page = select(ResumeRecord.id, ResumeRecord.data, relevance.label('rank')).where(matches(query))
+
+    if after is not None:
+        last_rank, last_id = decode_cursor(after, _RANK_ORDER, (float, UUID))
+        # Compare as real, the type ts_rank returns: the cursor holds the
+        # rank as a double and would never equal the tied rows otherwise
+        page = page.where(tuple_(relevance, ResumeRecord.id) < tuple_(cast(last_rank, REAL), last_id))
+
+    # Fetch one extra row to learn whether another page exists
+    page = page.order_by(relevance.desc(), ResumeRecord.id.desc()).limit(limit + 1).subquery('page')
+
+    columns = [page.c.data, page.c.rank, page.c.id]
+    if highlight:
+        raw_text = page.c.data[literal_column("'raw_text'")].astext
+        columns.append(func.ts_headline(_config(), raw_text, query, HEADLINE_OPTIONS))
+    statement = select(*columns).order_by(page.c.rank.desc(), page.c.id.desc())
+    return SearchQuery(statement=statement, limit=limit)
+
+def search_hits(query: SearchQuery, rows):
+    """Turn rows fetched for a SearchQuery into hits and the next page's cursor."""
+    next_cursor = None
+    if len(rows) > query.limit:
+        rows = rows[:query.limit]
+        next_cursor = encode_cursor(_RANK_ORDER, [rows[-1][1], rows[-1][2]])
+
+    resumes = hydrate_resumes([row[0] for row in rows])
+    hits = [
+        ResumeSearchHit(resume=resume, rank=row[1], snippet=row[3] if len(row) > 3 else None)
+        for resume, row in zip(resumes, rows)
+    ]
+    return hits, next_cursor
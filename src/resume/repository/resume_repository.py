@@ -0,0 +1,71 @@
+from typing import Iterable, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from src.database.instrumentation import instrumented
+from src.resume.models import Resume
+from src.resume.repository.candidate_queries import (
+    UpsertBatchResult, DEFAULT_BATCH_SIZE, upsert_batch_result, upsert_batch_statement,
+)
+from src.resume.repository.db_models import ResumeRecord
+from src.resume.repository.pagination import Page
+from src.resume.repository.resume_queries import (
+    DEFAULT_SEARCH_LIMIT, ResumeSearchHit, find_by_candidate_statement, find_by_id_statement,
+    hydrate_resumes, search_hits, search_statement,
+)
+from src.resume.utils.batching import chunked
+
+class ResumeRepository:
+    """Stores resumes as JSONB documents and searches their text.
+
+    PostgreSQL derives a weighted tsvector from the extracted skills and
+    the raw text on every write, so saving needs nothing special.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @instrumented
+    def save(self, resume: Resume) -> Resume:
+        self.session.execute(upsert_batch_statement([resume], ResumeRecord))
+        self.session.commit()
+        return resume
+
+    @instrumented
+    def save_many(self, resumes: Iterable[Resume],
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[UpsertBatchResult]:
+        """Upsert resumes with one statement and one commit per batch."""
+        results = []
+        for batch_number, batch in enumerate(chunked(resumes, batch_size), start=1):
+            returned = self.session.execute(upsert_batch_statement(batch, ResumeRecord)).all()
+            self.session.commit()
+            results.append(upsert_batch_result(batch_number, returned))
+        return results
+
+    @instrumented
+    def find_by_id(self, id: UUID) -> Optional[Resume]:
+        row = self.session.execute(find_by_id_statement(id)).first()
+        if not row:
+            return None
+        return hydrate_resumes([row[0]])[0]
+
+    @instrumented
+    def find_by_candidate_id(self, candidate_id: UUID) -> List[Resume]:
+        """All resumes of a candidate, oldest first"""
+        rows = self.session.execute(find_by_candidate_statement(candidate_id)).all()
+        return hydrate_resumes([row[0] for row in rows])
+
+    @instrumented
+    def search(self, search_text: str, limit: int = DEFAULT_SEARCH_LIMIT,
+               after: Optional[str] = None, highlight: bool = True) -> Page[ResumeSearchHit]:
+        """Resumes matching a web-style query, most relevant first.
+
+        `search_text` accepts what a search box would: words, "quoted
+        phrases", `or` and `-excluded` words. Pass the previous page's
+        `next_cursor` as `after` (with the same search_text) to continue.
+        With `highlight`, every hit carries a snippet of the raw text with
+        the matches wrapped in <b>...</b>.
+        """
+        query = search_statement(search_text, limit, after, highlight)
+        rows = self.session.execute(query.statement).all()
+        hits, next_cursor = search_hits(query, rows)
+        return Page(items=hits, next_cursor=next_cursor)
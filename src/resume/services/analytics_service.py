@@ -0,0 +1,45 @@
+from datetime import timedelta
+from typing import Iterable, List, Optional
+from src.resume.repository.analytics_queries import (
+    AnalyticsReport, AnalyticsView, ExperienceCount, TermCount, ViewRefresh,
+)
+from src.resume.repository.analytics_repository import AnalyticsRepository
+
+# How old a view may get before refresh_stale rebuilds it
+DEFAULT_MAX_AGE = timedelta(minutes=15)
+
+class AnalyticsService:
+    """Dashboard numbers from the analytics views.
+
+    Reads never refresh: a dashboard request costs the size of its answer,
+    and each report says how old it is. Views are rebuilt on demand with
+    refresh(), or on a schedule with refresh_stale() (see the
+    src.database.refresh_analytics CLI).
+    """
+
+    def __init__(self, repository: AnalyticsRepository, max_age: timedelta = DEFAULT_MAX_AGE):
+        self.repository = repository
+        self.max_age = max_age
+
+    def top_skills(self, limit: int = 20) -> AnalyticsReport[TermCount]:
+        return self.repository.skill_counts(limit)
+
+    def job_type_distribution(self) -> AnalyticsReport[TermCount]:
+        return self.repository.job_type_counts()
+
+    def education_distribution(self) -> AnalyticsReport[TermCount]:
+        return self.repository.education_counts()
+
+    def experience_distribution(self) -> AnalyticsReport[ExperienceCount]:
+        return self.repository.experience_counts()
+
+    def stale_views(self) -> List[AnalyticsView]:
+        return [report.view for report in self.repository.freshness() if report.is_stale(self.max_age)]
+
+    def refresh(self, views: Optional[Iterable[AnalyticsView]] = None) -> List[ViewRefresh]:
+        return self.repository.refresh(views)
+
+    def refresh_stale(self) -> List[ViewRefresh]:
+        """Rebuild only the views older than max_age."""
+        stale = self.stale_views()
+        return self.repository.refresh(stale) if stale else []
@@ -0,0 +1,30 @@
+from typing import List, Optional
+from uuid import UUID
+from src.resume.models import Candidate
+from src.resume.repository.async_candidate_repository import AsyncCandidateRepository
+from src.resume.repository.candidate_queries import CandidateOrder
+from src.resume.repository.pagination import Page
+
+class AsyncCandidateService:
+    def __init__(self, repository: AsyncCandidateRepository):
+        self.repository = repository
+    
+    async def create_candidate(self, candidate: Candidate) -> Candidate:
+        return await self.repository.save(candidate)
+    
+    async def get_candidate(self, id: UUID) -> Optional[Candidate]:
+        return await self.repository.find_by_id(id)
+    
+    async def get_candidates(self, ids: List[UUID]) -> List[Optional[Candidate]]:
+        """Candidates in the order of `ids`, None where an id does not exist"""
+        return await self.repository.find_by_ids(ids)
+    
+    async def search_candidates(self, search_term: str, limit: Optional[int] = None,
+                                after: Optional[str] = None,
+                                order: CandidateOrder = CandidateOrder.CREATED) -> Page[Candidate]:
+        return await self.repository.find_by_name_or_email(search_term, limit=limit, after=after, order=order)
+    
+    async def find_candidates_with_skills(self, skills: List[str], limit: Optional[int] = None,
+                                          after: Optional[str] = None,
+                                          order: CandidateOrder = CandidateOrder.CREATED) -> Page[Candidate]:
+        return await self.repository.find_by_skills(skills, limit=limit, after=after, order=order)
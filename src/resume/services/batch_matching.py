@@ -0,0 +1,161 @@
+"""
+Many-jobs x many-candidates matching across a process pool.
+
+Ranking J jobs against C candidates is the product of a J x skills and a
+skills x C binary matrix. On packed bitsets each cell of that product is an
+AND + popcount over the few words a job's skills touch, so workers compute
+it directly for their shard of candidates and keep only each job's top k.
+
+The candidate arrays are copied once into shared memory and workers attach
+to them by name, so the matrix is never pickled. Jobs are sent in batches
+and results come back per job, in input order, as soon as a batch is done.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from src.resume.models import Job
+from src.resume.services.matching_service import (
+    CandidateArrays, CandidateMatch, CandidateSkillIndex, JobQuery,
+    best_first, select_top_k,
+)
+from src.resume.utils.batching import chunked
+
+# Jobs sent to the workers per round; each round is one task per shard
+DEFAULT_JOB_BATCH_SIZE = 64
+
+_ARRAY_FIELDS = ("skill_bits", "job_type_bits", "experience", "has_job_type_prefs", "active")
+
+@dataclass
+class JobMatches:
+    job: Job
+    matches: List[CandidateMatch]
+
+# field -> (shared memory name, shape, dtype)
+ArraySpecs = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+class SharedCandidateArrays:
+    """CandidateArrays copied into shared memory for the lifetime of a `with` block."""
+
+    def __init__(self, arrays: CandidateArrays):
+        self._blocks: List[SharedMemory] = []
+        self.specs: ArraySpecs = {}
+        try:
+            for field in _ARRAY_FIELDS:
+                array = getattr(arrays, field)
+                # Zero-sized segments are not allowed
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.specs[field] = (block.name, array.shape, array.dtype.str)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedCandidateArrays":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def attach_arrays(specs: ArraySpecs) -> Tuple[List[SharedMemory], CandidateArrays]:
+    """Map shared arrays into this process; keep the blocks alive while in use."""
+    blocks = []
+    views = {}
+    for field, (name, shape, dtype) in specs.items():
+        block = SharedMemory(name=name)
+        blocks.append(block)
+        views[field] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return blocks, CandidateArrays(**views)
+
+# Per worker process, set by _init_worker
+_worker_blocks: List[SharedMemory] = []
+_worker_arrays: Optional[CandidateArrays] = None
+
+def _init_worker(specs: ArraySpecs) -> None:
+    global _worker_blocks, _worker_arrays
+    _worker_blocks, _worker_arrays = attach_arrays(specs)
+
+def _score_shard(queries: List[JobQuery], start: int, stop: int,
+                 k: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Top k (rows, matched) of every query within candidate rows [start, stop)."""
+    shard = _worker_arrays.rows(start, stop)
+    results = []
+    for query in queries:
+        rows, matched = select_top_k(shard, query, k)
+        results.append((rows + start, matched))
+    return results
+
+def shard_bounds(rows: int, shards: int) -> List[Tuple[int, int]]:
+    """Split [0, rows) into at most `shards` contiguous, non-empty ranges."""
+    shards = max(1, min(shards, rows))
+    edges = np.linspace(0, rows, shards + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+class BatchMatcher:
+    """Ranks a stream of jobs against a CandidateSkillIndex in parallel.
+
+    The index is snapshotted into shared memory when match() starts, so
+    candidates added while it runs are not seen by that run.
+    """
+
+    def __init__(self, index: CandidateSkillIndex, workers: Optional[int] = None,
+                 job_batch_size: int = DEFAULT_JOB_BATCH_SIZE):
+        if job_batch_size < 1:
+            raise ValueError("job_batch_size must be at least 1")
+        self.index = index
+        self.workers = workers or os.cpu_count() or 1
+        self.job_batch_size = job_batch_size
+
+    def match(self, jobs: Iterable[Job], k: int = 10) -> Iterator[JobMatches]:
+        """Yield the top k candidates of every job, in the order of `jobs`."""
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if self.workers <= 1 or len(self.index.arrays()) == 0:
+            return self._match_in_process(jobs, k)
+        return self._match_in_pool(jobs, k)
+
+    def _match_in_process(self, jobs: Iterable[Job], k: int) -> Iterator[JobMatches]:
+        for job in jobs:
+            yield JobMatches(job=job, matches=self.index.top_k(job, k))
+
+    def _match_in_pool(self, jobs: Iterable[Job], k: int) -> Iterator[JobMatches]:
+        arrays = self.index.arrays()
+        shards = shard_bounds(len(arrays), self.workers)
+
+        with SharedCandidateArrays(arrays) as shared:
+            pool = ProcessPoolExecutor(max_workers=len(shards), initializer=_init_worker,
+                                       initargs=(shared.specs,))
+            try:
+                pending = deque()
+                for batch in chunked(jobs, self.job_batch_size):
+                    queries = [self.index.compile(job) for job in batch]
+                    futures = [pool.submit(_score_shard, queries, start, stop, k)
+                               for start, stop in shards]
+                    pending.append((batch, queries, futures))
+                    # Keep one batch in flight while the previous one is merged
+                    if len(pending) > 1:
+                        yield from self._merge(*pending.popleft(), k)
+                while pending:
+                    yield from self._merge(*pending.popleft(), k)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _merge(self, batch: List[Job], queries: List[JobQuery], futures,
+               k: int) -> Iterator[JobMatches]:
+        per_shard = [future.result() for future in futures]
+        for i, (job, query) in enumerate(zip(batch, queries)):
+            rows = np.concatenate([results[i][0] for results in per_shard])
+            matched = np.concatenate([results[i][1] for results in per_shard])
+            rows, matched = best_first(rows, matched, k)
+            yield JobMatches(job=job, matches=self.index.to_matches(query, rows, matched))
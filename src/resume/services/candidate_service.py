@@ -1,20 +1,67 @@
+from dataclasses import dataclass
 from typing import List, Optional
 from uuid import UUID
 from src.resume.models import Candidate
-from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.repository.candidate_repository import CandidateRepository, CandidateOrder
+from src.resume.repository.pagination import Page
+from src.resume.services.similarity_index import CandidateSimilarityIndex
+from src.resume.utils.embedding import EMBEDDING_FIELDS, embed_candidate
+
+@dataclass
+class SimilarCandidate:
+    candidate: Candidate
+    score: float    # cosine similarity of the profile embeddings
 
 class CandidateService:
-    def __init__(self, repository: CandidateRepository):
+    def __init__(self, repository: CandidateRepository,
+                 similarity_index: Optional[CandidateSimilarityIndex] = None):
         self.repository = repository
+        # Loaded from the repository on the first find_similar call
+        self.similarity_index = similarity_index
     
     def create_candidate(self, candidate: Candidate) -> Candidate:
-        return self.repository.save(candidate)
+        saved = self.repository.save(candidate)
+        if self.similarity_index is not None:
+            self.similarity_index.add_many([saved])
+        return saved
     
     def get_candidate(self, id: UUID) -> Optional[Candidate]:
         return self.repository.find_by_id(id)
     
-    def search_candidates(self, search_term: str) -> List[Candidate]:
-        return self.repository.find_by_name_or_email(search_term)
+    def get_candidates(self, ids: List[UUID]) -> List[Optional[Candidate]]:
+        """Candidates in the order of `ids`, None where an id does not exist"""
+        return self.repository.find_by_ids(ids)
+    
+    def search_candidates(self, search_term: str, limit: Optional[int] = None,
+                          after: Optional[str] = None,
+                          order: CandidateOrder = CandidateOrder.CREATED) -> Page[Candidate]:
+        return self.repository.find_by_name_or_email(search_term, limit=limit, after=after, order=order)
+    
+    def find_candidates_with_skills(self, skills: List[str], limit: Optional[int] = None,
+                                    after: Optional[str] = None,
+                                    order: CandidateOrder = CandidateOrder.CREATED) -> Page[Candidate]:
+        return self.repository.find_by_skills(skills, limit=limit, after=after, order=order) 
     
-    def find_candidates_with_skills(self, skills: List[str]) -> List[Candidate]:
-        return self.repository.find_by_skills(skills) 
\ No newline at end of file
+    def find_similar(self, candidate_id: UUID, k: int = 10) -> List[SimilarCandidate]:
+        """The k candidates with the most similar profiles, most similar first.
+
+        Answered from the in-process similarity index; an empty list when
+        the candidate does not exist.
+        """
+        if self.similarity_index is None:
+            self.similarity_index = CandidateSimilarityIndex.load(self.repository)
+
+        vector = self.similarity_index.vector(candidate_id)
+        if vector is None:
+            candidate = self.repository.find_by_id(candidate_id, fields=EMBEDDING_FIELDS)
+            if candidate is None:
+                return []
+            vector = embed_candidate(candidate)
+
+        neighbours = self.similarity_index.search(vector, k, exclude={candidate_id})
+        candidates = self.repository.find_by_ids([neighbour.id for neighbour in neighbours])
+        return [
+            SimilarCandidate(candidate=candidate, score=neighbour.score)
+            for neighbour, candidate in zip(neighbours, candidates)
+            if candidate is not None
+        ]
@@ -0,0 +1,359 @@
+"""
+Job-to-candidate matching on packed skill bitsets.
+
+Skills and job types are interned to small integer ids and every candidate
+is stored as one row of a uint64 bit matrix. Scoring a job is then a
+vectorized AND + popcount over the whole matrix, followed by argpartition
+to pick the top k, instead of a JSONB scan per job.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import numpy as np
+from src.resume.models import Candidate, Job
+from src.resume.repository.candidate_changes import CandidateChangeBatch
+from src.resume.repository.candidate_snapshot import CandidateSnapshot
+
+# Only the fields matching needs are loaded when rebuilding from the database
+MATCHING_FIELDS = ("skills", "experience_years", "preferred_job_types")
+
+def normalize_term(term: str) -> str:
+    return term.strip().lower()
+
+class Vocabulary:
+    """Interns case-insensitive terms (skills, job types) to dense integer ids."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.terms: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def intern(self, term: str) -> int:
+        key = normalize_term(term)
+        term_id = self._ids.get(key)
+        if term_id is None:
+            term_id = len(self.terms)
+            self._ids[key] = term_id
+            self.terms.append(key)
+        return term_id
+
+    def get(self, term: str) -> Optional[int]:
+        return self._ids.get(normalize_term(term))
+
+def words_for(bit_count: int) -> int:
+    """Number of uint64 words needed to hold bit_count bits."""
+    return max(1, (bit_count + 63) // 64)
+
+def pack_ids(ids: Iterable[int], words: int) -> np.ndarray:
+    """Pack integer ids into a single bitset of `words` uint64 words."""
+    packed = np.zeros(words, dtype=np.uint64)
+    for term_id in ids:
+        packed[term_id >> 6] |= np.uint64(1) << np.uint64(term_id & 63)
+    return packed
+
+class BitMatrix:
+    """Growable matrix with one packed bitset per row.
+
+    Stored word-major (`bits[word, row]`): a job only requires a few skills,
+    so scoring reads just the words its mask touches, each one contiguous.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.bits = np.zeros((1, capacity), dtype=np.uint64)
+
+    @property
+    def words(self) -> int:
+        return self.bits.shape[0]
+
+    def reserve(self, rows: int, bit_count: int) -> None:
+        """Grow (amortized doubling) to hold `rows` rows of `bit_count` bits."""
+        words, capacity = self.bits.shape
+        needed_words = words_for(bit_count)
+        if rows <= capacity and needed_words <= words:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grown = np.zeros((max(words, needed_words), capacity), dtype=np.uint64)
+        grown[:words, :self.bits.shape[1]] = self.bits
+        self.bits = grown
+
+    def assign(self, rows: np.ndarray, row_ids: Sequence[Sequence[int]]) -> None:
+        """Replace the bitsets of `rows` with the given id lists, vectorized."""
+        counts = np.fromiter((len(ids) for ids in row_ids), dtype=np.int64, count=len(row_ids))
+        flat = np.fromiter((i for ids in row_ids for i in ids), dtype=np.int64, count=int(counts.sum()))
+        self.assign_flat(rows, counts, flat)
+
+    def assign_flat(self, rows: np.ndarray, counts: np.ndarray, flat: np.ndarray) -> None:
+        """assign() with the id lists already flattened: rows[i] gets the
+        next counts[i] ids of `flat` (CSR layout)."""
+        self.bits[:, rows] = 0
+        if flat.size == 0:
+            return
+        target_rows = np.repeat(rows, counts)
+        values = np.left_shift(np.uint64(1), (flat & 63).astype(np.uint64))
+        np.bitwise_or.at(self.bits, (flat >> 6, target_rows), values)
+
+def count_common(bits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Popcount of (row & mask) for every row of a word-major bit matrix."""
+    counts = np.zeros(bits.shape[1], dtype=np.int32)
+    for word in np.flatnonzero(mask):
+        counts += np.bitwise_count(bits[word] & mask[word])
+    return counts
+
+def has_bit(bits: np.ndarray, bit: int) -> np.ndarray:
+    """Boolean column: which rows of a word-major bit matrix have `bit` set."""
+    if (bit >> 6) >= bits.shape[0]:
+        return np.zeros(bits.shape[1], dtype=bool)
+    return (bits[bit >> 6] & (np.uint64(1) << np.uint64(bit & 63))) != 0
+
+@dataclass
+class CandidateMatch:
+    candidate_id: UUID
+    score: float          # fraction of the job's required skills the candidate has
+    matched_skills: int
+
+@dataclass(frozen=True)
+class JobQuery:
+    """A job translated to the ids of one index's vocabularies."""
+    skill_mask: np.ndarray          # skills the index does not know have no bit
+    required_count: int             # distinct required skills, known or not
+    min_experience: int
+    job_type_id: Optional[int]      # None when no candidate prefers this type
+
+@dataclass(frozen=True)
+class CandidateArrays:
+    """The columns scored by select_top_k, one entry (or bit column) per row."""
+    skill_bits: np.ndarray          # (words, rows) uint64
+    job_type_bits: np.ndarray       # (words, rows) uint64
+    experience: np.ndarray          # (rows,) int32
+    has_job_type_prefs: np.ndarray  # (rows,) bool
+    active: np.ndarray              # (rows,) bool
+
+    def __len__(self) -> int:
+        return self.experience.shape[0]
+
+    def rows(self, start: int, stop: int) -> "CandidateArrays":
+        """Views of rows [start, stop), used to shard work."""
+        return CandidateArrays(
+            skill_bits=self.skill_bits[:, start:stop],
+            job_type_bits=self.job_type_bits[:, start:stop],
+            experience=self.experience[start:stop],
+            has_job_type_prefs=self.has_job_type_prefs[start:stop],
+            active=self.active[start:stop],
+        )
+
+def best_first(rows: np.ndarray, matched: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The k best (row, matched) pairs: most skills first, ties by row."""
+    if rows.size > k:
+        # O(n) selection of the k best, only those k get sorted. Rows tied
+        # with the k-th score are cut by row, not by partition order, so
+        # merging per-shard results gives the same answer as one pass.
+        threshold = -np.partition(-matched, k - 1)[k - 1]
+        above = np.flatnonzero(matched > threshold)
+        ties = np.flatnonzero(matched == threshold)
+        ties = ties[np.argsort(rows[ties], kind="stable")][:k - above.size]
+        keep = np.concatenate([above, ties])
+        rows, matched = rows[keep], matched[keep]
+    order = np.lexsort((rows, -matched))
+    return rows[order], matched[order]
+
+def select_top_k(arrays: CandidateArrays, query: JobQuery, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows and matched-skill counts of the best k candidates for a query.
+
+    Candidates need at least query.min_experience years, and must either
+    prefer the job's type or have no preference at all. When the job
+    requires skills, candidates matching none of them are left out.
+    """
+    eligible = arrays.active & (arrays.experience >= query.min_experience)
+    type_ok = ~arrays.has_job_type_prefs
+    if query.job_type_id is not None:
+        type_ok |= has_bit(arrays.job_type_bits, query.job_type_id)
+    eligible &= type_ok
+
+    if query.required_count:
+        matched = count_common(arrays.skill_bits, query.skill_mask)
+        eligible &= matched > 0
+    else:
+        matched = np.zeros(len(arrays), dtype=np.int32)
+
+    rows = np.flatnonzero(eligible)
+    return best_first(rows, matched[rows], k)
+
+class CandidateSkillIndex:
+    """Columnar in-memory index of the candidate attributes used for matching."""
+
+    def __init__(self, capacity: int = 1024):
+        self.skills = Vocabulary()
+        self.job_types = Vocabulary()
+        self._skill_bits = BitMatrix(capacity)
+        self._job_type_bits = BitMatrix(capacity)
+        self._experience = np.zeros(capacity, dtype=np.int32)
+        self._has_job_type_prefs = np.zeros(capacity, dtype=bool)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._ids: List[UUID] = []
+        self._rows: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, candidate_id: UUID) -> bool:
+        return candidate_id in self._rows
+
+    def add_many(self, candidates: Iterable[Candidate]) -> None:
+        """Insert or replace candidates; an existing id keeps its row."""
+        batch = list(candidates)
+        if not batch:
+            return
+
+        rows = np.empty(len(batch), dtype=np.int64)
+        for i, candidate in enumerate(batch):
+            row = self._rows.get(candidate.id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(candidate.id)
+                self._rows[candidate.id] = row
+            rows[i] = row
+
+        skill_ids = [[self.skills.intern(s) for s in c.skills] for c in batch]
+        job_type_ids = [[self.job_types.intern(t) for t in c.preferred_job_types] for c in batch]
+
+        self._reserve(len(self._ids))
+        self._skill_bits.reserve(len(self._ids), len(self.skills))
+        self._job_type_bits.reserve(len(self._ids), len(self.job_types))
+        self._skill_bits.assign(rows, skill_ids)
+        self._job_type_bits.assign(rows, job_type_ids)
+        self._experience[rows] = [c.experience_years for c in batch]
+        self._has_job_type_prefs[rows] = [bool(ids) for ids in job_type_ids]
+        self._active[rows] = True
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CandidateSnapshot) -> "CandidateSkillIndex":
+        """Index every candidate of a snapshot straight from its columns.
+
+        Skills and job types are CSR codes into per-snapshot vocabularies,
+        so only the vocabularies are interned term by term; the bitsets are
+        filled with one vectorized assign per matrix.
+        """
+        rows = len(snapshot)
+        index = cls(capacity=max(rows, 1))
+        index._ids = snapshot.id_list()
+        index._rows = {candidate_id: row for row, candidate_id in enumerate(index._ids)}
+        all_rows = np.arange(rows)
+        for vocabulary, bits, field in ((index.skills, index._skill_bits, "skills"),
+                                        (index.job_types, index._job_type_bits, "preferred_job_types")):
+            column = snapshot.lists[field]
+            term_ids = np.array([vocabulary.intern(term) for term in column.terms], dtype=np.int64)
+            bits.reserve(rows, len(vocabulary))
+            bits.assign_flat(all_rows, np.diff(column.indptr), term_ids[column.indices])
+        index._experience[:rows] = snapshot.experience_years
+        index._has_job_type_prefs[:rows] = np.diff(snapshot.lists["preferred_job_types"].indptr) > 0
+        index._active[:rows] = True
+        return index
+
+    def remove(self, candidate_id: UUID) -> bool:
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return False
+        # The row stays allocated but is never scored again
+        self._active[row] = False
+        return True
+
+    def compile(self, job: Job) -> JobQuery:
+        required = {normalize_term(s) for s in job.required_skills}
+        known = [i for i in (self.skills.get(s) for s in required) if i is not None]
+        return JobQuery(
+            skill_mask=pack_ids(known, self._skill_bits.words),
+            required_count=len(required),
+            min_experience=job.min_experience,
+            job_type_id=self.job_types.get(job.job_type),
+        )
+
+    def arrays(self) -> CandidateArrays:
+        """Views of the used rows; they are invalidated by the next add_many."""
+        n = len(self._ids)
+        return CandidateArrays(
+            skill_bits=self._skill_bits.bits[:, :n],
+            job_type_bits=self._job_type_bits.bits[:, :n],
+            experience=self._experience[:n],
+            has_job_type_prefs=self._has_job_type_prefs[:n],
+            active=self._active[:n],
+        )
+
+    def to_matches(self, query: JobQuery, rows: np.ndarray,
+                   matched: np.ndarray) -> List[CandidateMatch]:
+        return [
+            CandidateMatch(
+                candidate_id=self._ids[row],
+                score=float(count / query.required_count) if query.required_count else 1.0,
+                matched_skills=int(count),
+            )
+            for row, count in zip(rows, matched)
+        ]
+
+    def top_k(self, job: Job, k: int = 10) -> List[CandidateMatch]:
+        """Best k candidates for a job by share of required skills matched.
+
+        See select_top_k for the filters applied.
+        """
+        if not self._ids or k < 1:
+            return []
+        query = self.compile(job)
+        rows, matched = select_top_k(self.arrays(), query, k)
+        return self.to_matches(query, rows, matched)
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self._experience.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        self._experience = _grown(self._experience, capacity)
+        self._has_job_type_prefs = _grown(self._has_job_type_prefs, capacity)
+        self._active = _grown(self._active, capacity)
+
+def _grown(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Copy of a 1-D array zero-padded to `capacity` entries."""
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+class MatchingService:
+    def __init__(self, repository=None, index: Optional[CandidateSkillIndex] = None):
+        self.repository = repository
+        self.index = index or CandidateSkillIndex()
+
+    def rebuild(self, fetch_size: int = 10000) -> int:
+        """Load every candidate from the repository into a fresh index."""
+        index = CandidateSkillIndex()
+        batch = []
+        for candidate in self.repository.iter_all(fetch_size=fetch_size, fields=MATCHING_FIELDS):
+            batch.append(candidate)
+            if len(batch) == fetch_size:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        self.index = index
+        return len(index)
+
+    def load_snapshot(self, snapshot: CandidateSnapshot) -> int:
+        """Replace the index with one built from a columnar snapshot; no database reads."""
+        self.index = CandidateSkillIndex.from_snapshot(snapshot)
+        return len(self.index)
+
+    def add_candidates(self, candidates: Iterable[Candidate]) -> None:
+        self.index.add_many(candidates)
+
+    def remove_candidate(self, candidate_id: UUID) -> bool:
+        return self.index.remove(candidate_id)
+
+    def apply_changes(self, batch: CandidateChangeBatch) -> None:
+        """Change feed subscriber: update the index in place, no rebuild."""
+        self.index.add_many(batch.upserted)
+        for candidate_id in batch.deleted:
+            self.index.remove(candidate_id)
+
+    def top_candidates(self, job: Job, k: int = 10) -> List[CandidateMatch]:
+        return self.index.top_k(job, k)
@@ -0,0 +1,258 @@
+"""
+In-process approximate nearest-neighbour search over candidate embeddings.
+
+IVF (inverted file) index: k-means splits the vectors into `lists`
+clusters, every vector is filed under its nearest centroid, and a query
+only scores the vectors of the `probes` clusters nearest to it. With
+sqrt(n) clusters and DEFAULT_PROBES probes a query touches a few percent
+of the vectors instead of all of them.
+
+Vectors must be L2-normalised (see utils.embedding): similarity is the dot
+product, i.e. the cosine.
+"""
+
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+import numpy as np
+from src.resume.models import Candidate
+from src.resume.repository.candidate_changes import CandidateChangeBatch
+from src.resume.repository.candidate_snapshot import CandidateSnapshot
+from src.resume.services.matching_service import best_first
+from src.resume.utils.embedding import EMBEDDING_DIMENSIONS, embed_candidates
+
+# Below this many vectors a brute-force scan is cheap, so no clustering
+MIN_TRAINING_ROWS = 4096
+
+# Clusters scanned per query. On 1M generated profiles (1000 clusters)
+# 8 probes found 72% of the true top 10 in 2 ms, 32 probes 93% in 8 ms
+DEFAULT_PROBES = 32
+TRAINING_SAMPLE = 65536
+TRAINING_ITERATIONS = 10
+
+# Vectors scored per matrix product when assigning them to clusters
+_ASSIGN_CHUNK = 8192
+
+@dataclass
+class Neighbour:
+    id: UUID
+    score: float    # cosine similarity, 1.0 for identical profiles
+
+class IVFIndex:
+    """Candidate embeddings filed by nearest k-means centroid.
+
+    Rows are kept in growable arrays like CandidateSkillIndex: add_many
+    upserts by id and files new vectors under their nearest centroid, and
+    remove only marks the row inactive. Moved and removed rows leave stale
+    entries in their old cluster that queries skip; train() rebuilds the
+    clusters and drops them. needs_training tells when that is worth it.
+    """
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS,
+                 probes: int = DEFAULT_PROBES, capacity: int = 1024, seed: int = 0):
+        self.dimensions = dimensions
+        self.probes = probes
+        self.seed = seed
+        self.ids: List[UUID] = []
+        self.rows: Dict[UUID, int] = {}
+        self.vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.assigned = np.full(capacity, -1, dtype=np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[np.ndarray] = []
+        self.list_sizes = np.zeros(0, dtype=np.int64)
+        self.trained_rows = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def needs_training(self) -> bool:
+        """True once clustering would pay off or the clusters went stale:
+        never trained and big enough, or grown fourfold since training."""
+        if not self.trained:
+            return len(self) >= MIN_TRAINING_ROWS
+        return len(self) > 4 * self.trained_rows
+
+    def add_many(self, ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        """Insert or replace the vectors of the given ids."""
+        rows = np.empty(len(ids), dtype=np.intp)
+        for position, id in enumerate(ids):
+            row = self.rows.get(id)
+            if row is None:
+                row = len(self.ids)
+                self.ids.append(id)
+                self.rows[id] = row
+            rows[position] = row
+        self._reserve(len(self.ids))
+        self.vectors[rows] = vectors
+        self.active[rows] = True
+        if self.trained and rows.size:
+            self._file(rows, self._nearest_centroids(self.vectors[rows]))
+
+    def remove(self, id: UUID) -> bool:
+        row = self.rows.pop(id, None)
+        if row is None:
+            return False
+        self.active[row] = False
+        self.assigned[row] = -1
+        return True
+
+    def vector(self, id: UUID) -> Optional[np.ndarray]:
+        row = self.rows.get(id)
+        return None if row is None else self.vectors[row].copy()
+
+    def train(self, lists: Optional[int] = None, iterations: int = TRAINING_ITERATIONS) -> None:
+        """Cluster the current vectors with spherical k-means and refile them all.
+
+        Centroids are fitted on a sample, then every vector is assigned.
+        `lists` defaults to sqrt(n) clusters.
+        """
+        rows = np.flatnonzero(self.active[:len(self.ids)])
+        if rows.size == 0:
+            return
+        if lists is None:
+            lists = int(np.sqrt(rows.size))
+        lists = max(1, min(lists, rows.size))
+
+        random = np.random.default_rng(self.seed)
+        sample = self.vectors[random.choice(rows, size=min(rows.size, TRAINING_SAMPLE), replace=False)]
+        centroids = sample[random.choice(sample.shape[0], size=lists, replace=False)].copy()
+        for _ in range(iterations):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # An empty cluster keeps its centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        self.centroids = centroids.astype(np.float32)
+
+        self.lists = [np.zeros(0, dtype=np.intp) for _ in range(lists)]
+        self.list_sizes = np.zeros(lists, dtype=np.int64)
+        self.assigned[:] = -1
+        self._file(rows, self._nearest_centroids(self.vectors[rows]))
+        self.trained_rows = rows.size
+
+    def search(self, vector: np.ndarray, k: int,
+               exclude: Collection[UUID] = ()) -> List[Neighbour]:
+        """The k most similar vectors, best first, ties by insertion order."""
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        vector = np.asarray(vector, dtype=np.float32)
+        rows = self._candidate_rows(vector)
+        excluded = [self.rows[id] for id in exclude if id in self.rows]
+        if excluded:
+            rows = rows[~np.isin(rows, excluded)]
+        if rows.size == 0:
+            return []
+        scores = self.vectors[rows] @ vector
+        rows, scores = best_first(rows, scores, k)
+        return [Neighbour(self.ids[row], float(score)) for row, score in zip(rows.tolist(), scores)]
+
+    def _candidate_rows(self, vector: np.ndarray) -> np.ndarray:
+        """Rows worth scoring: all active rows, or those filed under the nearest clusters."""
+        if not self.trained:
+            return np.flatnonzero(self.active[:len(self.ids)])
+        probes = min(self.probes, len(self.lists))
+        nearest = np.argpartition(-(self.centroids @ vector), probes - 1)[:probes]
+        rows = np.concatenate([self.lists[cluster][:self.list_sizes[cluster]] for cluster in nearest])
+        clusters = np.repeat(nearest, self.list_sizes[nearest])
+        # Skip stale entries of rows that were removed or moved to another cluster
+        return rows[self.assigned[rows] == clusters]
+
+    def _nearest_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        return np.concatenate([
+            np.argmax(vectors[start:start + _ASSIGN_CHUNK] @ self.centroids.T, axis=1)
+            for start in range(0, vectors.shape[0], _ASSIGN_CHUNK)
+        ])
+
+    def _file(self, rows: np.ndarray, clusters: np.ndarray) -> None:
+        """Append rows to their clusters' lists; unchanged assignments are kept as they are."""
+        moved = self.assigned[rows] != clusters
+        rows, clusters = rows[moved], clusters[moved]
+        self.assigned[rows] = clusters
+        order = np.argsort(clusters, kind="stable")
+        rows, clusters = rows[order], clusters[order]
+        bounds = np.flatnonzero(np.diff(clusters)) + 1
+        for group in np.split(np.arange(rows.size), bounds):
+            if group.size == 0:
+                continue
+            cluster = clusters[group[0]]
+            size = self.list_sizes[cluster]
+            needed = size + group.size
+            if needed > self.lists[cluster].shape[0]:
+                grown = np.zeros(max(needed, 2 * self.lists[cluster].shape[0], 16), dtype=np.intp)
+                grown[:size] = self.lists[cluster][:size]
+                self.lists[cluster] = grown
+            self.lists[cluster][size:needed] = rows[group]
+            self.list_sizes[cluster] = needed
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self.vectors.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[:self.vectors.shape[0]] = self.vectors
+        self.vectors = vectors
+        self.active = np.concatenate([self.active, np.zeros(capacity - self.active.size, dtype=bool)])
+        self.assigned = np.concatenate([
+            self.assigned, np.full(capacity - self.assigned.size, -1, dtype=np.int32)
+        ])
+
+class CandidateSimilarityIndex:
+    """An IVFIndex of candidate embeddings kept up to date with saves."""
+
+    def __init__(self, index: Optional[IVFIndex] = None):
+        self.index = index or IVFIndex()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add_many(self, candidates: Iterable[Candidate]) -> None:
+        candidates = list(candidates)
+        if not candidates:
+            return
+        self.index.add_many([candidate.id for candidate in candidates], embed_candidates(candidates))
+        if self.index.needs_training:
+            self.index.train()
+
+    def remove(self, id: UUID) -> bool:
+        return self.index.remove(id)
+
+    def vector(self, id: UUID) -> Optional[np.ndarray]:
+        return self.index.vector(id)
+
+    def apply_changes(self, batch: CandidateChangeBatch) -> None:
+        """Change feed subscriber: re-embed the changed candidates only."""
+        self.add_many(batch.upserted)
+        for id in batch.deleted:
+            self.index.remove(id)
+
+    def search(self, vector: np.ndarray, k: int, exclude: Collection[UUID] = ()) -> List[Neighbour]:
+        return self.index.search(vector, k, exclude)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CandidateSnapshot) -> "CandidateSimilarityIndex":
+        """Index the embeddings stored in a snapshot, without embedding anything."""
+        index = IVFIndex(capacity=max(len(snapshot), 1))
+        index.add_many(snapshot.id_list(), snapshot.embeddings)
+        if len(index) >= MIN_TRAINING_ROWS:
+            index.train()
+        return cls(index)
+
+    @classmethod
+    def load(cls, repository, fetch_size: int = 10000) -> "CandidateSimilarityIndex":
+        """Index the embeddings stored with every candidate and cluster them
+        once; like from_snapshot, nothing is embedded that was stored."""
+        index = IVFIndex()
+        for ids, vectors in repository.iter_embeddings(fetch_size=fetch_size):
+            index.add_many(ids, vectors)
+        if len(index) >= MIN_TRAINING_ROWS:
+            index.train()
+        return cls(index)
@@ -0,0 +1,22 @@
+"""Helpers for processing large iterables in fixed-size batches."""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most `size` items from iterable.
+
+    Only one batch is held in memory at a time, so this is safe to use
+    on generators that produce millions of items.
+    """
+    if size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,147 @@
+"""
+Variable-length columns as flat NumPy arrays.
+
+A string column is an `offsets` array (n + 1 int64) into one UTF-8 `blob`
+(uint8): row i is blob[offsets[i]:offsets[i + 1]]. A list-of-strings
+column is CSR-encoded like a sparse matrix: `indptr` (n + 1 int64) into
+`indices` (int32 codes), and the distinct strings are a string column of
+their own, the vocabulary. Every part is a plain array, so columns can be
+saved with np.save and mapped back with np.load(mmap_mode="r") without
+copying or parsing anything.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+def segment_offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+def take_segments(offsets: np.ndarray, values: np.ndarray,
+                  rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(offsets, values) of the given rows only, gathered without a Python loop."""
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    new_offsets = segment_offsets(lengths)
+    # Position j of the output reads values[starts[row] + (j - new_offsets[row])]
+    positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+    return new_offsets, values[positions]
+
+def concat_segments(parts: Sequence[Tuple[np.ndarray, np.ndarray]],
+                    dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """Append (offsets, values) pairs into one."""
+    lengths = [np.diff(offsets) for offsets, _ in parts]
+    offsets = segment_offsets(np.concatenate(lengths) if lengths else np.zeros(0, dtype=np.int64))
+    values = np.concatenate([values for _, values in parts]) if parts else np.zeros(0, dtype=dtype)
+    return offsets, values.astype(dtype, copy=False)
+
+class StringColumn:
+    """Optional strings stored as offsets into a UTF-8 blob.
+
+    `valid` is False for None values; it is left out when no row is None.
+    """
+
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray, valid: Optional[np.ndarray] = None):
+        self.offsets = offsets
+        self.blob = blob
+        self.valid = valid
+
+    @classmethod
+    def encode(cls, values: Sequence[Optional[str]]) -> "StringColumn":
+        encoded = [value.encode() if value is not None else b"" for value in values]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        valid = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+        return cls(segment_offsets(lengths), np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(),
+                   None if valid.all() else valid)
+
+    @classmethod
+    def concat(cls, columns: Sequence["StringColumn"]) -> "StringColumn":
+        offsets, blob = concat_segments([(c.offsets, c.blob) for c in columns], np.uint8)
+        if all(c.valid is None for c in columns):
+            return cls(offsets, blob)
+        valid = np.concatenate([
+            c.valid if c.valid is not None else np.ones(len(c), dtype=bool) for c in columns
+        ])
+        return cls(offsets, blob, valid)
+
+    def __len__(self) -> int:
+        return self.offsets.shape[0] - 1
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if self.valid is not None and not self.valid[row]:
+            return None
+        return self.blob[self.offsets[row]:self.offsets[row + 1]].tobytes().decode()
+
+    def to_list(self) -> List[Optional[str]]:
+        """Every value, decoding the blob once rather than row by row."""
+        text = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        values = [text[start:stop].decode() for start, stop in zip(offsets, offsets[1:])]
+        if self.valid is not None:
+            values = [value if valid else None for value, valid in zip(values, self.valid.tolist())]
+        return values
+
+    def take(self, rows: np.ndarray) -> "StringColumn":
+        offsets, blob = take_segments(self.offsets, self.blob, rows)
+        return StringColumn(offsets, blob, None if self.valid is None else self.valid[rows])
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        parts = {"offsets": self.offsets, "blob": self.blob}
+        if self.valid is not None:
+            parts["valid"] = self.valid
+        return parts
+
+class ListColumn:
+    """Lists of strings, CSR-encoded as codes into a vocabulary."""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, vocabulary: StringColumn):
+        self.indptr = indptr
+        self.indices = indices
+        self.vocabulary = vocabulary
+        self._terms: Optional[List[str]] = None
+
+    @classmethod
+    def concat(cls, parts: Sequence[Tuple[np.ndarray, np.ndarray]], codes: Dict[str, int]) -> "ListColumn":
+        """Column from (indptr, indices) chunks made by encode_lists with one shared `codes`."""
+        indptr, indices = concat_segments(parts, np.int32)
+        return cls(indptr, indices, vocabulary_of(codes))
+
+    def __len__(self) -> int:
+        return self.indptr.shape[0] - 1
+
+    @property
+    def terms(self) -> List[str]:
+        """The decoded vocabulary; small, so it is decoded once and kept."""
+        if self._terms is None:
+            self._terms = self.vocabulary.to_list()
+        return self._terms
+
+    def codes(self, row: int) -> np.ndarray:
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def __getitem__(self, row: int) -> List[str]:
+        terms = self.terms
+        return [terms[code] for code in self.codes(row).tolist()]
+
+    def take(self, rows: np.ndarray) -> "ListColumn":
+        indptr, indices = take_segments(self.indptr, self.indices, rows)
+        return ListColumn(indptr, indices, self.vocabulary)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        parts = {"indptr": self.indptr, "indices": self.indices}
+        parts.update({f"vocabulary.{name}": array for name, array in self.vocabulary.arrays().items()})
+        return parts
+
+def encode_lists(lists: Sequence[Sequence[str]], codes: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """(indptr, indices) of lists, coding strings with `codes`, which grows
+    as new strings appear. Share one dict between the chunks of a column so
+    their codes agree."""
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    flat = [codes.setdefault(term, len(codes)) for values in lists for term in values]
+    return segment_offsets(lengths), np.array(flat, dtype=np.int32)
+
+def vocabulary_of(codes: Dict[str, int]) -> StringColumn:
+    """String column of a codes dict, in code order (dicts keep insertion order)."""
+    return StringColumn.encode(list(codes))
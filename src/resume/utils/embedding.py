@@ -0,0 +1,167 @@
+"""
+Offline candidate embeddings by feature hashing.
+
+Every profile attribute becomes a string feature ("skill:python",
+"location:austin, tx", ...) that is hashed to one of EMBEDDING_DIMENSIONS
+slots with a +1/-1 sign (the sign keeps colliding features from adding up).
+The vectors are L2-normalised, so the cosine similarity of two candidates
+is the dot product of their embeddings. No model and no network access:
+the same profile always gets the same vector, on any machine.
+"""
+
+import hashlib
+import math
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from src.resume.models import Candidate
+
+# Bumping this changes every stored vector: re-run the embedding backfill
+EMBEDDING_DIMENSIONS = 128
+
+# The candidate fields an embedding is computed from, for projected reads
+EMBEDDING_FIELDS = ("skills", "education", "location", "experience_years", "preferred_job_types")
+
+# How much each group of features contributes to the similarity. A group's
+# features share its weight, so ten skills do not outweigh one location
+FEATURE_WEIGHTS = {
+    "skill": 1.0,
+    "education": 0.5,
+    "location": 0.4,
+    "experience": 0.5,
+    "job_type": 0.3,
+}
+
+# Experience is bucketed in steps of this many years, capped at the last bucket
+EXPERIENCE_STEP = 3
+EXPERIENCE_BUCKETS = 6
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset({"in", "of", "and", "the", "s"})
+
+@lru_cache(maxsize=65536)
+def feature_slot(feature: str) -> Tuple[int, float]:
+    """(dimension, sign) of a feature; stable across processes, unlike hash()."""
+    value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+    return value % EMBEDDING_DIMENSIONS, (1.0 if value >> 63 else -1.0)
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+Slots = Tuple[Tuple[int, float], ...]
+
+def _weighted(name: str, values: Sequence[str], weights: Sequence[float] = ()) -> Slots:
+    """(dimension, signed weight) pairs of a feature group. The group's
+    features share its weight, unless explicit `weights` are given."""
+    values = list(dict.fromkeys(value for value in values if value))
+    if not values:
+        return ()
+    if not weights:
+        weights = [FEATURE_WEIGHTS[name] / math.sqrt(len(values))] * len(values)
+    slots = []
+    for value, weight in zip(values, weights):
+        slot, sign = feature_slot(f"{name}:{value}")
+        slots.append((slot, sign * weight))
+    return tuple(slots)
+
+# Profiles repeat the same educations, locations and job type lists over
+# and over, so each distinct value is turned into slots only once
+
+@lru_cache(maxsize=4096)
+def _education_slots(education: str) -> Slots:
+    education = _normalize(education)
+    # The whole degree and its words: "master's in computer science" is
+    # then close to "bachelor's in computer science"
+    words = [word for word in _WORD.findall(education) if word not in _STOP_WORDS]
+    return _weighted("education", [education] + words)
+
+@lru_cache(maxsize=4096)
+def _location_slots(location: str) -> Slots:
+    location = _normalize(location)
+    # "Austin, TX" also contributes its region, TX
+    region = location.rsplit(",", 1)[1].strip() if "," in location else ""
+    return _weighted("location", [location, f"region {region}" if region else ""])
+
+@lru_cache(maxsize=256)
+def _experience_slots(years: int) -> Slots:
+    # Split between the two nearest buckets so 4 and 5 years stay close
+    position = min(years / EXPERIENCE_STEP, EXPERIENCE_BUCKETS - 1)
+    low = int(position)
+    fraction = position - low
+    weight = FEATURE_WEIGHTS["experience"]
+    return _weighted("experience", [str(low), str(low + 1) if fraction else ""],
+                     [weight * (1 - fraction), weight * fraction])
+
+@lru_cache(maxsize=4096)
+def _job_type_slots(job_types: Tuple[str, ...]) -> Slots:
+    return _weighted("job_type", [_normalize(job_type) for job_type in job_types])
+
+@lru_cache(maxsize=65536)
+def _skill_slot(skill: str) -> Tuple[int, float]:
+    return feature_slot(f"skill:{_normalize(skill)}")
+
+def candidate_slots(candidate: Candidate) -> Slots:
+    """(dimension, signed weight) pairs of every feature of a candidate."""
+    skills = list(dict.fromkeys(_skill_slot(skill) for skill in candidate.skills))
+    skill_weight = FEATURE_WEIGHTS["skill"] / math.sqrt(len(skills)) if skills else 0.0
+    return (
+        tuple((slot, sign * skill_weight) for slot, sign in skills)
+        + _education_slots(candidate.education or "")
+        + _location_slots(candidate.location or "")
+        + _experience_slots(candidate.experience_years)
+        + _job_type_slots(tuple(candidate.preferred_job_types))
+    )
+
+def embed_candidates(candidates: Iterable[Candidate]) -> np.ndarray:
+    """One float32 row per candidate, each of unit length (or all zeros)."""
+    rows, slots, values = [], [], []
+    count = 0
+    for row, candidate in enumerate(candidates):
+        count += 1
+        pairs = candidate_slots(candidate)
+        rows.extend([row] * len(pairs))
+        for slot, value in pairs:
+            slots.append(slot)
+            values.append(value)
+
+    vectors = np.zeros((count, EMBEDDING_DIMENSIONS), dtype=np.float32)
+    np.add.at(vectors, (np.asarray(rows, dtype=np.intp), np.asarray(slots, dtype=np.intp)),
+              np.asarray(values, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+def embed_candidate(candidate: Candidate) -> np.ndarray:
+    return embed_candidates([candidate])[0]
+
+def format_vector(vector: np.ndarray) -> str:
+    """pgvector text form, '[0,0.25,...]'. Embeddings are sparse, so only
+    the non-zero entries are formatted."""
+    parts = ["0"] * vector.shape[0]
+    for slot in np.flatnonzero(vector).tolist():
+        parts[slot] = "%.7g" % vector[slot]
+    return "[" + ",".join(parts) + "]"
+
+def parse_vector(text: str) -> np.ndarray:
+    return np.array(text.strip("[]").split(","), dtype=np.float32)
+
+def parse_vectors(texts: Sequence[str], dimensions: int = EMBEDDING_DIMENSIONS) -> np.ndarray:
+    """pgvector text values ('[0.1,0,...]') parsed in one call instead of one per row."""
+    if not texts:
+        return np.zeros((0, dimensions), dtype=np.float32)
+    values = np.fromstring(",".join(text[1:-1] for text in texts), dtype=np.float32, sep=",")
+    return values.reshape(len(texts), dimensions)
+
+def stored_embeddings(texts: Sequence[Optional[str]],
+                      candidates: Callable[[List[int]], List[Candidate]]) -> np.ndarray:
+    """Stored embeddings as a matrix. Rows the backfill has not reached
+    (NULL) are embedded here from candidates(rows)."""
+    missing = [row for row, text in enumerate(texts) if text is None]
+    if not missing:
+        return parse_vectors(texts)
+    embeddings = np.zeros((len(texts), EMBEDDING_DIMENSIONS), dtype=np.float32)
+    present = [row for row, text in enumerate(texts) if text is not None]
+    embeddings[present] = parse_vectors([texts[row] for row in present])
+    embeddings[missing] = embed_candidates(candidates(missing))
+    return embeddings
@@ -1,10 +1,14 @@
 """Utilities for JSON serialization and deserialization with complex types."""
 
+import collections.abc
+import dataclasses
 import json
+import types
 import uuid
 from datetime import datetime, date
-from typing import Any, Dict, Type, TypeVar, Optional
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple, Type, TypeVar, Optional, Union, get_args, get_origin
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -20,9 +24,146 @@ class JsonEncoder(json.JSONEncoder):
             return obj.model_dump()
         return super().default(obj)
 
+# Exact-type dispatch for the common non-JSON leaves, checked before the
+# isinstance chain in JsonEncoder
+_FAST_ENCODERS = {
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+_ENCODER = JsonEncoder()
+
+def _encode_default(obj: Any) -> Any:
+    encoder = _FAST_ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    return _ENCODER.default(obj)
+
+_DUMPS_CHUNK_SIZE = 256
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[T]) -> TypeAdapter:
+    """Cached TypeAdapter for List[model_class]; building one compiles a schema."""
+    return TypeAdapter(List[model_class])
+
+# pydantic's JSON mode writes UTC datetimes with a 'Z' suffix where
+# isoformat() (and so JsonEncoder) writes '+00:00'. The fast paths dump with
+# pydantic and then rewrite the aware datetimes, found through the field
+# annotations. _UNKNOWN marks models whose datetimes cannot be found that
+# way (Any, bare containers, custom serializers); they take the JsonEncoder
+# path instead.
+_UNKNOWN = object()
+
+_SEQUENCE_ORIGINS = (list, tuple, collections.abc.Sequence)
+_MAPPING_ORIGINS = (dict, collections.abc.Mapping)
+
+def _datetime_patch(annotation: Any, seen: Tuple = ()) -> Any:
+    """A patch(value, data) -> data function that rewrites the aware
+    datetimes in the JSON-mode dump of a value of this annotation, None
+    when it cannot hold a datetime, or _UNKNOWN."""
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (Union, types.UnionType):    # Optional[X], X | None
+        options = [arg for arg in args if arg is not type(None)]
+        patches = [_datetime_patch(arg, seen) for arg in options]
+        if all(patch is None for patch in patches):
+            return None
+        if len(options) > 1 or _UNKNOWN in patches:
+            return _UNKNOWN
+        patch = patches[0]
+        return lambda value, data: data if value is None else patch(value, data)
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        # Fixed-length tuple: one patch per position
+        patches = [_datetime_patch(arg, seen) for arg in args]
+        if all(patch is None for patch in patches):
+            return None
+        if _UNKNOWN in patches:
+            return _UNKNOWN
+        return lambda value, data: [data_item if patch is None else patch(item, data_item)
+                                    for patch, item, data_item in zip(patches, value, data)]
+    if origin in _SEQUENCE_ORIGINS:
+        patch = _datetime_patch(args[0], seen) if args else _UNKNOWN
+        if patch is None or patch is _UNKNOWN:
+            return patch
+        return lambda value, data: [patch(item, data_item) for item, data_item in zip(value, data)]
+    if origin in _MAPPING_ORIGINS:
+        if not args or _datetime_patch(args[0], seen) is not None:
+            return _UNKNOWN
+        patch = _datetime_patch(args[1], seen)
+        if patch is None or patch is _UNKNOWN:
+            return patch
+        return lambda value, data: {key: patch(item, data_item)
+                                    for item, (key, data_item) in zip(value.values(), data.items())}
+    if origin is not None:
+        # Literal, sets and other generics: only safe when nothing inside is a datetime
+        return None if all(_datetime_patch(arg, seen) is None for arg in args) else _UNKNOWN
+    if annotation is Any or annotation in (object, list, tuple, dict):
+        return _UNKNOWN
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, datetime):
+        return lambda value, data: value.isoformat() if value.tzinfo is not None else data
+    if issubclass(annotation, BaseModel):
+        return _fields_patch(annotation, seen)
+    if dataclasses.is_dataclass(annotation):
+        return _UNKNOWN
+    return None
+
+def _fields_patch(model_class: Type[BaseModel], seen: Tuple) -> Any:
+    if model_class in seen:    # Recursive model
+        return _UNKNOWN
+    decorators = model_class.__pydantic_decorators__
+    if (decorators.field_serializers or decorators.model_serializers
+            or model_class.model_config.get("extra") == "allow"):
+        return _UNKNOWN
+    seen = seen + (model_class,)
+    patches = []
+    annotations = [(name, field.annotation) for name, field in model_class.model_fields.items()
+                   if not field.exclude]
+    annotations += [(name, field.return_type) for name, field in model_class.model_computed_fields.items()]
+    for name, annotation in annotations:
+        patch = _datetime_patch(annotation, seen)
+        if patch is _UNKNOWN:
+            return _UNKNOWN
+        if patch is not None:
+            patches.append((name, patch))
+    if not patches:
+        return None
+
+    def patch_model(model, data):
+        for name, patch in patches:
+            data[name] = patch(getattr(model, name), data[name])
+        return data
+    return patch_model
+
+@lru_cache(maxsize=None)
+def _model_patch(model_class: Type[BaseModel]) -> Any:
+    """_datetime_patch for a model class. None for models without
+    datetimes, such as Candidate, so they pay nothing for the patching."""
+    return _fields_patch(model_class, ())
+
 def dumps(obj: Any) -> str:
-    """Serialize obj to a JSON formatted string using the custom encoder."""
-    return json.dumps(obj, cls=JsonEncoder)
+    """Serialize obj to a JSON formatted string.
+
+    Models and lists of models of one class are converted in a single
+    pydantic-core call and then encoded without any per-object callbacks.
+    Everything else goes through json.dumps with a plain default function.
+    """
+    if isinstance(obj, BaseModel) and _model_patch(type(obj)) is not _UNKNOWN:
+        data = obj.model_dump(mode="json")
+        patch = _model_patch(type(obj))
+        return json.dumps(data if patch is None else patch(obj, data))
+    if isinstance(obj, (list, tuple)) and obj and isinstance(obj[0], BaseModel):
+        model_class = type(obj[0])
+        if _model_patch(model_class) is not _UNKNOWN and all(type(item) is model_class for item in obj):
+            # Convert in small chunks so the intermediate dicts die young;
+            # one huge list of fresh dicts makes the cyclic GC rescan it
+            # over and over. The output is the same as one json.dumps call.
+            return "[" + ", ".join(
+                json.dumps(models_to_dicts(obj[start:start + _DUMPS_CHUNK_SIZE]))[1:-1]
+                for start in range(0, len(obj), _DUMPS_CHUNK_SIZE)
+            ) + "]"
+    return json.dumps(obj, default=_encode_default)
 
 def loads(json_str: str) -> Any:
     """Deserialize json_str to a Python object."""
@@ -44,4 +185,25 @@ def model_to_dict(model: BaseModel) -> Dict:
 
 def dict_to_model(data: Dict, model_class: Type[T]) -> T:
     """Convert a dict to a Pydantic model."""
-    return model_class.model_validate(data) 
\ No newline at end of file
+    return model_class.model_validate(data)
+
+def models_to_dicts(models: Sequence[T]) -> List[Dict]:
+    """Convert many models of one class to JSON-compatible dicts at once.
+
+    Equivalent to calling model_to_dict on each model, but nested values are
+    converted too and the whole list is serialized in one pydantic-core call.
+    Datetimes are written with isoformat(), like JsonEncoder.
+    """
+    if not models:
+        return []
+    patch = _model_patch(type(models[0]))
+    if patch is _UNKNOWN:
+        return json.loads(json.dumps(list(models), default=_encode_default))
+    data = _list_adapter(type(models[0])).dump_python(models, mode="json")
+    if patch is not None:
+        data = [patch(model, model_data) for model, model_data in zip(models, data)]
+    return data
+
+def dicts_to_models(data: Sequence[Dict], model_class: Type[T]) -> List[T]:
+    """Validate many dicts into models of model_class in one call."""
+    return _list_adapter(model_class).validate_python(data) 
\ No newline at end of file
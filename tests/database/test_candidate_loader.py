@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from uuid import uuid4
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from src.resume.models import Candidate
+from src.database.candidate_loader import (
+    CandidateCopyLoader, format_copy_rows, iter_candidates_from_file, LoadSummary,
+)
+from src.database.database import get_engine
+from src.resume.utils.embedding import embed_candidate, parse_vector
+
+def load_test_data(filename):
+    data_dir = Path(__file__).parent.parent / 'data' / 'candidates'
+    with open(data_dir / filename, 'r') as f:
+        return json.load(f)
+
+class TestCandidateLoader:
+    def test_copy_rows_escape_backslashes(self):
+        data = load_test_data('candidate_complete.json')
+        data['education'] = 'Master\'s "Computer\\Science"'
+        candidate = Candidate(**data)
+
+        row = format_copy_rows([candidate])
+        candidate_id, payload, _ = row.rstrip("\n").split("\t")
+
+        assert candidate_id == str(candidate.id)
+        # COPY text format turns \\ back into a single backslash
+        restored = payload.replace("\\\\", "\\")
+        assert Candidate.model_validate_json(restored) == candidate
+
+    def test_copy_rows_carry_the_embedding(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+
+        embedding = format_copy_rows([candidate]).rstrip("\n").split("\t")[2]
+
+        assert np.allclose(parse_vector(embedding), embed_candidate(candidate))
+
+    def test_iter_candidates_from_json_lines_file(self, tmp_path):
+        data = load_test_data('candidate_required_only.json')
+        source = tmp_path / 'candidates.jsonl'
+        source.write_text(json.dumps(data) + "\n\n" + json.dumps(data) + "\n")
+
+        candidates = list(iter_candidates_from_file(source))
+
+        assert len(candidates) == 2
+        assert candidates[0].full_name == "Jane Smith"
+
+    def test_summary_reports_rows_per_second(self):
+        summary = LoadSummary(rows=1000, batches=1, seconds=0.5)
+
+        assert summary.rows_per_second == 2000
+        assert "2,000 rows/s" in str(summary)
+
+    def test_repeated_ids_keep_the_last_copy(self):
+        engine = get_engine()
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except OperationalError:
+            pytest.skip("PostgreSQL is not available")
+
+        first = Candidate(**{**load_test_data('candidate_required_only.json'), 'id': uuid4()})
+        versions = [first.model_copy(update={"full_name": f"Version {number}"}) for number in range(5)]
+        try:
+            CandidateCopyLoader(engine, batch_size=100).load(versions)
+            with engine.connect() as connection:
+                stored = connection.execute(text("SELECT data ->> 'full_name' FROM candidates WHERE id = :id"),
+                                            {"id": first.id}).scalar()
+        finally:
+            with engine.begin() as connection:
+                connection.execute(text("DELETE FROM candidates WHERE id = :id"), {"id": first.id})
+
+        assert stored == "Version 4"
@@ -0,0 +1,127 @@
+import json
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+from src.database.change_listener import CandidateChangeListener
+from src.resume.models import Candidate
+from src.resume.repository.candidate_changes import ChangeWatermark
+
+class FakeConnection:
+    """Notifications are queued by the test; the pipe is never readable"""
+    def __init__(self):
+        self.notifies = []
+        self.executed = []
+        self._read, self._write = os.pipe()
+
+    def notify(self, op, ids):
+        payload = json.dumps({"op": op, "ids": [str(id) for id in ids]})
+        self.notifies.append(SimpleNamespace(channel="candidate_changes", payload=payload))
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql):
+                connection.executed.append(sql)
+        return Cursor()
+
+    def fileno(self):
+        return self._read
+
+    def poll(self):
+        pass
+
+    def close(self):
+        os.close(self._read)
+        os.close(self._write)
+
+class FakeSession:
+    """Answers every statement with the next prepared list of rows"""
+    def __init__(self, results):
+        self.results = results
+
+    def execute(self, statement):
+        rows = self.results.pop(0) if self.results else []
+        return SimpleNamespace(all=lambda: rows, first=lambda: rows[0] if rows else None)
+
+    def close(self):
+        pass
+
+def make_listener(results, **kwargs):
+    connection = FakeConnection()
+    listener = CandidateChangeListener(
+        session_factory=lambda: FakeSession(results), connect=lambda: connection,
+        batch_window=0.01, **kwargs,
+    )
+    return listener, connection
+
+def candidate():
+    return Candidate(full_name="Jane Doe", email="jane@example.com", phone="555-0100",
+                     education="BS", skills=["python"])
+
+def test_connect_listens_and_catches_up_from_the_watermark():
+    saved = candidate()
+    changed_at = datetime(2026, 1, 1)
+    # catch-up: upserts, deletions, then an empty round
+    results = [[(changed_at, saved.id, saved.model_dump(mode="json"))], [], [], []]
+    listener, connection = make_listener(results, watermark=ChangeWatermark(datetime(2025, 12, 31), uuid4()))
+    batches = []
+    listener.subscribe(batches.append)
+
+    listener.connect()
+
+    assert connection.executed == ["LISTEN candidate_changes"]
+    assert [c.id for c in batches[0].upserted] == [saved.id]
+    assert listener.watermark == ChangeWatermark(changed_at, saved.id)
+    listener.close()
+
+def test_poll_batches_notifications_and_keeps_the_last_op_per_id():
+    saved, removed = candidate(), uuid4()
+    changed_at = datetime(2026, 1, 2)
+    results = [[], [], [(changed_at, saved.id, saved.model_dump(mode="json"))]]
+    listener, connection = make_listener(results, watermark=ChangeWatermark(datetime(2026, 1, 1), uuid4()))
+    batches = []
+    listener.subscribe(batches.append)
+    listener.connect()
+
+    connection.notify("upsert", [saved.id, removed])
+    connection.notify("delete", [removed])
+    delivered = listener.poll()
+
+    assert delivered == 2
+    assert len(batches) == 1
+    assert [c.id for c in batches[0].upserted] == [saved.id]
+    assert batches[0].deleted == [removed]
+    assert listener.watermark.changed_at == changed_at
+    listener.close()
+
+def test_poll_without_notifications_delivers_nothing():
+    listener, _ = make_listener([[], []], watermark=ChangeWatermark(datetime(2026, 1, 1), uuid4()))
+    listener.connect()
+
+    assert listener.poll(timeout=0.01) == 0
+    listener.close()
+
+def test_a_failing_subscriber_does_not_stop_the_others():
+    results = [[], [], []]
+    listener, connection = make_listener(results, watermark=ChangeWatermark(datetime(2026, 1, 1), uuid4()))
+    batches = []
+
+    def broken(batch):
+        raise RuntimeError("boom")
+
+    listener.subscribe(broken)
+    listener.subscribe(batches.append)
+    listener.connect()
+    connection.notify("delete", [uuid4()])
+    listener.poll()
+
+    assert len(batches) == 1
+    listener.close()
@@ -0,0 +1,118 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from src.database.database import PoolSettings, TimedQueuePool, pool_metrics
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+class FakeConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+class TestPoolSettings:
+    def test_defaults_enable_pre_ping_and_recycle(self, monkeypatch):
+        for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_PRE_PING", "DB_POOL_RECYCLE"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = PoolSettings.from_env()
+
+        assert settings.pool_pre_ping
+        assert settings.engine_kwargs()["pool_recycle"] == 1800
+
+    def test_reads_pool_settings_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+        monkeypatch.setenv("DB_APPLICATION_NAME", "matcher")
+        monkeypatch.setenv("DB_CONNECT_TIMEOUT", "3")
+
+        settings = PoolSettings.from_env()
+
+        assert settings.engine_kwargs()["pool_size"] == 20
+        assert settings.engine_kwargs()["max_overflow"] == 0
+        assert not settings.pool_pre_ping
+        assert settings.psycopg2_connect_args() == {
+            "application_name": "matcher",
+            "connect_timeout": 3,
+            "options": "-c statement_timeout=5000",
+        }
+        assert settings.asyncpg_connect_args() == {
+            "server_settings": {"application_name": "matcher", "statement_timeout": "5000"},
+            "timeout": 3,
+        }
+
+    def test_invalid_number_names_the_variable(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "lots")
+
+        with pytest.raises(ValueError) as exc_info:
+            PoolSettings.from_env()
+        assert "DB_POOL_SIZE" in str(exc_info.value)
+
+class TestPoolMetrics:
+    def test_counts_checkouts_and_overflow(self):
+        pool = TimedQueuePool(FakeConnection, pool_size=1, max_overflow=1)
+
+        first = pool.connect()
+        second = pool.connect()
+        metrics = pool_metrics(pool)
+
+        assert metrics.checked_out == 2
+        assert metrics.overflow == 1
+        assert metrics.acquisitions == 2
+        assert metrics.max_wait_seconds >= 0
+
+        first.close()
+        second.close()
+        assert pool_metrics(pool).checked_out == 0
+
+def test_import_does_not_create_engine():
+    code = (
+        "import sys, src.database.database as db; "
+        "assert db.get_engine.cache_info().currsize == 0; "
+        "assert db.get_settings.cache_info().currsize == 0; "
+        "assert 'psycopg2' not in sys.modules and 'asyncpg' not in sys.modules; "
+        "assert 'sqlalchemy.ext.asyncio' not in sys.modules and 'dotenv' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
+
+@pytest.mark.parametrize("module", ["src.database.seed_candidates", "src.database.refresh_analytics",
+                                    "src.database.match_candidates"])
+def test_importing_a_cli_does_not_create_engine(module):
+    # benchmarks and tests import helpers from these scripts
+    code = (
+        f"import sys, {module}, src.database.database as db; "
+        "assert db.get_engine.cache_info().currsize == 0; "
+        "assert db.get_sessionmaker.cache_info().currsize == 0; "
+        "assert 'psycopg2' not in sys.modules and 'dotenv' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
+
+def import_times(module: str) -> dict:
+    """Cumulative import time in microseconds of every module loaded by
+    importing `module` in a fresh interpreter (python -X importtime)."""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=PROJECT_ROOT, check=True, capture_output=True, text=True)
+    times = {}
+    for line in completed.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_settings_import_cost():
+    times = import_times("src.database.settings")
+
+    # Standard library only: no SQLAlchemy, driver or dotenv until first use
+    assert not {"sqlalchemy", "dotenv", "psycopg2"} & times.keys()
+    assert times["src.database.settings"] < 50_000
+
+def test_database_import_cost():
+    times = import_times("src.database.database")
+
+    assert not {"sqlalchemy.ext.asyncio", "dotenv", "psycopg2", "asyncpg"} & times.keys()
+    # SQLAlchemy itself dominates; the module must not add much on top of it
+    assert times["src.database.database"] - times["sqlalchemy"] < 100_000
@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, text
+from src.database.instrumentation import (
+    Histogram, InMemorySink, Instrumentation, PrometheusSink, UNSCOPED,
+    instrumented, timed_hydration,
+)
+
+class Repository:
+    def __init__(self, engine):
+        self.engine = engine
+
+    @instrumented
+    def find_numbers(self, count):
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(" UNION ALL ".join(["SELECT 1"] * count))).all()
+        with timed_hydration(len(rows)):
+            return [row[0] for row in rows]
+
+    @instrumented
+    def iter_numbers(self, count):
+        with self.engine.connect() as conn:
+            yield from (row[0] for row in conn.execute(text(" UNION ALL ".join(["SELECT 1"] * count))))
+
+    @instrumented
+    async def find_async(self):
+        return [1, 2]
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+@pytest.fixture
+def sink(engine):
+    sink = PrometheusSink()
+    instrumentation = Instrumentation([sink], slow_query_seconds=0.0).install(engine)
+    yield sink
+    instrumentation.uninstall()
+
+def test_statements_are_attributed_to_the_calling_method(engine, sink):
+    repository = Repository(engine)
+
+    assert repository.find_numbers(3) == [1, 1, 1]
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 2"))
+
+    operation = "Repository.find_numbers"
+    assert sink.operation_seconds[operation].count == 1
+    assert sink.query_seconds[operation].count == 1
+    assert sink.query_seconds[UNSCOPED].count == 1
+    assert sink.rows[operation] == 3
+    assert sink.hydrated_rows[operation] == 3
+    assert sink.slow_queries[0].operation == operation
+    # Not a PostgreSQL connection and not requested: no plan captured
+    assert sink.slow_queries[0].plan is None
+
+def test_generators_are_timed_over_the_whole_iteration(engine, sink):
+    assert sum(Repository(engine).iter_numbers(4)) == 4
+
+    assert sink.rows["Repository.iter_numbers"] == 4
+    assert sink.query_seconds["Repository.iter_numbers"].count == 1
+
+def test_async_methods_are_timed(engine, sink):
+    assert asyncio.run(Repository(engine).find_async()) == [1, 2]
+
+    assert sink.rows["Repository.find_async"] == 2
+
+def test_nothing_is_recorded_when_not_installed(engine):
+    sink = InMemorySink()
+    Instrumentation([sink]).install(engine).uninstall()
+
+    Repository(engine).find_numbers(2)
+
+    assert not sink.operation_seconds and not sink.query_seconds
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.quantile(0.5) == 1.0
+
+def test_prometheus_text_format(engine, sink):
+    Repository(engine).find_numbers(1)
+
+    rendered = sink.render()
+
+    assert "# TYPE resumedb_repository_operation_seconds histogram" in rendered
+    assert 'resumedb_repository_operation_seconds_count{operation="Repository.find_numbers"} 1' in rendered
+    assert 'resumedb_sql_query_seconds_bucket{operation="Repository.find_numbers",le="+Inf"} 1' in rendered
+    assert 'resumedb_repository_rows_total{operation="Repository.find_numbers"} 1' in rendered
+    assert 'resumedb_slow_queries_total{operation="Repository.find_numbers"} 1' in rendered
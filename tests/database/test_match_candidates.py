@@ -0,0 +1,21 @@
+import io
+import json
+from uuid import uuid4
+from src.database.match_candidates import write_matches
+from src.resume.models import Job
+from src.resume.services.batch_matching import JobMatches
+from src.resume.services.matching_service import CandidateMatch
+
+def test_write_matches_emits_one_json_line_per_job():
+    job = Job(title="Engineer", company="Acme", location="Remote",
+              required_skills=["Python"], min_experience=0, job_type="Remote")
+    candidate_id = uuid4()
+    out = io.StringIO()
+
+    written = write_matches([JobMatches(job=job, matches=[CandidateMatch(candidate_id, 1.0, 1)])], out)
+
+    assert written == 1
+    assert json.loads(out.getvalue()) == {
+        "job_id": str(job.id),
+        "matches": [{"candidate_id": str(candidate_id), "score": 1.0, "matched_skills": 1}],
+    }
@@ -0,0 +1,134 @@
+import asyncio
+import random
+import pytest
+from sqlalchemy import exc
+from src.database.readiness import (
+    Backoff, main, probe_in_background, wait_until_ready, wait_until_ready_async,
+)
+
+def refused():
+    return exc.OperationalError("SELECT version()", {}, OSError("connection refused"))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+class FakeConnection:
+    def execute(self, statement):
+        return self
+
+    def scalar(self):
+        return "PostgreSQL 16.2"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class AsyncFakeConnection(FakeConnection):
+    async def execute(self, statement):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+class FakeEngine:
+    """Fails the first `failures` connects with `error`."""
+
+    def __init__(self, failures=0, error=refused, connection=FakeConnection):
+        self.failures = failures
+        self.error = error
+        self.connection = connection
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        if self.connects <= self.failures:
+            raise self.error()
+        return self.connection()
+
+NO_JITTER = Backoff(initial=0.1, multiplier=2.0, max_delay=0.5, jitter=0.0)
+
+def test_ready_on_first_attempt_does_not_sleep():
+    clock = FakeClock()
+
+    result = wait_until_ready(FakeEngine(), sleep=clock.sleep, clock=clock)
+
+    assert result and result.attempts == 1
+    assert result.server_version == "PostgreSQL 16.2"
+    assert clock.sleeps == []
+
+def test_retries_with_capped_exponential_backoff():
+    clock = FakeClock()
+
+    result = wait_until_ready(FakeEngine(failures=4), backoff=NO_JITTER, sleep=clock.sleep, clock=clock)
+
+    assert result.ready and result.attempts == 5
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+def test_gives_up_at_the_deadline():
+    clock = FakeClock()
+
+    result = wait_until_ready(FakeEngine(failures=100), deadline=1.0, backoff=NO_JITTER,
+                              sleep=clock.sleep, clock=clock)
+
+    assert not result
+    assert "connection refused" in result.error
+    # The last sleep is cut short so the final attempt happens at the deadline
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+def test_unexpected_errors_are_not_retried():
+    engine = FakeEngine(failures=1, error=lambda: exc.ProgrammingError("SELECT", {}, Exception("bad")))
+
+    with pytest.raises(exc.ProgrammingError):
+        wait_until_ready(engine, sleep=FakeClock().sleep)
+    assert engine.connects == 1
+
+def test_jitter_only_shortens_delays():
+    delays = Backoff(initial=1.0, multiplier=1.0, jitter=0.5).delays(random.Random(7))
+
+    samples = [next(delays) for _ in range(100)]
+
+    assert all(0.5 <= delay <= 1.0 for delay in samples)
+    assert len(set(samples)) > 1
+
+def test_async_probe_retries_without_blocking():
+    clock = FakeClock()
+    engine = FakeEngine(failures=2, connection=AsyncFakeConnection)
+
+    result = asyncio.run(wait_until_ready_async(engine, backoff=NO_JITTER, sleep=clock.async_sleep, clock=clock))
+
+    assert result.ready and result.attempts == 3
+    assert clock.sleeps == pytest.approx([0.1, 0.2])
+
+def test_background_probe_returns_a_future():
+    future = probe_in_background(FakeEngine())
+
+    assert future.result(timeout=5).ready
+
+def test_health_check_exit_codes(monkeypatch):
+    monkeypatch.setattr("src.database.readiness.get_engine", lambda: FakeEngine())
+    assert main(["--quiet"]) == 0
+
+    monkeypatch.setattr("src.database.readiness.get_engine", lambda: FakeEngine(failures=100))
+    assert main(["--quiet", "--deadline", "0"]) == 1
+
+    def invalid_settings():
+        raise ValueError("DB_POOL_SIZE must be an integer, got 'lots'")
+    monkeypatch.setattr("src.database.readiness.get_engine", invalid_settings)
+    assert main(["--quiet"]) == 2
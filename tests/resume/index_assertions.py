@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from src.database.database import get_sessionmaker
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN wrapper that keeps the wrapped statement's bind parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+def index_exists(session, name):
+    return session.execute(
+        text("SELECT 1 FROM pg_indexes WHERE indexname = :name"),
+        {"name": name},
+    ).first() is not None
+
+def explain_session():
+    """Session against the configured database; skipped when it is not reachable"""
+    session = get_sessionmaker()()
+    try:
+        session.execute(text("SELECT 1"))
+    except OperationalError:
+        session.close()
+        pytest.skip("PostgreSQL is not available")
+    # On a small table a sequential scan is always cheapest; take it off the
+    # table so the plan shows whether an index *can* serve the query
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    yield session
+    session.rollback()
+    session.close()
+
+def plan_for(session, statement):
+    return "\n".join(row[0] for row in session.execute(Explain(statement)))
+
+def assert_uses_index(session, statement, index_name):
+    if not index_exists(session, index_name):
+        pytest.skip(f"Index {index_name} not present, run `alembic upgrade head`")
+    plan = plan_for(session, statement)
+    assert index_name in plan, plan
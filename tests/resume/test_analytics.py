@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.resume.repository.analytics_queries import (
+    AnalyticsView, ExperienceCount, TermCount, counts_statement, refresh_statement,
+)
+from src.resume.repository.analytics_repository import AnalyticsRepository
+from src.resume.services.analytics_service import AnalyticsService
+
+REFRESHED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+class FakeSession:
+    """Answers execute() calls from a queue of results, in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        rows = self.results.pop(0)
+        return SimpleNamespace(
+            all=lambda: rows,
+            first=lambda: rows[0] if rows else None,
+            scalar=lambda: rows[0][0] if rows else None,
+        )
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+def refresh_info(view, age):
+    return SimpleNamespace(view_name=view.value, refreshed_at=REFRESHED_AT, age=age, duration_seconds=0.1)
+
+def test_counts_are_ordered_most_common_first():
+    sql = str(counts_statement(AnalyticsView.SKILLS, 10).compile(dialect=postgresql.dialect()))
+
+    assert "FROM candidate_skill_counts" in sql
+    assert "ORDER BY candidate_skill_counts.candidates DESC, candidate_skill_counts.skill" in sql
+    assert "LIMIT" in sql
+
+def test_refresh_is_concurrent_by_default():
+    assert str(refresh_statement(AnalyticsView.SKILLS)) == \
+        "REFRESH MATERIALIZED VIEW CONCURRENTLY candidate_skill_counts"
+    assert str(refresh_statement(AnalyticsView.SKILLS, concurrently=False)) == \
+        "REFRESH MATERIALIZED VIEW candidate_skill_counts"
+
+def test_report_carries_typed_rows_and_staleness():
+    session = FakeSession([("Python", 12), ("SQL", 7)], [refresh_info(AnalyticsView.SKILLS, timedelta(minutes=5))])
+
+    report = AnalyticsRepository(session).skill_counts(limit=2)
+
+    assert list(report) == [TermCount("Python", 12), TermCount("SQL", 7)]
+    assert report.refreshed_at == REFRESHED_AT
+    assert not report.is_stale(timedelta(minutes=10))
+    assert report.is_stale(timedelta(minutes=1))
+
+def test_never_refreshed_view_is_stale():
+    session = FakeSession([(3, 40)], [])
+
+    report = AnalyticsRepository(session).experience_counts()
+
+    assert report.rows == [ExperienceCount(3, 40)]
+    assert report.refreshed_at is None and report.age is None
+    assert report.is_stale(timedelta(days=365))
+
+def test_refresh_records_each_view_and_commits():
+    session = FakeSession([(True,)], [(REFRESHED_AT,)], [], [])
+
+    [refresh] = AnalyticsRepository(session).refresh([AnalyticsView.EDUCATION])
+
+    assert not refresh.skipped and refresh.refreshed_at == REFRESHED_AT
+    assert "pg_try_advisory_xact_lock" in session.statements[0]
+    assert session.statements[2] == "REFRESH MATERIALIZED VIEW CONCURRENTLY candidate_education_counts"
+    assert "INSERT INTO analytics_refreshes" in session.statements[3]
+    assert "ON CONFLICT (view_name) DO UPDATE" in session.statements[3]
+    assert session.commits == 1
+
+def test_refresh_skips_a_view_locked_by_another_session():
+    session = FakeSession([(False,)])
+
+    [refresh] = AnalyticsRepository(session).refresh([AnalyticsView.SKILLS])
+
+    assert refresh.skipped
+    assert len(session.statements) == 1
+    assert session.rollbacks == 1 and session.commits == 0
+
+def test_failed_refresh_rolls_back():
+    class FailingSession(FakeSession):
+        def execute(self, statement, params=None):
+            if str(statement).startswith("REFRESH"):
+                raise RuntimeError("refresh failed")
+            return super().execute(statement, params)
+
+    session = FailingSession([(True,)], [(REFRESHED_AT,)])
+
+    with pytest.raises(RuntimeError):
+        AnalyticsRepository(session).refresh([AnalyticsView.SKILLS])
+    assert session.rollbacks == 1 and session.commits == 0
+
+def test_refresh_stale_only_rebuilds_old_views():
+    fresh, old = timedelta(minutes=1), timedelta(hours=2)
+    session = FakeSession(
+        [refresh_info(AnalyticsView.SKILLS, fresh), refresh_info(AnalyticsView.JOB_TYPES, old),
+         refresh_info(AnalyticsView.EDUCATION, fresh)],
+        # the experience view was never refreshed; both stale views are rebuilt
+        [(True,)], [(REFRESHED_AT,)], [], [],
+        [(True,)], [(REFRESHED_AT,)], [], [],
+    )
+    service = AnalyticsService(AnalyticsRepository(session), max_age=timedelta(minutes=15))
+
+    refreshed = service.refresh_stale()
+
+    assert [refresh.view for refresh in refreshed] == [AnalyticsView.JOB_TYPES, AnalyticsView.EXPERIENCE]
+    assert session.commits == 2
+
+def test_refresh_stale_does_nothing_when_everything_is_fresh():
+    session = FakeSession([refresh_info(view, timedelta(seconds=30)) for view in AnalyticsView])
+
+    assert AnalyticsService(AnalyticsRepository(session)).refresh_stale() == []
+    assert len(session.statements) == 1
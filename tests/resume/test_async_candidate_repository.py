@@ -0,0 +1,83 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from src.resume.models import Candidate
+from src.resume.repository.async_candidate_repository import AsyncCandidateRepository
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.services.async_candidate_service import AsyncCandidateService
+from src.resume.utils.json_utils import model_to_dict
+
+QUERY_LATENCY = 0.05
+
+def load_test_data(filename):
+    data_dir = Path(__file__).parent.parent / 'data' / 'candidates'
+    with open(data_dir / filename, 'r') as f:
+        return json.load(f)
+
+class InFlight:
+    """Counts queries waiting on the simulated network, shared by sessions"""
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+class SlowAsyncSession:
+    """Answers every query with the same rows after a simulated network delay"""
+    def __init__(self, rows, in_flight=None):
+        self.rows = rows
+        self.statements = []
+        self.in_flight = in_flight or InFlight()
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        self.in_flight.current += 1
+        self.in_flight.peak = max(self.in_flight.peak, self.in_flight.current)
+        try:
+            await asyncio.sleep(QUERY_LATENCY)
+        finally:
+            self.in_flight.current -= 1
+        return SimpleNamespace(all=lambda: list(self.rows), first=lambda: self.rows[0])
+
+def stored_row(candidate):
+    return (model_to_dict(candidate), None, candidate.id)
+
+class TestAsyncCandidateRepository:
+    def test_concurrent_searches_overlap(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        in_flight = InFlight()
+        sessions = [SlowAsyncSession([stored_row(candidate)], in_flight) for _ in range(10)]
+
+        async def search_all():
+            return await asyncio.gather(*(
+                AsyncCandidateService(AsyncCandidateRepository(session)).search_candidates("john")
+                for session in sessions
+            ))
+
+        pages = asyncio.run(search_all())
+
+        assert [page[0] for page in pages] == [candidate] * 10
+        # Sequential queries would never have more than one in flight
+        assert in_flight.peak == len(sessions)
+
+    def test_async_and_sync_repositories_share_statements(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        async_session = SlowAsyncSession([stored_row(candidate)])
+        sync_session = SimpleNamespace(statements=[])
+        sync_session.execute = lambda statement, params=None: (
+            sync_session.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            or SimpleNamespace(all=lambda: [stored_row(candidate)])
+        )
+
+        asyncio.run(AsyncCandidateRepository(async_session).find_by_skills(["Python"], limit=10))
+        CandidateRepository(sync_session).find_by_skills(["Python"], limit=10)
+
+        assert async_session.statements == sync_session.statements
+
+    def test_find_by_id_trusted_read(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        session = SlowAsyncSession([(model_to_dict(candidate),)])
+
+        found = asyncio.run(AsyncCandidateRepository(session, trusted_reads=True).find_by_id(candidate.id))
+
+        assert found == candidate
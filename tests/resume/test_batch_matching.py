@@ -0,0 +1,56 @@
+import random
+import pytest
+from uuid import uuid4
+from src.resume.models import Candidate, Job
+from src.resume.services.batch_matching import BatchMatcher, shard_bounds
+from src.resume.services.matching_service import CandidateSkillIndex
+
+SKILLS = [f"skill-{i}" for i in range(90)]
+JOB_TYPES = ["Full-time", "Contract", "Remote"]
+
+def random_index(count, seed=7):
+    rng = random.Random(seed)
+    index = CandidateSkillIndex()
+    index.add_many(
+        Candidate.model_construct(
+            id=uuid4(), skills=rng.sample(SKILLS, 5), experience_years=rng.randint(0, 10),
+            preferred_job_types=rng.sample(JOB_TYPES, rng.randint(0, 2)),
+        )
+        for _ in range(count)
+    )
+    return index
+
+def random_jobs(count, seed=11):
+    rng = random.Random(seed)
+    return [
+        Job(title="Engineer", company="Acme", location="Remote",
+            required_skills=rng.sample(SKILLS, 3), min_experience=rng.randint(0, 5),
+            job_type=rng.choice(JOB_TYPES))
+        for _ in range(count)
+    ]
+
+def test_shard_bounds_cover_every_row_once():
+    assert shard_bounds(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert shard_bounds(2, 8) == [(0, 1), (1, 2)]
+
+def test_process_pool_matches_single_job_ranking():
+    index = random_index(2000)
+    jobs = random_jobs(7)
+
+    results = list(BatchMatcher(index, workers=2, job_batch_size=3).match(jobs, k=5))
+
+    assert [r.job.id for r in results] == [job.id for job in jobs]
+    for result in results:
+        assert result.matches == index.top_k(result.job, 5)
+
+def test_single_worker_runs_in_process():
+    index = random_index(50)
+    jobs = random_jobs(2)
+
+    results = list(BatchMatcher(index, workers=1).match(jobs, k=3))
+
+    assert [r.matches for r in results] == [index.top_k(job, 3) for job in jobs]
+
+def test_rejects_invalid_k():
+    with pytest.raises(ValueError):
+        BatchMatcher(CandidateSkillIndex()).match([], k=0)
@@ -0,0 +1,149 @@
+import pytest
+from uuid import uuid4
+from src.resume.models import Candidate
+from src.resume.repository.cache import CachedCandidateRepository, LRUTTLCache
+from src.resume.repository.candidate_queries import UpsertBatchResult
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeRepository:
+    """In-memory stand-in for CandidateRepository that counts lookups"""
+    def __init__(self):
+        self.rows = {}
+        self.lookups = 0
+        self.batches = []
+
+    def find_by_id(self, id, fields=None):
+        self.lookups += 1
+        return self.rows.get(id)
+
+    def find_by_ids(self, ids, fields=None, chunk_size=1000):
+        self.batches.append(list(ids))
+        return [self.rows.get(id) for id in ids]
+
+    def save(self, candidate):
+        self.rows[candidate.id] = candidate
+        return candidate
+
+    def save_many(self, candidates, batch_size=1000):
+        candidates = list(candidates)
+        for candidate in candidates:
+            self.rows[candidate.id] = candidate
+        return [UpsertBatchResult(batch_number=1, inserted=0, updated=len(candidates))]
+
+    def find_by_skills(self, skills):
+        return ["delegated"]
+
+def make_candidate(name="Jane Doe"):
+    return Candidate(full_name=name, email="jane@example.com", phone="555-0100",
+                     education="BSc")
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUTTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = LRUTTLCache(ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+def test_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        LRUTTLCache(maxsize=0)
+    with pytest.raises(ValueError):
+        LRUTTLCache(ttl=0)
+
+def test_find_by_id_reads_through_once():
+    repository = FakeRepository()
+    candidate = make_candidate()
+    repository.rows[candidate.id] = candidate
+    cached = CachedCandidateRepository(repository)
+
+    assert cached.find_by_id(candidate.id) is candidate
+    assert cached.find_by_id(candidate.id) is candidate
+    assert repository.lookups == 1
+    assert cached.find_by_id(uuid4()) is None
+    assert cached.cache.stats.misses == 2
+
+def test_projection_bypasses_cache():
+    repository = FakeRepository()
+    cached = CachedCandidateRepository(repository)
+
+    cached.find_by_id(uuid4(), fields=["skills"])
+    cached.find_by_id(uuid4(), fields=["skills"])
+
+    assert repository.lookups == 2
+    assert cached.cache.stats.misses == 0
+
+def test_save_refreshes_and_save_many_invalidates():
+    repository = FakeRepository()
+    cached = CachedCandidateRepository(repository)
+    candidate = make_candidate()
+
+    cached.save(candidate)
+    assert cached.find_by_id(candidate.id) is candidate
+    assert repository.lookups == 0
+
+    renamed = candidate.model_copy(update={"full_name": "Jane Smith"})
+    cached.save_many([renamed])
+    assert cached.find_by_id(candidate.id).full_name == "Jane Smith"
+    assert repository.lookups == 1
+
+def test_save_many_invalidates_each_batch_once_committed():
+    repository = FakeRepository()
+    cached = CachedCandidateRepository(repository)
+    first, second = make_candidate(), make_candidate()
+    for candidate in (first, second):
+        cached.save(candidate)
+    cached_during_second_batch = []
+
+    def candidates():
+        yield first.model_copy(update={"full_name": "Jane Smith"})
+        # The first batch is committed before the second one is read
+        cached_during_second_batch.append(cached.cache.get(first.id))
+        yield second.model_copy(update={"full_name": "Jane Smith"})
+
+    results = cached.save_many(candidates(), batch_size=1)
+
+    assert cached_during_second_batch == [None]
+    assert [result.batch_number for result in results] == [1, 2]
+    assert cached.find_by_id(second.id).full_name == "Jane Smith"
+
+def test_find_by_ids_only_loads_uncached_ids():
+    repository = FakeRepository()
+    hot, cold = make_candidate(), make_candidate()
+    repository.rows = {hot.id: hot, cold.id: cold}
+    cached = CachedCandidateRepository(repository)
+    cached.find_by_id(hot.id)
+    missing = uuid4()
+
+    found = cached.find_by_ids([cold.id, hot.id, missing, cold.id])
+
+    assert found == [cold, hot, None, cold]
+    assert repository.batches == [[cold.id, missing]]
+    assert cached.find_by_id(cold.id) is cold
+    assert repository.lookups == 1
+
+def test_other_methods_are_delegated():
+    assert CachedCandidateRepository(FakeRepository()).find_by_skills(["SQL"]) == ["delegated"]
@@ -0,0 +1,134 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from src.database.instrumentation import InMemorySink, Instrumentation
+from src.resume.models import Candidate
+from src.resume.repository.cache import CachedCandidateRepository
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.repository.candidate_changes import (
+    CandidateChangeBatch, ChangeOp, ChangeWatermark, changed_rows_batch,
+    merge_changes, parse_notification, upserts_since_statement,
+)
+from src.resume.services.matching_service import MatchingService
+from src.resume.services.similarity_index import CandidateSimilarityIndex
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+def make_candidate(name="Jane Doe", skills=("python",)):
+    return Candidate(full_name=name, email="jane@example.com", phone="555-0100",
+                     education="BS", skills=list(skills), experience_years=4)
+
+def stored(candidate):
+    return candidate.model_dump(mode="json")
+
+def at(seconds):
+    return T0 + timedelta(seconds=seconds)
+
+def test_parse_notification():
+    ids = [uuid4(), uuid4()]
+    op, parsed = parse_notification(json.dumps({"op": "delete", "ids": [str(id) for id in ids]}))
+
+    assert op is ChangeOp.DELETE
+    assert parsed == ids
+
+def test_watermark_query_is_a_row_value_keyset():
+    after = ChangeWatermark(T0, uuid4())
+    sql = str(upserts_since_statement(after, 100).compile(dialect=postgresql.dialect()))
+
+    assert "(candidates.updated_at, candidates.id) > (" in sql
+    assert "ORDER BY candidates.updated_at, candidates.id" in sql
+
+def test_merge_orders_both_sources_and_keeps_the_last_change_per_id():
+    deleted_then_saved, saved_then_deleted = make_candidate("A"), make_candidate("B")
+    upserts = [
+        (at(1), saved_then_deleted.id, stored(saved_then_deleted)),
+        (at(3), deleted_then_saved.id, stored(deleted_then_saved)),
+    ]
+    deletions = [(at(2), deleted_then_saved.id), (at(4), saved_then_deleted.id)]
+
+    batch = merge_changes(upserts, deletions, limit=10, trusted=True)
+
+    assert [c.id for c in batch.upserted] == [deleted_then_saved.id]
+    assert batch.deleted == [saved_then_deleted.id]
+    assert batch.watermark == ChangeWatermark(at(4), saved_then_deleted.id)
+
+def test_merge_stops_at_the_limit():
+    first, second = make_candidate("A"), make_candidate("B")
+    upserts = [(at(1), first.id, stored(first)), (at(3), second.id, stored(second))]
+    deletions = [(at(2), uuid4())]
+
+    batch = merge_changes(upserts, deletions, limit=2, trusted=True)
+
+    assert len(batch) == 2
+    assert batch.watermark.changed_at == at(2)
+
+def test_merge_of_nothing_has_no_watermark():
+    assert merge_changes([], [], limit=10, trusted=True).watermark is None
+
+def test_notified_ids_without_a_row_are_deleted():
+    present, gone = make_candidate(), uuid4()
+    rows = [(at(5), present.id, stored(present))]
+
+    batch = changed_rows_batch({present.id: ChangeOp.DELETE, gone: ChangeOp.UPSERT}, rows, trusted=True)
+
+    assert [c.id for c in batch.upserted] == [present.id]
+    assert batch.deleted == [gone]
+    assert batch.watermark == ChangeWatermark(at(5), present.id)
+
+def test_matching_service_applies_changes_in_place():
+    kept, dropped = make_candidate("A"), make_candidate("B")
+    service = MatchingService()
+    service.add_candidates([kept, dropped])
+
+    kept.skills = ["go"]
+    service.apply_changes(CandidateChangeBatch(upserted=[kept], deleted=[dropped.id]))
+
+    assert len(service.index) == 1
+    assert service.index.skills.get("go") is not None
+
+def test_similarity_index_applies_changes():
+    kept, dropped = make_candidate("A"), make_candidate("B")
+    index = CandidateSimilarityIndex()
+    index.add_many([kept, dropped])
+
+    index.apply_changes(CandidateChangeBatch(deleted=[dropped.id]))
+
+    assert len(index) == 1
+    assert index.vector(dropped.id) is None
+
+def test_cache_drops_changed_entries():
+    candidate = make_candidate()
+    loads = []
+
+    class Repository:
+        def find_by_id(self, id, fields=None):
+            loads.append(id)
+            return candidate
+
+    cached = CachedCandidateRepository(Repository())
+    cached.find_by_id(candidate.id)
+    cached.apply_changes(CandidateChangeBatch(upserted=[candidate]))
+    cached.find_by_id(candidate.id)
+
+    assert loads == [candidate.id, candidate.id]
+
+def test_change_batches_are_counted_when_instrumented():
+    candidate, gone = make_candidate(), uuid4()
+    rows = [(at(1), candidate.id, stored(candidate))]
+    session = SimpleNamespace(execute=lambda statement: SimpleNamespace(
+        all=lambda: rows if len(statement.selected_columns) == 3 else [(at(2), gone)]))
+    repository = CandidateRepository(session, trusted_reads=True)
+    sink = InMemorySink()
+    instrumentation = Instrumentation([sink]).install(create_engine("sqlite://"))
+    try:
+        caught_up = repository.changes_since(None)
+        loaded = repository.load_changes({candidate.id: ChangeOp.UPSERT, gone: ChangeOp.DELETE})
+    finally:
+        instrumentation.uninstall()
+
+    assert len(caught_up) == len(loaded) == 2
+    assert sink.rows["CandidateRepository.changes_since"] == 2
+    assert sink.rows["CandidateRepository.load_changes"] == 2
@@ -0,0 +1,39 @@
+from datetime import datetime
+from uuid import uuid4
+import pytest
+from sqlalchemy import select
+from src.resume.repository.candidate_changes import (
+    ChangeWatermark, deletions_since_statement, upserts_since_statement,
+)
+from src.resume.repository.candidate_queries import (
+    CandidateOrder, _SORT_KEYS, name_or_email_filter, skills_filter
+)
+from src.resume.repository.db_models import CandidateRecord
+from tests.resume.index_assertions import assert_uses_index, explain_session
+
+session = pytest.fixture(explain_session, name="session")
+
+class TestCandidateIndexes:
+    def test_skills_search_uses_gin_index(self, session):
+        statement = select(CandidateRecord.id).where(skills_filter(["Python", "AWS"]).condition)
+        assert_uses_index(session, statement, "ix_candidates_skills")
+
+    def test_name_search_uses_trigram_index(self, session):
+        statement = select(CandidateRecord.id).where(name_or_email_filter("john").condition)
+        assert_uses_index(session, statement, "ix_candidates_full_name_lower_trgm")
+        assert_uses_index(session, statement, "ix_candidates_email_lower_trgm")
+
+    def test_experience_order_uses_generated_column_index(self, session):
+        columns = _SORT_KEYS[CandidateOrder.EXPERIENCE].columns
+        statement = select(CandidateRecord.id).order_by(*(c.desc() for c in columns)).limit(10)
+        assert_uses_index(session, statement, "ix_candidates_experience_years_id")
+
+    def test_created_order_uses_keyset_index(self, session):
+        columns = _SORT_KEYS[CandidateOrder.CREATED].columns
+        statement = select(CandidateRecord.id).order_by(*columns).limit(10)
+        assert_uses_index(session, statement, "ix_candidates_created_at_id")
+
+    def test_change_feed_catch_up_uses_watermark_indexes(self, session):
+        after = ChangeWatermark(datetime(2026, 1, 1), uuid4())
+        assert_uses_index(session, upserts_since_statement(after, 1000), "ix_candidates_updated_at_id")
+        assert_uses_index(session, deletions_since_statement(after, 1000), "ix_candidate_deletions_deleted_at_id")
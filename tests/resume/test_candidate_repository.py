@@ -0,0 +1,223 @@
+import json
+import numpy as np
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.resume.models import Candidate
+from src.resume.repository.candidate_repository import CandidateRepository
+from src.resume.repository.candidate_queries import (
+    CandidateOrder, build_upsert_statement, find_by_id_statement, find_by_ids_statement,
+    hydrate_candidates, page_query, skills_filter,
+)
+from src.resume.repository.pagination import encode_cursor
+from src.resume.utils.embedding import EMBEDDING_FIELDS, embed_candidates, format_vector
+from src.resume.utils.json_utils import model_to_dict
+
+def load_test_data(filename):
+    data_dir = Path(__file__).parent.parent / 'data' / 'candidates'
+    with open(data_dir / filename, 'r') as f:
+        return json.load(f)
+
+class FakeSession:
+    """Records executed statements and answers upserts as if every row were new"""
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        rows = statement.compile(dialect=postgresql.dialect()).params
+        count = sum(1 for key in rows if key.startswith("id_m"))
+        return SimpleNamespace(all=lambda: [SimpleNamespace(inserted=True)] * count)
+
+    def commit(self):
+        self.commits += 1
+
+class StreamingSession:
+    """Serves canned rows and remembers the execution options it was given"""
+    def __init__(self, rows):
+        self.rows = rows
+        self.options = None
+        self.closed = False
+
+    def execute(self, statement, params=None):
+        self.options = statement.get_execution_options()
+        return SimpleNamespace(partitions=lambda: iter([[(row,) for row in self.rows]]),
+                               close=self.close)
+
+    def close(self):
+        self.closed = True
+
+class LookupSession:
+    """Answers id = ANY(:ids) lookups from a dict of stored documents"""
+    def __init__(self, documents):
+        self.documents = documents
+        self.lookups = []
+
+    def execute(self, statement, params):
+        ids = params["ids"]
+        self.lookups.append(ids)
+        rows = [(id, self.documents[id]) for id in reversed(ids) if id in self.documents]
+        return SimpleNamespace(all=lambda: rows)
+
+class PreparingConnection:
+    """Pooled-connection stand-in: keeps `info` and records PREPARE/EXECUTE"""
+    def __init__(self, document):
+        self.info = {}
+        self.document = document
+        self.prepared = []
+        self.executed = []
+
+    def exec_driver_sql(self, sql):
+        self.prepared.append(sql)
+
+    def execute(self, statement, params):
+        self.executed.append((str(statement), params))
+        return SimpleNamespace(first=lambda: (self.document,))
+
+class TestCandidateRepository:
+    def test_upsert_statement_uses_on_conflict(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        sql = str(build_upsert_statement([{"id": candidate.id, "data": {}}])
+                  .compile(dialect=postgresql.dialect()))
+
+        assert "ON CONFLICT (id) DO UPDATE SET" in sql
+        assert "data = excluded.data" in sql
+        assert "updated_at = now()" in sql
+        assert "RETURNING candidates.id, xmax = 0 AS inserted" in sql
+
+    def test_save_many_commits_once_per_batch(self):
+        data = load_test_data('candidate_complete.json')
+        candidates = [Candidate(**data) for _ in range(5)]
+        session = FakeSession()
+
+        results = CandidateRepository(session).save_many(candidates, batch_size=2)
+
+        assert session.commits == 3
+        assert [result.inserted for result in results] == [2, 2, 1]
+        assert [result.batch_number for result in results] == [1, 2, 3]
+
+    def test_save_many_keeps_last_version_of_duplicate_ids(self):
+        data = load_test_data('candidate_complete.json')
+        first = Candidate(**data)
+        second = first.model_copy(update={"full_name": "Johnny Doe"})
+        session = FakeSession()
+
+        results = CandidateRepository(session).save_many([first, second])
+
+        params = session.statements[0].compile(dialect=postgresql.dialect()).params
+        assert results[0].total == 1
+        assert params["data_m0"]["full_name"] == "Johnny Doe"
+
+    def test_iter_by_skills_streams_with_server_side_cursor(self):
+        data = load_test_data('candidate_complete.json')
+        session = StreamingSession([data, data])
+
+        candidates = CandidateRepository(session).iter_by_skills(["Python"], fetch_size=50)
+
+        assert session.options is None  # nothing is executed until iteration starts
+        assert [c.full_name for c in candidates] == ["John Doe", "John Doe"]
+        assert session.options["yield_per"] == 50
+        assert session.closed
+
+    def test_trusted_hydration_matches_validated_hydration(self):
+        stored = model_to_dict(Candidate(**load_test_data('candidate_complete.json')))
+
+        validated = hydrate_candidates([stored])
+        trusted = hydrate_candidates([stored], trusted=True)
+
+        assert trusted == validated
+        assert trusted[0].id == validated[0].id
+
+    def test_projection_hydrates_only_requested_fields(self):
+        data = load_test_data('candidate_complete.json')
+        session = StreamingSession([])
+        session.execute = lambda statement, params: SimpleNamespace(
+            first=lambda: (Candidate(**data).id, "John Doe", ["Python"]))
+
+        candidate = CandidateRepository(session).find_by_id(None, fields=["full_name", "skills"])
+
+        assert candidate.full_name == "John Doe"
+        assert candidate.skills == ["Python"]
+        assert candidate.model_fields_set == {"id", "full_name", "skills"}
+
+    def test_projection_rejects_unknown_fields(self):
+        with pytest.raises(ValueError) as exc_info:
+            CandidateRepository(FakeSession()).find_by_id(None, fields=["salary"])
+        assert "Unknown candidate fields" in str(exc_info.value)
+
+    def test_find_by_ids_returns_input_order_with_none_for_missing(self):
+        stored = [Candidate(**load_test_data('candidate_complete.json')) for _ in range(3)]
+        session = LookupSession({c.id: model_to_dict(c) for c in stored})
+        missing = uuid4()
+
+        found = CandidateRepository(session).find_by_ids(
+            [stored[2].id, missing, stored[0].id, stored[2].id, stored[1].id], chunk_size=2)
+
+        assert [c.id if c else None for c in found] == [
+            stored[2].id, None, stored[0].id, stored[2].id, stored[1].id]
+        # Repeated ids are looked up once, in chunks of two
+        assert session.lookups == [[stored[2].id, missing], [stored[0].id, stored[1].id]]
+
+    def test_find_by_ids_binds_a_single_array_parameter(self):
+        statement, params = find_by_ids_statement([uuid4(), uuid4()], None)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "candidates.id = ANY (%(ids)s::UUID[])" in sql
+        assert len(params["ids"]) == 2
+
+    def test_finder_statements_are_built_once_per_shape(self):
+        first = page_query(skills_filter(["Python"]), 10, None, CandidateOrder.CREATED, None)
+        second = page_query(skills_filter(["Go", "SQL"]), 20, None, CandidateOrder.CREATED, None)
+
+        assert first.statement is second.statement
+        assert second.params == {"skills": ["Go", "SQL"], "limit": 21}
+        assert find_by_id_statement(uuid4(), None).statement is find_by_id_statement(uuid4(), None).statement
+        assert find_by_id_statement(uuid4(), ["skills"]).statement is not find_by_id_statement(uuid4(), None).statement
+
+    def test_next_page_binds_the_cursor_values(self):
+        last_id = uuid4()
+        cursor = encode_cursor(CandidateOrder.EXPERIENCE.value, [7, str(last_id)])
+
+        query = page_query(skills_filter(["Python"]), 10, cursor, CandidateOrder.EXPERIENCE, None)
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        assert "(candidates.experience_years, candidates.id) < (%(after_0)s, %(after_1)s::UUID)" in sql
+        assert "LIMIT %(limit)s" in sql
+        assert query.params["after_0"] == 7 and query.params["after_1"] == last_id
+
+    def test_prepared_lookup_is_prepared_once_per_connection(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        connection = PreparingConnection(model_to_dict(candidate))
+        session = SimpleNamespace(connection=lambda: connection)
+        repository = CandidateRepository(session, trusted_reads=True, prepared=True)
+
+        assert repository.find_by_id(candidate.id) == candidate
+        assert repository.find_by_id(candidate.id) == candidate
+
+        [prepare] = connection.prepared
+        assert prepare.startswith("PREPARE candidates_find_by_id (uuid) AS SELECT candidates.data")
+        assert "WHERE candidates.id = $1" in prepare
+        assert connection.executed == [
+            ("EXECUTE candidates_find_by_id(CAST(:id AS uuid))", {"id": candidate.id})
+        ] * 2
+
+    def test_iter_embeddings_reads_stored_vectors(self):
+        stored, backfill_pending = (Candidate(**{**load_test_data('candidate_complete.json'), 'id': uuid4()})
+                                    for _ in range(2))
+        backfill_pending.skills = ["Go"]
+        vectors = embed_candidates([stored, backfill_pending])
+        rows = [
+            (candidate.id, *(getattr(candidate, field) for field in EMBEDDING_FIELDS), text)
+            for candidate, text in [(stored, format_vector(vectors[0])), (backfill_pending, None)]
+        ]
+        session = StreamingSession([])
+        session.execute = lambda statement: SimpleNamespace(partitions=lambda: iter([rows]), close=session.close)
+
+        [(ids, loaded)] = list(CandidateRepository(session).iter_embeddings(fetch_size=500))
+
+        assert ids == [stored.id, backfill_pending.id]
+        assert np.allclose(loaded, vectors, atol=1e-6)
+        assert session.closed
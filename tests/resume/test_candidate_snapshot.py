@@ -0,0 +1,113 @@
+from datetime import datetime
+from uuid import uuid4
+import numpy as np
+import pytest
+from src.resume.models import Candidate, Job
+from src.resume.repository.candidate_changes import CandidateChangeBatch, ChangeWatermark
+from src.resume.repository.candidate_snapshot import (
+    CandidateSnapshot, refresh_snapshot, snapshot_candidates,
+)
+from src.resume.services.matching_service import MatchingService
+from src.resume.services.similarity_index import CandidateSimilarityIndex
+from src.resume.utils.embedding import embed_candidates, format_vector, parse_vectors
+
+def make_candidates(count):
+    return [
+        Candidate(full_name=f"Candidate {i}", email=f"c{i}@example.com", phone="555-0100",
+                  education="BS in Computer Science", location=None if i % 3 else "Austin, TX",
+                  skills=[["Python", "AWS"], ["python", "Go"], []][i % 3],
+                  experience_years=i % 7, preferred_job_types=["Remote"] * (i % 2))
+        for i in range(count)
+    ]
+
+class FakeRepository:
+    """Serves prepared change batches, then an empty one"""
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.after = []
+
+    def changes_since(self, after, limit):
+        self.after.append(after)
+        return self.batches.pop(0) if self.batches else CandidateChangeBatch()
+
+def test_snapshot_round_trips_candidates(tmp_path):
+    candidates = make_candidates(10)
+
+    snapshot = snapshot_candidates(tmp_path, candidates)
+
+    assert isinstance(snapshot.ids, np.memmap)
+    assert [c.model_dump() for c in snapshot.candidates()] == [c.model_dump() for c in candidates]
+    assert snapshot.candidate(4) == candidates[4]
+    assert np.allclose(snapshot.embeddings, embed_candidates(candidates))
+
+def test_reopened_snapshot_keeps_the_watermark(tmp_path):
+    watermark = ChangeWatermark(datetime(2026, 1, 1, 12), uuid4())
+    snapshot_candidates(tmp_path, make_candidates(2), watermark)
+
+    assert CandidateSnapshot.open(tmp_path).watermark == watermark
+
+def test_rows_of_finds_ids(tmp_path):
+    candidates = make_candidates(6)
+    snapshot = snapshot_candidates(tmp_path, candidates)
+
+    assert snapshot.rows_of([candidates[5].id, uuid4(), candidates[1].id]).tolist() == [1, 5]
+
+def test_refresh_applies_upserts_and_deletes_as_a_new_generation(tmp_path):
+    candidates = make_candidates(5)
+    watermark = ChangeWatermark(datetime(2026, 1, 1, 12), uuid4())
+    first = snapshot_candidates(tmp_path, candidates, watermark)
+    changed = candidates[1].model_copy(update={"skills": ["Rust"]})
+    added = make_candidates(1)[0].model_copy(update={"id": uuid4(), "skills": ["Kotlin"]})
+    newer = ChangeWatermark(datetime(2026, 1, 1, 13), uuid4())
+    repository = FakeRepository(CandidateChangeBatch(upserted=[changed, added], deleted=[candidates[3].id],
+                                                     watermark=newer))
+
+    refreshed = refresh_snapshot(tmp_path, repository)
+
+    assert refreshed.path != first.path
+    assert refreshed.watermark == newer
+    assert {c.id for c in refreshed.candidates()} == {c.id for c in candidates if c is not candidates[3]} | {added.id}
+    assert refreshed.candidate(refreshed.row_of(changed.id)).skills == ["Rust"]
+    assert refreshed.candidate(refreshed.row_of(added.id)).skills == ["Kotlin"]
+    # Catch-up starts a margin before the watermark, then continues from each batch
+    assert repository.after[0].changed_at < watermark.changed_at
+    assert repository.after[1] == newer
+    # The generation opened before the refresh is still readable
+    assert len(first) == 5
+
+def test_refresh_without_changes_keeps_the_generation(tmp_path):
+    first = snapshot_candidates(tmp_path, make_candidates(3))
+
+    assert refresh_snapshot(tmp_path, FakeRepository()).path == first.path
+
+def test_matching_index_from_snapshot_matches_one_built_from_models(tmp_path):
+    candidates = make_candidates(50)
+    snapshot = snapshot_candidates(tmp_path, candidates)
+    from_models = MatchingService()
+    from_models.add_candidates(candidates)
+    from_snapshot = MatchingService()
+
+    assert from_snapshot.load_snapshot(snapshot) == 50
+
+    job = Job(title="Engineer", company="Acme", location="Remote", required_skills=["python", "go"],
+              min_experience=2, job_type="remote")
+    expected = [(m.candidate_id, m.score) for m in from_models.top_candidates(job, 10)]
+    assert [(m.candidate_id, m.score) for m in from_snapshot.top_candidates(job, 10)] == expected
+
+def test_similarity_index_from_snapshot_uses_stored_embeddings(tmp_path):
+    candidates = make_candidates(20)
+    snapshot = snapshot_candidates(tmp_path, candidates)
+
+    index = CandidateSimilarityIndex.from_snapshot(snapshot)
+
+    assert len(index) == 20
+    assert np.allclose(index.vector(candidates[7].id), embed_candidates([candidates[7]])[0])
+
+def test_parse_vectors_reads_pgvector_text():
+    vectors = embed_candidates(make_candidates(3))
+
+    assert np.allclose(parse_vectors([format_vector(v) for v in vectors]), vectors, atol=1e-6)
+
+def test_missing_snapshot_fails_to_open(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CandidateSnapshot.open(tmp_path)
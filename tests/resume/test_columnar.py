@@ -0,0 +1,40 @@
+import numpy as np
+from src.resume.utils.columnar import ListColumn, StringColumn, encode_lists, take_segments
+
+def test_string_column_round_trip_with_none_and_unicode():
+    values = ["Zoë", None, "", "Austin, TX"]
+    column = StringColumn.encode(values)
+
+    assert [column[row] for row in range(len(column))] == values
+    assert column.to_list() == values
+
+def test_string_column_without_none_has_no_valid_array():
+    assert StringColumn.encode(["a", "b"]).valid is None
+
+def test_take_gathers_rows_in_the_given_order():
+    column = StringColumn.encode(["alpha", "b", None, "delta"])
+
+    taken = column.take(np.array([3, 0, 2]))
+
+    assert taken.to_list() == ["delta", "alpha", None]
+
+def test_take_segments_of_no_rows():
+    offsets, values = take_segments(np.array([0, 2, 3]), np.array([1, 2, 3]), np.array([], dtype=np.int64))
+
+    assert offsets.tolist() == [0]
+    assert values.size == 0
+
+def test_string_columns_concatenate():
+    column = StringColumn.concat([StringColumn.encode(["a", "bc"]), StringColumn.encode([None, "d"])])
+
+    assert column.to_list() == ["a", "bc", None, "d"]
+
+def test_list_column_chunks_share_one_vocabulary():
+    codes = {}
+    parts = [encode_lists([["Python", "Go"], []], codes), encode_lists([["Go", "Rust"]], codes)]
+
+    column = ListColumn.concat(parts, codes)
+
+    assert [column[row] for row in range(len(column))] == [["Python", "Go"], [], ["Go", "Rust"]]
+    assert column.terms == ["Python", "Go", "Rust"]
+    assert column.take(np.array([2]))[0] == ["Go", "Rust"]
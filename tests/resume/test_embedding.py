@@ -0,0 +1,41 @@
+import numpy as np
+from src.resume.models import Candidate
+from src.resume.utils.embedding import (
+    EMBEDDING_DIMENSIONS, embed_candidate, embed_candidates, format_vector, parse_vector,
+)
+
+def make_candidate(skills=("Python", "SQL"), education="Bachelor's in Computer Science",
+                   location="Austin, TX", experience_years=5, preferred_job_types=("Remote",)):
+    return Candidate(full_name="Jane Doe", email="jane@example.com", phone="555-0100",
+                     skills=list(skills), education=education, location=location,
+                     experience_years=experience_years, preferred_job_types=list(preferred_job_types))
+
+def test_embeddings_are_unit_length_and_deterministic():
+    vectors = embed_candidates([make_candidate(), make_candidate(skills=["Java"])])
+
+    assert vectors.shape == (2, EMBEDDING_DIMENSIONS)
+    assert vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert np.array_equal(vectors[0], embed_candidate(make_candidate()))
+
+def test_case_and_order_of_skills_do_not_matter():
+    assert np.allclose(embed_candidate(make_candidate(skills=["Python", "SQL"])),
+                       embed_candidate(make_candidate(skills=[" sql", "PYTHON"])))
+
+def test_shared_attributes_raise_similarity():
+    base = embed_candidate(make_candidate())
+    same_skills = embed_candidate(make_candidate(location="Boston, MA"))
+    other_skills = embed_candidate(make_candidate(skills=["Java", "Scrum"]))
+    close_experience = embed_candidate(make_candidate(experience_years=6))
+    far_experience = embed_candidate(make_candidate(experience_years=15))
+
+    assert base @ same_skills > base @ other_skills
+    assert base @ close_experience > base @ far_experience
+
+def test_vector_text_round_trip():
+    vector = embed_candidate(make_candidate())
+
+    text = format_vector(vector)
+
+    assert text.startswith("[") and text.count(",") == EMBEDDING_DIMENSIONS - 1
+    assert np.allclose(parse_vector(text), vector, atol=1e-6)
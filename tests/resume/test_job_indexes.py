@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import select
+from src.resume.models import Candidate
+from src.resume.repository.db_models import JobRecord
+from src.resume.repository.job_queries import (
+    job_type, min_experience, qualifying_filter, required_skills_subset_filter,
+)
+from tests.resume.index_assertions import assert_uses_index, explain_session, index_exists, plan_for
+
+session = pytest.fixture(explain_session, name="session")
+
+def candidate(**overrides):
+    values = dict(full_name="Jane Doe", email="jane@example.com", phone="555-0100",
+                  education="BSc", skills=["Python", "SQL"], experience_years=4,
+                  preferred_job_types=["Remote"])
+    values.update(overrides)
+    return Candidate(**values)
+
+class TestJobIndexes:
+    def test_skill_subset_uses_gin_and_skill_count_indexes(self, session):
+        statement = select(JobRecord.id).where(required_skills_subset_filter(["Python", "SQL"]))
+        assert_uses_index(session, statement, "ix_jobs_required_skills")
+        assert_uses_index(session, statement, "ix_jobs_required_skill_count")
+
+    def test_reverse_search_is_served_by_an_index(self, session):
+        if not index_exists(session, "ix_jobs_required_skills"):
+            pytest.skip("Job indexes not present, run `alembic upgrade head`")
+        # Which index wins depends on the data; any of them beats a scan
+        plan = plan_for(session, select(JobRecord.id).where(qualifying_filter(candidate())))
+        assert "ix_jobs_" in plan and "Seq Scan" not in plan, plan
+
+    def test_min_experience_uses_expression_index(self, session):
+        statement = select(JobRecord.id).where(min_experience <= 3)
+        assert_uses_index(session, statement, "ix_jobs_min_experience")
+
+    def test_job_type_uses_expression_index(self, session):
+        statement = select(JobRecord.id).where(job_type == "Remote")
+        assert_uses_index(session, statement, "ix_jobs_job_type")
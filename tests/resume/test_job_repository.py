@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.resume.models import Candidate, Job
+from src.resume.repository.job_queries import hydrate_jobs, qualifying_filter
+from src.resume.repository.job_repository import JobRepository
+from src.resume.utils.json_utils import model_to_dict
+
+def load_test_data(filename):
+    data_dir = Path(__file__).parent.parent / 'data' / 'candidates'
+    with open(data_dir / filename, 'r') as f:
+        return json.load(f)
+
+class FakeSession:
+    """Records executed statements and answers upserts as if every row were new"""
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        count = sum(1 for key in params if key.startswith("id_m"))
+        return SimpleNamespace(all=lambda: [SimpleNamespace(inserted=True)] * count)
+
+    def commit(self):
+        self.commits += 1
+
+def compiled(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+class TestJobRepository:
+    def test_save_many_upserts_into_jobs(self):
+        jobs = [Job(**{**load_test_data('job_complete.json'), 'id': uuid4()}) for _ in range(3)]
+        session = FakeSession()
+
+        results = JobRepository(session).save_many(jobs, batch_size=2)
+
+        sql = compiled(session.statements[0])
+        assert sql.startswith("INSERT INTO jobs (id, data)")
+        assert "ON CONFLICT (id) DO UPDATE SET updated_at = now(), data = excluded.data" in sql
+        assert [result.inserted for result in results] == [2, 1]
+        assert session.commits == 2
+
+    def test_qualifying_filter_matches_index_expressions(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+
+        sql = compiled(qualifying_filter(candidate))
+
+        assert "(jobs.data -> 'required_skills') ?| ARRAY[" in sql
+        assert "(jobs.data -> 'required_skills') <@" in sql
+        assert "jsonb_array_length((jobs.data -> 'required_skills')) =" in sql
+        assert "CAST((jobs.data ->> 'min_experience') AS INTEGER) <=" in sql
+        assert "(jobs.data ->> 'job_type') IN" in sql
+
+    def test_candidate_without_preferences_accepts_any_job_type(self):
+        candidate = Candidate(**load_test_data('candidate_required_only.json'))
+
+        sql = compiled(qualifying_filter(candidate))
+
+        assert "job_type" not in sql
+        # No skills: only jobs without requirements qualify
+        assert "?|" not in sql
+
+    def test_trusted_hydration_matches_validated_hydration(self):
+        job = Job(**load_test_data('job_complete.json'))
+        payloads = [model_to_dict(job)]
+
+        assert hydrate_jobs(payloads, trusted=True) == hydrate_jobs(payloads) == [job]
+
+    def test_find_for_candidate_pages_with_a_cursor(self):
+        candidate = Candidate(**load_test_data('candidate_complete.json'))
+        jobs = [Job(**{**load_test_data('job_complete.json'), 'id': uuid4()}) for _ in range(3)]
+        created = datetime(2025, 3, 1)
+        rows = [(model_to_dict(job), created + timedelta(days=i), job.id) for i, job in enumerate(jobs)]
+        # What PostgreSQL returns: limit + 1 rows, then the rows after the cursor (jobs[1])
+        responses = [rows[:3], rows[2:]]
+        statements = []
+        session = SimpleNamespace(execute=lambda statement: (
+            statements.append(statement) or SimpleNamespace(all=lambda: responses[len(statements) - 1])
+        ))
+        repository = JobRepository(session)
+
+        first = repository.find_for_candidate(candidate, limit=2)
+        last = repository.find_for_candidate(candidate, limit=2, after=first.next_cursor)
+
+        assert first.items == jobs[:2] and first.has_more
+        assert last.items == [jobs[2]] and not last.has_more
+        sql = compiled(statements[1])
+        assert "(jobs.created_at, jobs.id) > (" in sql
+        assert sql.endswith("ORDER BY jobs.created_at, jobs.id \n LIMIT %(param_9)s")
+        params = statements[1].compile().params.values()
+        assert created + timedelta(days=1) in params and jobs[1].id in params
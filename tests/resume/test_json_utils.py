@@ -0,0 +1,120 @@
+import json
+import uuid
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, field_serializer
+from src.resume.models import Candidate, Education, Experience, Job, Resume
+from src.resume.utils.json_utils import (
+    JsonEncoder, dumps, model_to_dict, models_to_dicts, dicts_to_models
+)
+
+def load_test_data(filename):
+    data_dir = Path(__file__).parent.parent / 'data' / 'candidates'
+    with open(data_dir / filename, 'r') as f:
+        return json.load(f)
+
+def candidates():
+    return [
+        Candidate(**load_test_data('candidate_complete.json')),
+        Candidate(**load_test_data('candidate_required_only.json')),
+    ]
+
+def resume(last_updated):
+    return Resume(
+        id=uuid.uuid4(), candidate_id=uuid.uuid4(), raw_text="Python developer",
+        structured_experience=[Experience(company="Acme", role="Engineer", years=3)],
+        structured_education=[Education(degree="BSc", university="MIT", year=2015)],
+        extracted_skills=["Python"], last_updated=last_updated,
+    )
+
+class TestJsonUtils:
+    def test_models_to_dicts_matches_model_to_dict(self):
+        models = candidates()
+        assert models_to_dicts(models) == [model_to_dict(model) for model in models]
+
+    def test_models_to_dicts_handles_jobs(self):
+        job = Job(**load_test_data('job_complete.json'))
+        assert models_to_dicts([job]) == [model_to_dict(job)]
+
+    def test_dicts_to_models_round_trip(self):
+        models = candidates()
+        assert dicts_to_models(models_to_dicts(models), Candidate) == models
+
+    def test_empty_batches(self):
+        assert models_to_dicts([]) == []
+        assert dicts_to_models([], Candidate) == []
+
+    def test_dumps_matches_encoder_output_for_models(self):
+        models = candidates()
+        assert dumps(models) == json.dumps(models, cls=JsonEncoder)
+        assert dumps(models[0]) == json.dumps(models[0], cls=JsonEncoder)
+
+    def test_dumps_matches_encoder_output_for_plain_values(self):
+        value = {
+            "id": uuid.uuid4(),
+            "at": datetime(2025, 3, 1, 23, 6, 4, 562441),
+            "on": date(2025, 3, 1),
+            "items": [1, "two", None],
+            "candidate": candidates()[0],
+        }
+        assert dumps(value) == json.dumps(value, cls=JsonEncoder)
+
+    def test_dumps_matches_encoder_output_across_chunks(self):
+        models = candidates() * 300
+        assert dumps(models) == json.dumps(models, cls=JsonEncoder)
+
+    def test_dumps_matches_encoder_output_for_aware_datetimes(self):
+        # pydantic's JSON mode would write UTC as 'Z' instead of '+00:00'
+        resumes = [
+            resume(datetime(2025, 1, 1, tzinfo=timezone.utc)),
+            resume(datetime(2025, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=2)))),
+            resume(datetime(2025, 1, 1)),
+        ]
+        assert dumps(resumes[0]) == json.dumps(resumes[0], cls=JsonEncoder)
+        assert dumps(resumes) == json.dumps(resumes, cls=JsonEncoder)
+        assert models_to_dicts(resumes)[0]["last_updated"] == "2025-01-01T00:00:00+00:00"
+
+    def test_dumps_matches_encoder_output_for_nested_aware_datetimes(self):
+        class Event(BaseModel):
+            at: Optional[datetime] = None
+
+        class Timeline(BaseModel):
+            first: Event
+            events: List[Event]
+
+        utc = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        timeline = Timeline(first=Event(at=utc), events=[Event(), Event(at=utc)])
+        assert dumps(timeline) == json.dumps(timeline, cls=JsonEncoder)
+        assert dumps([timeline]) == json.dumps([timeline], cls=JsonEncoder)
+
+    def test_dumps_matches_encoder_output_for_datetime_containers(self):
+        class Schedule(BaseModel):
+            slots: List[datetime]
+            by_name: Dict[str, Optional[datetime]]
+            window: Tuple[datetime, int]
+            maybe: datetime | None = None
+
+        utc = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        schedule = Schedule(slots=[utc, datetime(2025, 1, 2)], by_name={"a": utc, "b": None},
+                            window=(utc, 3), maybe=utc)
+        assert dumps(schedule) == json.dumps(schedule, cls=JsonEncoder)
+        assert dumps([schedule]) == json.dumps([schedule], cls=JsonEncoder)
+        assert models_to_dicts([schedule])[0]["slots"][0] == "2025-01-01T00:00:00+00:00"
+
+    def test_models_with_untyped_or_custom_serialized_values_use_the_encoder(self):
+        class Loose(BaseModel):
+            value: Any
+
+        class Custom(BaseModel):
+            at: datetime
+
+            @field_serializer("at")
+            def serialize_at(self, at):
+                return at.strftime("%Y")
+
+        utc = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for model in (Loose(value={"at": utc}), Custom(at=utc)):
+            assert dumps(model) == json.dumps(model, cls=JsonEncoder)
+            assert dumps([model]) == json.dumps([model], cls=JsonEncoder)
+            assert models_to_dicts([model]) == [json.loads(json.dumps(model, cls=JsonEncoder))]
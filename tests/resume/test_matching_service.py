@@ -0,0 +1,102 @@
+from uuid import uuid4
+from src.resume.models import Candidate, Job
+from src.resume.services.matching_service import (
+    CandidateSkillIndex, MatchingService, MATCHING_FIELDS,
+)
+
+def make_candidate(skills, experience_years=5, preferred_job_types=()):
+    return Candidate.model_construct(
+        id=uuid4(), skills=list(skills), experience_years=experience_years,
+        preferred_job_types=list(preferred_job_types),
+    )
+
+def make_job(required_skills, min_experience=0, job_type="Full-time"):
+    return Job(title="Engineer", company="Acme", location="Remote",
+               required_skills=list(required_skills), min_experience=min_experience,
+               job_type=job_type)
+
+def test_ranks_by_share_of_required_skills():
+    best = make_candidate(["Python", "SQL", "Docker"])
+    partial = make_candidate(["python"])
+    unrelated = make_candidate(["Java"])
+    index = CandidateSkillIndex()
+    index.add_many([unrelated, partial, best])
+
+    matches = index.top_k(make_job(["Python", "SQL"]), k=10)
+
+    assert [m.candidate_id for m in matches] == [best.id, partial.id]
+    assert [m.score for m in matches] == [1.0, 0.5]
+    assert matches[1].matched_skills == 1
+
+def test_filters_on_experience_and_job_type():
+    senior = make_candidate(["Python"], experience_years=8, preferred_job_types=["Contract"])
+    junior = make_candidate(["Python"], experience_years=1)
+    wrong_type = make_candidate(["Python"], experience_years=8, preferred_job_types=["Part-time"])
+    flexible = make_candidate(["Python"], experience_years=8)
+    index = CandidateSkillIndex()
+    index.add_many([senior, junior, wrong_type, flexible])
+
+    matches = index.top_k(make_job(["Python"], min_experience=5, job_type="contract"))
+
+    assert {m.candidate_id for m in matches} == {senior.id, flexible.id}
+
+def test_top_k_limits_and_orders_results():
+    candidates = [make_candidate([f"s{i}" for i in range(n)]) for n in range(1, 8)]
+    index = CandidateSkillIndex(capacity=2)  # forces the arrays to grow
+    index.add_many(candidates)
+
+    matches = index.top_k(make_job([f"s{i}" for i in range(7)]), k=3)
+
+    assert [m.matched_skills for m in matches] == [7, 6, 5]
+
+def test_many_skills_span_several_words():
+    skills = [f"skill-{i}" for i in range(150)]
+    candidate = make_candidate(skills[100:])
+    index = CandidateSkillIndex()
+    index.add_many([make_candidate(skills[:100]), candidate])
+
+    matches = index.top_k(make_job(skills[120:140]), k=1)
+
+    assert matches[0].candidate_id == candidate.id
+    assert matches[0].score == 1.0
+
+def test_update_and_remove():
+    candidate = make_candidate(["Go"])
+    index = CandidateSkillIndex()
+    index.add_many([candidate])
+
+    index.add_many([candidate.model_copy(update={"skills": ["Rust"]})])
+    assert index.top_k(make_job(["Go"])) == []
+    assert len(index.top_k(make_job(["Rust"]))) == 1
+
+    assert index.remove(candidate.id) is True
+    assert index.remove(candidate.id) is False
+    assert index.top_k(make_job(["Rust"])) == []
+    assert len(index) == 0
+
+def test_job_without_required_skills_matches_on_filters():
+    index = CandidateSkillIndex()
+    index.add_many([make_candidate([], experience_years=2), make_candidate(["C"], experience_years=9)])
+
+    matches = index.top_k(make_job([], min_experience=3))
+
+    assert len(matches) == 1
+    assert matches[0].score == 1.0
+
+def test_rebuild_streams_a_projection_from_the_repository():
+    candidates = [make_candidate(["SQL"]) for _ in range(5)]
+
+    class Repository:
+        def iter_all(self, fetch_size, fields):
+            self.fields = fields
+            return iter(candidates)
+
+    repository = Repository()
+    service = MatchingService(repository)
+
+    assert service.rebuild(fetch_size=2) == 5
+    assert repository.fields == MATCHING_FIELDS
+    assert len(service.top_candidates(make_job(["sql"]), k=10)) == 5
+
+def test_empty_index_returns_no_matches():
+    assert CandidateSkillIndex().top_k(make_job(["Python"])) == []
@@ -0,0 +1,34 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from src.resume.repository.pagination import Page, encode_cursor, decode_cursor
+
+class TestPagination:
+    def test_cursor_round_trip(self):
+        created_at = datetime(2025, 3, 1, 23, 6, 4, 562441)
+        candidate_id = uuid4()
+
+        cursor = encode_cursor("created", [created_at, candidate_id])
+
+        assert decode_cursor(cursor, "created", [datetime.fromisoformat, type(candidate_id)]) \
+            == [created_at, candidate_id]
+
+    def test_cursor_for_other_order_is_rejected(self):
+        cursor = encode_cursor("experience", [5, uuid4()])
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "created", [datetime.fromisoformat, str])
+
+    def test_garbage_cursor_is_rejected(self):
+        with pytest.raises(ValueError) as exc_info:
+            decode_cursor("not-a-cursor", "created", [str, str])
+        assert "Invalid pagination cursor" in str(exc_info.value)
+
+    def test_page_behaves_like_its_items(self):
+        page = Page(items=["a", "b"], next_cursor="abc")
+
+        assert len(page) == 2
+        assert page[0] == "a"
+        assert list(page) == ["a", "b"]
+        assert page.has_more
+        assert not Page(items=["a"]).has_more
@@ -0,0 +1,17 @@
+import pytest
+from sqlalchemy import select
+from src.resume.repository.db_models import ResumeRecord
+from src.resume.repository.resume_queries import matches, text_query
+from tests.resume.index_assertions import assert_uses_index, explain_session
+
+session = pytest.fixture(explain_session, name="session")
+
+class TestResumeIndexes:
+    def test_text_search_uses_gin_index(self, session):
+        statement = select(ResumeRecord.id).where(matches(text_query('"machine learning" python -java')))
+        assert_uses_index(session, statement, "ix_resumes_search_vector")
+
+    def test_candidate_lookup_uses_index(self, session):
+        statement = select(ResumeRecord.id).where(
+            ResumeRecord.candidate_id == "123e4567-e89b-12d3-a456-426614174000")
+        assert_uses_index(session, statement, "ix_resumes_candidate_id")
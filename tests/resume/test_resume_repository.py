@@ -0,0 +1,76 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from sqlalchemy.dialects import postgresql
+from src.resume.models import Resume
+from src.resume.repository.resume_queries import search_hits, search_statement
+from src.resume.repository.resume_repository import ResumeRepository
+from src.resume.utils.json_utils import model_to_dict
+
+def resume(**overrides):
+    values = dict(id=uuid4(), candidate_id=uuid4(), raw_text="Led a team building data pipelines in Python",
+                  structured_experience=[{"company": "Acme", "role": "Engineer", "years": 2.5}],
+                  structured_education=[{"degree": "BSc", "university": "MIT", "year": 2015}],
+                  extracted_skills=["Python"], last_updated=datetime(2026, 1, 1))
+    values.update(overrides)
+    return Resume(**values)
+
+def compiled(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+class FakeSession:
+    """Answers every query with the given rows"""
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+class TestSearchStatement:
+    def test_headline_is_computed_outside_the_limited_page(self):
+        sql = compiled(search_statement("python", 10, None, highlight=True).statement)
+
+        inner, outer = sql.index("(SELECT"), sql.index(") AS page")
+        assert "ts_headline" not in sql[inner:outer]
+        assert sql.startswith("SELECT page.data, page.rank, page.id, ts_headline('english'::regconfig")
+        assert "resumes.search_vector @@ websearch_to_tsquery('english'::regconfig, %(search_text)s)" in sql
+        assert "ORDER BY ts_rank(resumes.search_vector" in sql
+
+    def test_without_highlight_no_headline_is_selected(self):
+        sql = compiled(search_statement("python", 10, None, highlight=False).statement)
+        assert "ts_headline" not in sql
+
+    def test_next_page_seeks_past_the_last_rank_and_id(self):
+        rows = [(model_to_dict(resume()), rank, uuid4(), "snippet") for rank in (0.9, 0.5, 0.5)]
+        query = search_statement("python", 2, None, highlight=True)
+
+        hits, cursor = search_hits(query, rows)
+
+        assert [hit.rank for hit in hits] == [0.9, 0.5]
+        next_sql = compiled(search_statement("python", 2, cursor, highlight=True).statement)
+        assert "(ts_rank(resumes.search_vector" in next_sql
+        assert "< (CAST(%(param_1)s AS REAL), %(param_2)s::UUID)" in next_sql
+
+    def test_last_page_has_no_cursor(self):
+        rows = [(model_to_dict(resume()), 0.5, uuid4(), None)]
+        hits, cursor = search_hits(search_statement("python", 2, None, highlight=True), rows)
+        assert len(hits) == 1 and cursor is None
+
+    @pytest.mark.parametrize("search_text, limit", [("  ", 10), ("python", 0)])
+    def test_rejects_empty_query_and_bad_limit(self, search_text, limit):
+        with pytest.raises(ValueError):
+            search_statement(search_text, limit, None, highlight=True)
+
+class TestResumeRepository:
+    def test_search_returns_validated_hits_with_snippets(self):
+        stored = resume()
+        session = FakeSession([(model_to_dict(stored), 0.6, stored.id, "in <b>Python</b>")])
+
+        page = ResumeRepository(session).search("python")
+
+        assert page[0].resume == stored
+        assert page[0].snippet == "in <b>Python</b>"
+        assert not page.has_more
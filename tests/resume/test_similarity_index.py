@@ -0,0 +1,110 @@
+from uuid import uuid4
+import numpy as np
+import pytest
+from src.resume.models import Candidate
+from src.resume.services.candidate_service import CandidateService
+from src.resume.services.similarity_index import CandidateSimilarityIndex, IVFIndex
+from src.resume.utils.embedding import embed_candidates
+
+def unit_vectors(count, dimensions=16, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(count, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def brute_force(vectors, query, k):
+    return list(np.argsort(-(vectors @ query), kind="stable")[:k])
+
+def test_untrained_index_is_exact():
+    vectors = unit_vectors(200)
+    ids = [uuid4() for _ in range(200)]
+    index = IVFIndex(dimensions=16)
+    index.add_many(ids, vectors)
+
+    results = index.search(vectors[7], k=5)
+
+    assert [r.id for r in results] == [ids[row] for row in brute_force(vectors, vectors[7], 5)]
+    assert results[0].score == pytest.approx(1.0)
+
+def test_probing_every_cluster_matches_brute_force():
+    vectors = unit_vectors(1000)
+    ids = [uuid4() for _ in range(1000)]
+    index = IVFIndex(dimensions=16, probes=1000)
+    index.add_many(ids, vectors)
+    index.train(lists=20)
+
+    for query in (3, 500, 999):
+        results = index.search(vectors[query], k=10)
+        assert [r.id for r in results] == [ids[row] for row in brute_force(vectors, vectors[query], 10)]
+
+def test_updates_moves_and_removals_after_training():
+    vectors = unit_vectors(500)
+    ids = [uuid4() for _ in range(500)]
+    index = IVFIndex(dimensions=16, probes=1000)
+    index.add_many(ids, vectors)
+    index.train(lists=10)
+
+    # Move the first vector onto the second, drop the third, add a twin of the fourth
+    index.add_many([ids[0]], vectors[1:2])
+    index.remove(ids[2])
+    twin = uuid4()
+    index.add_many([twin], vectors[3:4])
+
+    assert {r.id for r in index.search(vectors[1], k=2)} == {ids[0], ids[1]}
+    assert ids[2] not in {r.id for r in index.search(vectors[2], k=500)}
+    assert [r.id for r in index.search(vectors[3], k=2, exclude={ids[3]})][0] == twin
+    assert len(index) == 500
+
+def test_needs_training_once_large_enough_and_after_growth():
+    index = IVFIndex(dimensions=16)
+    index.add_many([uuid4() for _ in range(100)], unit_vectors(100))
+    assert not index.needs_training
+
+    index.train()
+    index.add_many([uuid4() for _ in range(301)], unit_vectors(301, seed=1))
+    assert index.needs_training
+
+class FakeRepository:
+    def __init__(self, candidates):
+        self.candidates = {candidate.id: candidate for candidate in candidates}
+        self.saved = []
+
+    def iter_embeddings(self, fetch_size):
+        # The vectors saves store in the embedding column
+        candidates = list(self.candidates.values())
+        yield [candidate.id for candidate in candidates], embed_candidates(candidates)
+
+    def find_by_id(self, id, fields=None):
+        return self.candidates.get(id)
+
+    def find_by_ids(self, ids):
+        return [self.candidates.get(id) for id in ids]
+
+    def save(self, candidate):
+        self.candidates[candidate.id] = candidate
+        self.saved.append(candidate)
+        return candidate
+
+def make_candidate(skills, location="Austin, TX"):
+    return Candidate(full_name="Jane Doe", email="jane@example.com", phone="555-0100",
+                     education="BSc", skills=skills, location=location)
+
+def test_find_similar_ranks_by_profile_and_excludes_the_candidate():
+    target = make_candidate(["Python", "SQL", "Docker"])
+    close = make_candidate(["Python", "SQL", "Docker"], location="Boston, MA")
+    far = make_candidate(["Java"], location="Boston, MA")
+    service = CandidateService(FakeRepository([target, far, close]))
+
+    similar = service.find_similar(target.id, k=2)
+
+    assert [s.candidate.id for s in similar] == [close.id, far.id]
+    assert similar[0].score > similar[1].score
+    assert service.find_similar(uuid4()) == []
+
+def test_created_candidates_are_indexed_incrementally():
+    target = make_candidate(["Python", "SQL"])
+    service = CandidateService(FakeRepository([target]),
+                               similarity_index=CandidateSimilarityIndex())
+    service.similarity_index.add_many([target])
+
+    twin = service.create_candidate(make_candidate(["Python", "SQL"]))
+
+    assert service.find_similar(target.id, k=1)[0].candidate.id == twin.id
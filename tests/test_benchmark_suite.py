@@ -0,0 +1,69 @@
+import json
+from benchmarks.suite import (
+    CASES, CaseResult, SuiteOptions, case, compare, load_results, missing, regressions,
+    results_document, run_cases, skipped, write_results,
+)
+
+def test_results_round_trip_and_compare_with_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    baseline = [CaseResult("fast", 1.0, 100), CaseResult("slow", 2.0, 100), skipped("db", "no database")]
+    write_results(str(path), results_document(baseline, SuiteOptions(rows=100)))
+
+    stored = json.loads(path.read_text())
+    assert stored["results"][0]["per_second"] == 100.0
+    assert stored["options"]["rows"] == 100
+
+    current = [CaseResult("fast", 1.1, 100), CaseResult("slow", 3.0, 100), CaseResult("db", 1.0, 1)]
+    comparisons = compare(current, load_results(str(path)))
+
+    # Skipped baseline entries cannot be compared
+    assert [c.name for c in comparisons] == ["fast", "slow"]
+    assert [c.name for c in regressions(comparisons, tolerance=0.2)] == ["slow"]
+
+def test_failures_are_not_reported_as_skipped(monkeypatch):
+    monkeypatch.setitem(CASES, "broken", None)
+
+    @case("broken")
+    def broken(options):
+        raise RuntimeError("boom")
+
+    [result] = run_cases(["broken"], SuiteOptions(), log=lambda line: None)
+
+    assert result.failed == "RuntimeError('boom')"
+    assert result.skipped is None
+
+def test_main_exits_non_zero_on_failure_or_missing_case(monkeypatch, tmp_path):
+    from benchmarks.__main__ import main
+
+    monkeypatch.setitem(CASES, "toy", None)
+    outcome = {}
+
+    @case("toy")
+    def toy(options):
+        if "error" in outcome:
+            raise outcome["error"]
+        return [CaseResult(f"toy.{name}", 1.0, 1) for name in outcome["names"]]
+
+    baseline = tmp_path / "baseline.json"
+    monkeypatch.setattr("sys.argv", ["benchmarks", "--cases", "toy", "--output", str(baseline)])
+    outcome["names"] = ["a", "b"]
+    assert main() == 0
+
+    monkeypatch.setattr("sys.argv", ["benchmarks", "--cases", "toy", "--baseline", str(baseline)])
+    outcome["names"] = ["a"]
+    assert main() == 1
+
+    outcome["error"] = RuntimeError("broken by a change")
+    assert main() == 1
+
+def test_missing_baseline_cases():
+    baseline = {
+        "fast.a": {"name": "fast.a", "seconds": 1.0},
+        "fast.b": {"name": "fast.b", "seconds": 1.0},
+        "db.find": {"name": "db.find", "seconds": 1.0},
+        "other.x": {"name": "other.x", "seconds": 1.0},
+    }
+    results = [CaseResult("fast.a", 1.0, 1), skipped("db", "database not reachable")]
+
+    # other was not selected and db was skipped as a whole
+    assert missing(results, baseline, ["fast", "db"]) == ["fast.b"]
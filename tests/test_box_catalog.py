@@ -0,0 +1,73 @@
+import random
+from src.exercises.box import Box
+from src.exercises.box_catalog import BoxCatalog
+from src.exercises.order_picker import OrderPicker
+
+def make_box(number, weight, material="Cardboard", size=10):
+    return Box(length=size, width=size, height=size, weight=weight,
+               material=material, name=f"Box {number}", number=number)
+
+def random_boxes(count, seed=7):
+    rng = random.Random(seed)
+    return [make_box(number, rng.randint(1, 20), rng.choice(["Cardboard", "cardboard", "Plastic", "Wood"]),
+                     rng.randint(1, 10))
+            for number in range(count)]
+
+def numbers(boxes):
+    return [box.number for box in boxes]
+
+def test_matches_sorting_the_list():
+    boxes = random_boxes(500)
+    catalog = BoxCatalog(boxes)
+
+    expected = sorted((box for box in boxes if box.material.lower() == "cardboard"), key=lambda box: box.weight)
+
+    # Equal weights keep the order the boxes were added in, like sorted()
+    assert numbers(catalog.sorted_by_weight("CARDBOARD")) == numbers(expected)
+    assert numbers(catalog.lightest("cardboard", 5)) == numbers(expected[:5])
+    assert numbers(catalog.lightest(None, 3)) == numbers(sorted(boxes, key=lambda box: box.weight)[:3])
+    assert catalog.find("metal") == []
+
+def test_weight_and_volume_ranges():
+    boxes = random_boxes(500)
+    catalog = BoxCatalog(boxes)
+
+    found = catalog.find("plastic", min_weight=5, max_weight=8, min_volume=100, max_volume=500)
+
+    expected = sorted((box for box in boxes
+                       if box.material == "Plastic" and 5 <= box.weight <= 8
+                       and 100 <= box.length * box.width * box.height <= 500),
+                      key=lambda box: box.weight)
+    assert found and numbers(found) == numbers(expected)
+    assert numbers(catalog.find(max_weight=1, limit=2)) == numbers(
+        [box for box in sorted(boxes, key=lambda box: box.weight) if box.weight <= 1][:2])
+
+def test_incremental_insert_and_remove_keep_indexes_sorted():
+    catalog = BoxCatalog([make_box(1, 5), make_box(2, 9, "Plastic")])
+    assert numbers(catalog.sorted_by_weight("cardboard")) == [1]
+
+    light = catalog.add(make_box(3, 1))
+    catalog.add_many([make_box(4, 5), make_box(5, 7, "Plastic")])
+    assert numbers(catalog.sorted_by_weight("cardboard")) == [3, 1, 4]
+    assert numbers(catalog.find()) == [3, 1, 4, 5, 2]
+
+    assert catalog.remove(light)
+    assert not catalog.remove(light)
+    assert numbers(catalog.sorted_by_weight("cardboard")) == [1, 4]
+    assert numbers(catalog.find()) == [1, 4, 5, 2]
+    assert len(catalog) == 4
+
+def test_order_picker_accepts_a_catalog():
+    boxes = random_boxes(200)
+    catalog = BoxCatalog(boxes)
+
+    assert OrderPicker.filter_and_sort_boxes(catalog) == OrderPicker.filter_and_sort_boxes(boxes)
+    catalog.add(make_box(999, 0))
+    assert OrderPicker.filter_and_sort_boxes_pythonic(catalog)[0].number == 999
+
+def test_order_picker_sorts_plain_lists_exactly():
+    # Distinct as ints, equal as float64: a list is still sorted like sorted()
+    boxes = [make_box(1, 2**53 + 1), make_box(2, 2**53), make_box(3, 1, "Plastic")]
+
+    assert numbers(OrderPicker.filter_and_sort_boxes(boxes)) == [2, 1]
+    assert numbers(OrderPicker.filter_and_sort_boxes_pythonic(boxes)) == [2, 1]